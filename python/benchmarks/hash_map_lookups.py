@@ -0,0 +1,60 @@
+"""
+Measures the time taken by lookups (`__getitem__`) in the hash maps, for
+integer and string keys.
+
+Run from the `python` directory with:
+
+    PYTHONPATH=. python3 benchmarks/hash_map_lookups.py [n]
+"""
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from hash_maps import HashMap, RobinHoodHashMap, int_hash
+
+
+def lookup_time(hm: Any, ks: list[Any], n_repeats: int = 5) -> float:
+    """
+    Returns the best time, over *n_repeats* runs, taken to look up all of
+    *ks* in *hm*.
+    """
+    best = float("inf")
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        for k in ks:
+            hm[k]
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    int_ks = list(range(n))
+    rng.shuffle(int_ks)
+    str_ks = [f"user:{k}" for k in int_ks]
+
+    benchmarks: list[tuple[str, Callable[[list[Any]], Any], list[Any]]] = [
+        ("dict", lambda ks: {k: k for k in ks}, int_ks),
+        ("HashMap", lambda ks: HashMap([(k, k) for k in ks]), int_ks),
+        (
+            "HashMap (int_hash)",
+            lambda ks: HashMap([(k, k) for k in ks], hash_fn=int_hash),
+            int_ks,
+        ),
+        ("RobinHoodHashMap", lambda ks: RobinHoodHashMap([(k, k) for k in ks]), int_ks),
+        ("dict", lambda ks: {k: k for k in ks}, str_ks),
+        ("HashMap", lambda ks: HashMap([(k, k) for k in ks]), str_ks),
+        ("RobinHoodHashMap", lambda ks: RobinHoodHashMap([(k, k) for k in ks]), str_ks),
+    ]
+    print(f"{'structure':<24}{'keys':<6}{'seconds':>10}")
+    for name, build, ks in benchmarks:
+        key_type = type(ks[0]).__name__
+        print(f"{name:<24}{key_type:<6}{lookup_time(build(ks), ks):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures the memory used per element by the node-based data structures.
+
+Run from the `python` directory with:
+
+    PYTHONPATH=. python3 benchmarks/node_memory.py [n]
+"""
+
+import random
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from caches import LRUCache
+from hash_maps import HashMap
+from lists import (
+    ArrayDoublyLinkedList,
+    DoublyLinkedList,
+    SinglyLinkedList,
+    UnrolledLinkedList,
+)
+from trees import BSTree, BTree, LCRSNode, RBTree
+
+
+def bytes_per_element(build: Callable[[list[int]], Any], ks: list[int]) -> float:
+    """
+    Returns the number of bytes allocated by `build(ks)` (and kept alive by
+    its result) per element of *ks*, not counting the elements themselves.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    res = build(ks)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del res
+    return (after - before) / len(ks)
+
+
+def build_lcrs(ks: list[int]) -> LCRSNode[int]:
+    root = LCRSNode(ks[0])
+    node = root
+    for k in ks[1:]:
+        node.right = LCRSNode(k)
+        node = node.right
+    return root
+
+
+def build_lru_cache(ks: list[int]) -> LRUCache[int, int]:
+    cache = LRUCache(len(ks))
+    for k in ks:
+        cache.put(k, k)
+    return cache
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ks = list(range(n))
+    shuffled = ks[:]
+    random.Random(0).shuffle(shuffled)
+
+    benchmarks: list[tuple[str, Callable[[list[int]], Any], list[int]]] = [
+        ("SinglyLinkedList", SinglyLinkedList, ks),
+        ("DoublyLinkedList", DoublyLinkedList, ks),
+        (
+            "ArrayDoublyLinkedList",
+            lambda ks: ArrayDoublyLinkedList(ks, dtype=np.int64),
+            ks,
+        ),
+        ("UnrolledLinkedList", UnrolledLinkedList, ks),
+        ("BTree", BTree, ks),
+        ("BSTree", BSTree, shuffled),
+        ("RBTree", RBTree, shuffled),
+        ("LCRSNode", build_lcrs, ks),
+        ("HashMap", lambda ks: HashMap([(k, k) for k in ks]), ks),
+        ("LRUCache", build_lru_cache, ks),
+    ]
+    print(f"{'structure':<24}{'bytes/element':>15}")
+    for name, build, xs in benchmarks:
+        print(f"{name:<24}{bytes_per_element(build, xs):>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
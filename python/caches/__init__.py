@@ -0,0 +1,4 @@
+from caches.cache import Cache as Cache
+from caches.lfu_cache import LFUCache as LFUCache
+from caches.lru_cache import LRUCache as LRUCache
+from caches.memoize import memoize as memoize
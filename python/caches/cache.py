@@ -0,0 +1,191 @@
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from option import Option
+
+
+class CacheEntry[K, V]:
+    """
+    An entry of a cache.
+
+    Parameters
+    ----------
+    k
+        The key of the entry.
+    v
+        The value of the entry.
+    expiry
+        The time (as given by the clock of the cache) at which the entry
+        expires, or `None` if it never does.
+    """
+
+    __slots__ = ("k", "v", "expiry", "freq")
+
+    def __init__(self, k: K, v: V, expiry: float | None):
+        self.k: K = k
+        self.v: V = v
+        self.expiry: float | None = expiry
+        # Number of accesses, only used by `LFUCache`.
+        self.freq: int = 1
+
+    def __repr__(self) -> str:
+        return "(" + str(self.k) + ", " + str(self.v) + ")"
+
+
+class Cache[K, V](ABC):
+    """
+    A bounded cache, the base class of `LRUCache` and `LFUCache`, which
+    differ in which entry they evict when full.
+
+    Expired entries are removed lazily, when accessed or evicted, so they
+    count in the length of the cache until then.
+
+    Parameters
+    ----------
+    capacity
+        The maximum number of entries of the cache.
+    ttl
+        (Optional) The time to live of entries, in seconds.
+
+        Defaults to `None`, meaning entries never expire.
+    clock
+        (Optional) The function giving the current time, in seconds.
+
+        Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity should be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl should be positive")
+
+        self._capacity = capacity
+        self._ttl = ttl
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of lookups which found an entry.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of lookups which found no entry, or an expired one.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        The number of entries removed to make room for new ones.
+        """
+        return self._evictions
+
+    @property
+    def expirations(self) -> int:
+        """
+        The number of expired entries removed.
+        """
+        return self._expirations
+
+    def _expiry(self, ttl: float | None) -> float | None:
+        """
+        Returns the expiry time of an entry with time to live *ttl*,
+        defaulting to the one of the cache.
+        """
+        if ttl is None:
+            ttl = self._ttl
+        if ttl is None:
+            return None
+        return self._clock() + ttl
+
+    def _is_expired(self, entry: CacheEntry[K, V]) -> bool:
+        return entry.expiry is not None and entry.expiry <= self._clock()
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def __bool__(self) -> bool:
+        return len(self) != 0
+
+    @abstractmethod
+    def get(self, k: K) -> Option[V]:
+        """
+        Returns the value of *k*, counting as an access to it.
+
+        Parameters
+        ----------
+        k
+
+        Returns
+        -------
+        `Option[V]`
+            The value of *k*, or `Option.NONE()` if not found or expired.
+        """
+
+    @abstractmethod
+    def put(self, k: K, v: V, ttl: float | None = None) -> "Cache[K, V]":
+        """
+        Sets the value of *k* to *v*, counting as an access to it, and
+        evicting an entry if the cache is full.
+
+        Parameters
+        ----------
+        k
+        v
+        ttl
+            (Optional) The time to live of the entry, in seconds.
+
+            Defaults to `None`, meaning the one of the cache.
+
+        Returns
+        -------
+        `Cache[K, V]`
+            This cache (useful for chaining operations).
+        """
+
+    @abstractmethod
+    def delete(self, k: K) -> bool:
+        """
+        Deletes the entry of *k*.
+
+        Parameters
+        ----------
+        k
+
+        Returns
+        -------
+        `bool`
+            `True` if *k* was found (even if expired), `False` otherwise.
+        """
+
+    def __getitem__(self, k) -> V:
+        v = self.get(k)
+        if v.is_none:
+            raise KeyError(f"Key {k!r} not found.")
+        return v.unwrap()
+
+    def __setitem__(self, k, v: V):
+        self.put(k, v)
+
+    def __delitem__(self, k):
+        if not self.delete(k):
+            raise KeyError(f"Key {k!r} not found.")
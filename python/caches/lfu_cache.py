@@ -0,0 +1,138 @@
+import time
+from collections.abc import Callable
+
+from option import Option
+
+from caches.cache import Cache, CacheEntry
+from hash_maps import HashMap
+from lists import DLLNode, DoublyLinkedList
+
+
+class LFUCache[K, V](Cache[K, V]):
+    """
+    A bounded cache evicting the least frequently used entry when full, the
+    least recently used one among those with the same frequency.
+
+    Entries are kept in one `DoublyLinkedList` per access frequency, from the
+    most to the least recently used, and `HashMap`s map keys to their node
+    and frequencies to their list, so that `get` and `put` take `O(1)` time.
+
+    Parameters
+    ----------
+    capacity
+    ttl
+    clock
+        See `Cache`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(capacity, ttl, clock)
+        self._map: HashMap[K, DLLNode[CacheEntry[K, V]]] = HashMap(max_size=capacity)
+        self._buckets: HashMap[int, DoublyLinkedList[CacheEntry[K, V]]] = HashMap()
+        # The lowest frequency of an entry. It may be outdated after a
+        # deletion, in which case it is recomputed by the next eviction.
+        self._min_freq = 0
+
+    def __repr__(self) -> str:
+        return repr(self._map)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def _unlink(self, node: DLLNode[CacheEntry[K, V]]) -> bool:
+        """
+        Removes *node* from the list of its frequency, deleting the list if
+        it becomes empty.
+
+        Returns whether the list was deleted.
+        """
+        freq = node.v.freq
+        bucket = self._buckets[freq]
+        bucket.delete(node)
+        if bucket:
+            return False
+        del self._buckets[freq]
+        return True
+
+    def _link(self, entry: CacheEntry[K, V]):
+        """
+        Adds *entry* at the front of the list of its frequency.
+        """
+        try:
+            bucket = self._buckets[entry.freq]
+        except KeyError:
+            bucket = DoublyLinkedList()
+            self._buckets[entry.freq] = bucket
+        self._map[entry.k] = bucket.prepend(entry)
+
+    def _touch(self, node: DLLNode[CacheEntry[K, V]]):
+        """
+        Moves the entry of *node* to the list of the next frequency.
+        """
+        entry = node.v
+        if self._unlink(node) and entry.freq == self._min_freq:
+            self._min_freq += 1
+        entry.freq += 1
+        self._link(entry)
+
+    def _remove(self, node: DLLNode[CacheEntry[K, V]]):
+        self._unlink(node)
+        del self._map[node.v.k]
+
+    def get(self, k: K) -> Option[V]:
+        try:
+            node = self._map[k]
+        except KeyError:
+            self._misses += 1
+            return Option.NONE()
+
+        entry = node.v
+        if self._is_expired(entry):
+            self._remove(node)
+            self._expirations += 1
+            self._misses += 1
+            return Option.NONE()
+
+        self._touch(node)
+        self._hits += 1
+        return Option.Some(entry.v)
+
+    def put(self, k: K, v: V, ttl: float | None = None) -> "LFUCache[K, V]":
+        expiry = self._expiry(ttl)
+        try:
+            node = self._map[k]
+        except KeyError:
+            pass
+        else:
+            entry = node.v
+            entry.v = v
+            entry.expiry = expiry
+            self._touch(node)
+            return self
+
+        if len(self._map) == self._capacity:
+            try:
+                bucket = self._buckets[self._min_freq]
+            except KeyError:
+                self._min_freq = min(self._buckets.keys())
+                bucket = self._buckets[self._min_freq]
+            self._remove(bucket.get_at_idx(-1).unwrap())
+            self._evictions += 1
+
+        self._link(CacheEntry(k, v, expiry))
+        self._min_freq = 1
+        return self
+
+    def delete(self, k: K) -> bool:
+        try:
+            node = self._map[k]
+        except KeyError:
+            return False
+
+        self._remove(node)
+        return True
@@ -0,0 +1,91 @@
+import time
+from collections.abc import Callable
+
+from option import Option
+
+from caches.cache import Cache, CacheEntry
+from hash_maps import HashMap
+from lists import DLLNode, DoublyLinkedList
+
+
+class LRUCache[K, V](Cache[K, V]):
+    """
+    A bounded cache evicting the least recently used entry when full.
+
+    Entries are kept in a `DoublyLinkedList` from the most to the least
+    recently used, and a `HashMap` maps keys to their node, so that `get`,
+    `put` and `delete` take `O(1)` time.
+
+    Parameters
+    ----------
+    capacity
+    ttl
+    clock
+        See `Cache`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(capacity, ttl, clock)
+        self._map: HashMap[K, DLLNode[CacheEntry[K, V]]] = HashMap(max_size=capacity)
+        self._lst: DoublyLinkedList[CacheEntry[K, V]] = DoublyLinkedList()
+
+    def __repr__(self) -> str:
+        return repr(self._lst)
+
+    def __len__(self) -> int:
+        return len(self._lst)
+
+    def _remove(self, node: DLLNode[CacheEntry[K, V]]):
+        self._lst.delete(node)
+        del self._map[node.v.k]
+
+    def get(self, k: K) -> Option[V]:
+        try:
+            node = self._map[k]
+        except KeyError:
+            self._misses += 1
+            return Option.NONE()
+
+        entry = node.v
+        if self._is_expired(entry):
+            self._remove(node)
+            self._expirations += 1
+            self._misses += 1
+            return Option.NONE()
+
+        self._lst.move_to_front(node)
+        self._hits += 1
+        return Option.Some(entry.v)
+
+    def put(self, k: K, v: V, ttl: float | None = None) -> "LRUCache[K, V]":
+        expiry = self._expiry(ttl)
+        try:
+            node = self._map[k]
+        except KeyError:
+            pass
+        else:
+            entry = node.v
+            entry.v = v
+            entry.expiry = expiry
+            self._lst.move_to_front(node)
+            return self
+
+        if len(self._lst) == self._capacity:
+            self._remove(self._lst.get_at_idx(-1).unwrap())
+            self._evictions += 1
+        self._map[k] = self._lst.prepend(CacheEntry(k, v, expiry))
+        return self
+
+    def delete(self, k: K) -> bool:
+        try:
+            node = self._map[k]
+        except KeyError:
+            return False
+
+        self._remove(node)
+        return True
@@ -0,0 +1,62 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from caches.cache import Cache
+from caches.lru_cache import LRUCache
+
+# Separates positional from keyword arguments in the keys of `memoize`.
+_KWARGS_MARK = object()
+
+
+def memoize[V](
+    cache: Cache[Any, V] | None = None,
+) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """
+    Returns a decorator memoizing a function with *cache*, so that it is
+    called only once for given arguments, as long as the result stays
+    in the cache.
+
+    The arguments of the function must be hashable. The cache is available
+    as the `cache` attribute of the decorated function, e.g. to read its
+    counters.
+
+    Parameters
+    ----------
+    cache
+        (Optional) The cache holding the results, keyed by arguments.
+
+        Defaults to `None`, meaning an `LRUCache` of capacity `128`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        @memoize(LFUCache(1024, ttl=60))
+        def fetch_user(user_id: int) -> dict:
+            ...
+
+        fetch_user(42)
+        print(fetch_user.cache.hits, fetch_user.cache.misses)
+    """
+
+    def decorator(fn: Callable[..., V]) -> Callable[..., V]:
+        c: Cache[Any, V] = LRUCache(128) if cache is None else cache
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> V:
+            k = args
+            if kwargs:
+                k += (_KWARGS_MARK, *sorted(kwargs.items()))
+            v = c.get(k)
+            if v.is_some:
+                return v.unwrap()
+
+            res = fn(*args, **kwargs)
+            c.put(k, res)
+            return res
+
+        wrapper.cache = c  # type: ignore
+        return wrapper
+
+    return decorator
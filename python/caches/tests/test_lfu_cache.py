@@ -0,0 +1,86 @@
+import unittest
+
+from option import Option
+
+from caches import LFUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_init(self):
+        c = LFUCache(2)
+        self.assertFalse(bool(c))
+        self.assertEqual(len(c), 0)
+        self.assertEqual(c.capacity, 2)
+
+        self.assertRaises(ValueError, lambda: LFUCache(0))
+        self.assertRaises(ValueError, lambda: LFUCache(1, ttl=-1))
+
+    def test_get_put_delete(self):
+        c = LFUCache(2)
+        c.put("a", 1).put("b", 2)
+        self.assertEqual(c.get("a"), Option.Some(1))
+        self.assertEqual(c.get("a"), Option.Some(1))
+        self.assertEqual(c.get("b"), Option.Some(2))
+        # "b" is the least frequently used.
+        c["c"] = 3
+        self.assertEqual(c.get("b"), Option.NONE())
+        # "c" is the least frequently used.
+        c["d"] = 4
+        self.assertEqual(c.get("c"), Option.NONE())
+        self.assertEqual(c["a"], 1)
+        self.assertEqual(c["d"], 4)
+
+        # Among entries with the same frequency, the least recently used
+        # one is evicted.
+        c = LFUCache(3)
+        c.put("a", 1).put("b", 2).put("c", 3)
+        c.get("b")
+        c.get("a")
+        c.get("c")
+        c.put("d", 4)
+        self.assertEqual(c.get("b"), Option.NONE())
+        self.assertEqual(c.evictions, 1)
+
+        # Deleting the least frequently used entries.
+        self.assertTrue(c.delete("d"))
+        self.assertFalse(c.delete("d"))
+        c.put("e", 5)
+        self.assertTrue(c.delete("e"))
+        c.put("f", 6)
+        c.put("g", 7)
+        self.assertEqual(len(c), 3)
+        self.assertEqual(c.get("f"), Option.NONE())
+        self.assertEqual(c["a"], 1)
+        self.assertEqual(c["c"], 3)
+        self.assertEqual(c["g"], 7)
+
+    def test_ttl(self):
+        clock = FakeClock()
+        c = LFUCache(10, ttl=10, clock=clock)
+        c.put("a", 1)
+        c.put("b", 2, ttl=30)
+        clock.t = 5
+        self.assertEqual(c["a"], 1)
+        clock.t = 10
+        self.assertEqual(c.get("a"), Option.NONE())
+        self.assertEqual(c["b"], 2)
+        self.assertEqual(len(c), 1)
+        self.assertEqual(c.expirations, 1)
+        self.assertEqual(c.hits, 2)
+        self.assertEqual(c.misses, 1)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
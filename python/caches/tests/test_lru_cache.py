@@ -0,0 +1,101 @@
+import unittest
+
+from option import Option
+
+from caches import Cache, LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_init(self):
+        c = LRUCache(2)
+        self.assertFalse(bool(c))
+        self.assertEqual(len(c), 0)
+        self.assertEqual(c.capacity, 2)
+
+        self.assertRaises(ValueError, lambda: LRUCache(0))
+        self.assertRaises(ValueError, lambda: LRUCache(1, ttl=0))
+
+        class IncompleteCache(Cache):
+            def __len__(self) -> int:
+                return 0
+
+        # `get`, `put` and `delete` are abstract.
+        self.assertRaises(TypeError, lambda: Cache(1))
+        self.assertRaises(TypeError, lambda: IncompleteCache(1))
+
+    def test_get_put_delete(self):
+        c = LRUCache(2)
+        c.put("a", 1).put("b", 2)
+        self.assertEqual(c.get("a"), Option.Some(1))
+        # "b" is the least recently used.
+        c["c"] = 3
+        self.assertEqual(len(c), 2)
+        self.assertEqual(c.get("b"), Option.NONE())
+        self.assertEqual(c["a"], 1)
+        self.assertEqual(c["c"], 3)
+        self.assertRaises(KeyError, lambda: c["b"])
+
+        # Updating counts as a use.
+        c["a"] = 10
+        c["d"] = 4
+        self.assertEqual(c.get("c"), Option.NONE())
+        self.assertEqual(c["a"], 10)
+
+        self.assertTrue(c.delete("a"))
+        self.assertFalse(c.delete("a"))
+        with self.assertRaises(KeyError):
+            del c["a"]
+        self.assertEqual(len(c), 1)
+
+        self.assertEqual(c.hits, 4)
+        self.assertEqual(c.misses, 3)
+        self.assertEqual(c.evictions, 2)
+
+    def test_hits_relink_nodes(self):
+        c = LRUCache(3)
+        c.put("a", 1).put("b", 2).put("c", 3)
+        node = c._map["a"]
+        c.get("a")
+        self.assertIs(c._lst.get_at_idx(0).unwrap(), node)
+        c.get("b")
+        c["a"] = 10
+        self.assertIs(c._map["a"], node)
+        self.assertIs(c._lst.get_at_idx(0).unwrap(), node)
+        self.assertEqual([e.k for e in c._lst], ["a", "b", "c"])
+
+    def test_ttl(self):
+        clock = FakeClock()
+        c = LRUCache(10, ttl=10, clock=clock)
+        c.put("a", 1)
+        c.put("b", 2, ttl=30)
+        clock.t = 5
+        self.assertEqual(c["a"], 1)
+        clock.t = 10
+        self.assertEqual(c.get("a"), Option.NONE())
+        self.assertEqual(c["b"], 2)
+        self.assertEqual(len(c), 1)
+        self.assertEqual(c.expirations, 1)
+
+        # Putting again renews the time to live.
+        clock.t = 25
+        c["b"] = 3
+        clock.t = 34
+        self.assertEqual(c["b"], 3)
+        clock.t = 35
+        self.assertRaises(KeyError, lambda: c["b"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
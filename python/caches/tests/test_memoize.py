@@ -0,0 +1,48 @@
+import unittest
+
+from caches import LFUCache, LRUCache, memoize
+
+
+class TestMemoize(unittest.TestCase):
+    def test_memoize(self):
+        for cache in [LRUCache(2), LFUCache(2)]:
+            n_calls = 0
+
+            @memoize(cache)
+            def add(a: int, b: int = 0) -> int:
+                nonlocal n_calls
+                n_calls += 1
+                return a + b
+
+            self.assertEqual(add(1, 2), 3)
+            self.assertEqual(add(1, 2), 3)
+            self.assertEqual(n_calls, 1)
+            self.assertEqual(add(1, b=2), 3)
+            self.assertEqual(add(1, b=2), 3)
+            self.assertEqual(n_calls, 2)
+            self.assertIs(add.cache, cache)  # type: ignore
+            self.assertEqual(cache.hits, 2)
+            self.assertEqual(cache.misses, 2)
+
+            # Bounded by the capacity of the cache.
+            add(3)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.evictions, 1)
+
+    def test_default_cache(self):
+        @memoize()
+        def square(x: int) -> int:
+            return x * x
+
+        for x in range(200):
+            self.assertEqual(square(x), x * x)
+        self.assertEqual(len(square.cache), 128)  # type: ignore
+        self.assertEqual(square.__name__, "square")
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
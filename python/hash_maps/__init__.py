@@ -1 +1,7 @@
+from hash_maps.concurrent_hash_map import ConcurrentHashMap as ConcurrentHashMap
+from hash_maps.disk_hash_map import DiskHashMap as DiskHashMap
 from hash_maps.hash_map import HashMap as HashMap
+from hash_maps.hash_map import fnv1a_hash as fnv1a_hash
+from hash_maps.hash_map import int_hash as int_hash
+from hash_maps.hash_map import py_hash as py_hash
+from hash_maps.robin_hood_hash_map import RobinHoodHashMap as RobinHoodHashMap
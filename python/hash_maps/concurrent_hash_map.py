@@ -0,0 +1,222 @@
+import operator
+import threading
+from collections.abc import Callable, Iterator
+
+from hash_maps.hash_map import HashMap, py_hash
+
+_MASK64 = (1 << 64) - 1
+# 2^64 divided by the golden ratio, for Fibonacci hashing.
+_FIBONACCI = 0x9E3779B97F4A7C15
+
+
+class ConcurrentHashMap[K, T]:
+    """
+    A thread-safe hash map, whose keys are sharded across independent
+    `HashMap` segments, each guarded by its own lock.
+
+    Threads only contend when accessing keys of the same segment, rather
+    than on a single lock around the whole map. Keys are hashed once, the
+    hash choosing both the segment and the slot in the segment.
+
+    Iterating over this hash map iterates over a snapshot of each segment,
+    so it never raises because of concurrent modifications, but the
+    segments may be snapshotted at different times.
+
+    Parameters
+    ----------
+    items
+        (Optional) A list of initial items to insert into this hash map.
+
+        Defaults to `[]`.
+    n_segments
+        (Optional) The number of segments, rounded up to a power of two.
+        More segments allow more concurrent writers.
+
+        Defaults to `16`.
+    hash_fn
+        (Optional) See `HashMap`. All the bits of the hash choose the
+        segment, so a hash only setting its low bits is fine.
+
+        Defaults to `py_hash`.
+    seed
+        (Optional) See `HashMap`.
+
+        Defaults to `0`.
+    eq_fn
+        (Optional) See `HashMap`.
+
+        Defaults to `operator.eq`.
+    """
+
+    def __init__(
+        self,
+        items: list[tuple[K, T]] = [],
+        n_segments: int = 16,
+        hash_fn: Callable[[K, int], int] = py_hash,
+        seed: int = 0,
+        eq_fn: Callable[[K, K], bool] = operator.eq,
+    ):
+        if n_segments < 1:
+            raise ValueError("n_segments should be at least 1")
+
+        n = 1
+        while n < n_segments:
+            n *= 2
+        self._hash_fn = hash_fn
+        self._seed = seed
+        self._segments: list[HashMap[K, T]] = [
+            HashMap(hash_fn=hash_fn, seed=seed, eq_fn=eq_fn) for _ in range(n)
+        ]
+        self._locks = [threading.Lock() for _ in range(n)]
+        # The segment is chosen from the top log2(n) bits of the mixed hash.
+        self._shift = 64 - (n.bit_length() - 1)
+        for k, v in items:
+            self[k] = v
+
+    def _hash(self, k: K) -> int:
+        return self._hash_fn(k, self._seed)
+
+    def _segment_idx(self, h: int) -> int:
+        # Segments place keys using the low bits of their hash, and a custom
+        # hash may only have low bits (e.g. small integers), so the segment
+        # is chosen from the top bits of the hash multiplied by an odd
+        # constant, which depend on all of its bits.
+        return ((h * _FIBONACCI) & _MASK64) >> self._shift
+
+    def __repr__(self) -> str:
+        s = "{"
+        is_first_item = True
+        for k, v in self.items():
+            if is_first_item:
+                s += "\n"
+                is_first_item = False
+            else:
+                s += ",\n"
+            s += "  " + repr(k) + ": " + str(v)
+
+        if is_first_item:
+            s += "}"
+        else:
+            s += "\n}"
+
+        return s
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConcurrentHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+
+        for k, v in self.items():
+            try:
+                if other[k] != v:
+                    return False
+            except KeyError:
+                return False
+
+        return True
+
+    def __iter__(self) -> Iterator[tuple[K, T]]:
+        return self.items()
+
+    def __bool__(self) -> bool:
+        return len(self) != 0
+
+    def __getitem__(self, k) -> T:
+        h = self._hash(k)
+        i = self._segment_idx(h)
+        segment = self._segments[i]
+        with self._locks[i]:
+            idx = segment._find(k, h)
+            if idx == -1:
+                raise KeyError(f"Key {k!r} not found.")
+            return segment._items[idx].v  # type: ignore
+
+    def __setitem__(self, k, v: T):
+        h = self._hash(k)
+        i = self._segment_idx(h)
+        with self._locks[i]:
+            self._segments[i]._set(k, v, h)
+
+    def __delitem__(self, k):
+        h = self._hash(k)
+        i = self._segment_idx(h)
+        with self._locks[i]:
+            if self._segments[i]._delete(k, h) == -1:
+                raise KeyError(f"Key {k!r} not found.")
+
+    def get_or_set(self, k: K, default: T) -> T:
+        """
+        Atomically gets the value of *k*, setting it to *default* first if
+        *k* is not in this hash map.
+
+        Parameters
+        ----------
+        k
+        default
+
+        Returns
+        -------
+        `T`
+            The value of *k*.
+        """
+        return self.compute_if_absent(k, lambda _: default)
+
+    def compute_if_absent(self, k: K, fn: Callable[[K], T]) -> T:
+        """
+        Atomically gets the value of *k*, setting it to `fn(k)` first if *k*
+        is not in this hash map.
+
+        *fn* is called at most once, while holding the lock of the segment of
+        *k*, so it should be fast and must not access this hash map.
+
+        Parameters
+        ----------
+        k
+        fn
+
+        Returns
+        -------
+        `T`
+            The value of *k*.
+        """
+        h = self._hash(k)
+        i = self._segment_idx(h)
+        segment = self._segments[i]
+        with self._locks[i]:
+            idx = segment._find(k, h)
+            if idx != -1:
+                return segment._items[idx].v  # type: ignore
+            v = fn(k)
+            segment._set(k, v, h)
+            return v
+
+    def items(self) -> Iterator[tuple[K, T]]:
+        """
+        Yields the `(key, value)` pairs of this hash map, from a snapshot of
+        each segment (see `HashMap.snapshot`), taken holding the lock of the
+        segment.
+        """
+        for segment, lock in zip(self._segments, self._locks):
+            # The lock is released before yielding, so that the caller does
+            # not block writers to the segment.
+            with lock:
+                pairs = segment.snapshot()
+            yield from pairs
+
+    def keys(self) -> Iterator[K]:
+        """
+        Yields the keys of this hash map. See `items`.
+        """
+        for k, _ in self.items():
+            yield k
+
+    def values(self) -> Iterator[T]:
+        """
+        Yields the values of this hash map. See `items`.
+        """
+        for _, v in self.items():
+            yield v
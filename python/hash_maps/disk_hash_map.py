@@ -0,0 +1,416 @@
+import io
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+
+from hash_maps.hash_map import fnv1a_hash
+
+_MAGIC = b"AADSHMAP"
+_VERSION = 1
+# Magic, version, number of slots, number of entries, number of tombstones,
+# end of the used blob region, number of unused bytes in it, and seed.
+_HEADER = struct.Struct("<8sQQQQQQQ")
+_HEADER_SIZE = 64
+# A slot holds the hash of its key, and the offset (in the blob region) and
+# lengths of its record, which is the key followed by the value.
+_SLOT = np.dtype([("h", "<u8"), ("off", "<u8"), ("klen", "<u4"), ("vlen", "<u4")])
+_EMPTY = (1 << 64) - 1
+_DELETED = (1 << 64) - 2
+
+
+class DiskHashMap:
+    """
+    A persistent hash map, stored in a memory-mapped file, with byte string
+    keys and values.
+
+    The file holds a header, a table of fixed-width slots (using quadratic
+    probing, as `HashMap`) and a blob region where the keys and values are
+    appended. Opening a map only maps the file, so it takes `O(1)` time
+    whatever its size, pages being loaded by the OS when first accessed.
+    The pages of a map opened read-only are shared by all the processes
+    opening it.
+
+    Updating a value in-place is only possible if it is not longer than the
+    old one, otherwise the record is appended again, leaving unused bytes.
+    Growing the table, or reclaiming the unused bytes once they take half of
+    the blob region, rewrites the file.
+
+    The hash function must give the same hashes across processes, which
+    rules out `py_hash`, and the same one must be used every time a file is
+    opened.
+
+    Parameters
+    ----------
+    path
+        The path of the file.
+    mode
+        (Optional) `"r"` to open an existing map read-only, `"r+"` to open
+        it for reading and writing, and `"w"` to create a new map,
+        overwriting any existing file.
+
+        Defaults to `"r"`.
+    max_size
+        (Optional) When creating a map, the number of entries it can contain
+        before having to grow.
+
+        Defaults to `8`.
+    hash_fn
+        (Optional) The function used to hash keys, called as
+        `hash_fn(k, seed)`.
+
+        Defaults to `fnv1a_hash`.
+    seed
+        (Optional) When creating a map, the seed passed to *hash_fn*, then
+        stored in the file.
+
+        Defaults to `0`.
+    max_load
+        (Optional) The fraction of slots holding either an entry or a
+        tombstone over which the table grows. Must be in `(0, 1)`.
+
+        Defaults to `2/3`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        mode: str = "r",
+        max_size: int = 8,
+        hash_fn: Callable[[bytes, int], int] = fnv1a_hash,
+        seed: int = 0,
+        max_load: float = 2 / 3,
+    ):
+        if mode not in ("r", "r+", "w"):
+            raise ValueError("mode should be 'r', 'r+' or 'w'")
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be in (0, 1)")
+
+        self._path = os.fspath(path)
+        self._writable = mode != "r"
+        self._hash_fn = hash_fn
+        self._max_load = max_load
+        self._mm: mmap.mmap | None = None
+
+        if mode == "w":
+            n_slots = 8
+            while max_size > max_load * n_slots:
+                n_slots *= 2
+            self._write_file(self._path, n_slots, seed, [])
+
+        self._file = open(self._path, "r+b" if self._writable else "rb")
+        self._map()
+
+    def _write_file(
+        self,
+        path: str,
+        n_slots: int,
+        seed: int,
+        records: Iterable[tuple[int, bytes, bytes]],
+    ):
+        """
+        Writes a new map file at *path* with *n_slots* slots, and the
+        `(hash, key, value)` *records*, whose keys must be distinct.
+        """
+        table = np.zeros(n_slots, dtype=_SLOT)
+        table["off"] = _EMPTY
+        mask = n_slots - 1
+        n_live = 0
+        blob_end = 0
+        with open(path, "wb") as f:
+            f.seek(_HEADER_SIZE + table.nbytes)
+            for h, k, v in records:
+                idx = h & mask
+                i = 0
+                while table["off"][idx] != _EMPTY:
+                    i += 1
+                    idx = (idx + i) & mask
+                table[idx] = (h, blob_end, len(k), len(v))
+                f.write(k)
+                f.write(v)
+                blob_end += len(k) + len(v)
+                n_live += 1
+
+            f.seek(0)
+            f.write(
+                _HEADER.pack(_MAGIC, _VERSION, n_slots, n_live, 0, blob_end, 0, seed)
+            )
+            f.write(bytes(_HEADER_SIZE - _HEADER.size))
+            f.write(table.tobytes())
+
+    def _map(self):
+        """
+        Maps the file in memory, and reads its header.
+        """
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+        (
+            magic,
+            version,
+            self._n_slots,
+            self._n_live,
+            self._n_deleted,
+            self._blob_end,
+            self._n_unused,
+            self._seed,
+        ) = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION:
+            self._unmap()
+            raise ValueError(f"'{self._path}' is not a map file.")
+
+        self._table = np.ndarray(
+            self._n_slots, dtype=_SLOT, buffer=self._mm, offset=_HEADER_SIZE
+        )
+        self._blob_start = _HEADER_SIZE + self._table.nbytes
+        # Views on the fields of the slots.
+        self._hs = self._table["h"]
+        self._offs = self._table["off"]
+        self._klens = self._table["klen"]
+        self._vlens = self._table["vlen"]
+
+    def _unmap(self):
+        # The table is a view on the map, which cannot be closed while
+        # viewed.
+        self._table = self._hs = self._offs = self._klens = self._vlens = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _write_header(self):
+        _HEADER.pack_into(
+            self._mm,  # type: ignore
+            0,
+            _MAGIC,
+            _VERSION,
+            self._n_slots,
+            self._n_live,
+            self._n_deleted,
+            self._blob_end,
+            self._n_unused,
+            self._seed,
+        )
+
+    def _check_writable(self):
+        if not self._writable:
+            raise io.UnsupportedOperation("map opened read-only")
+
+    def close(self):
+        """
+        Closes this map, flushing its changes to disk.
+        """
+        if self._mm is None:
+            return
+        if self._writable:
+            self._mm.flush()
+        self._unmap()
+        self._file.close()
+
+    def flush(self):
+        """
+        Flushes the changes to this map to disk.
+        """
+        if self._writable and self._mm is not None:
+            self._mm.flush()
+
+    def __enter__(self) -> "DiskHashMap":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _records(self) -> Iterator[tuple[int, bytes, bytes]]:
+        """
+        Yields the `(hash, key, value)` records of this map.
+        """
+        table = self._table
+        mm = self._mm
+        start = self._blob_start
+        for idx in np.flatnonzero(self._offs < _DELETED).tolist():  # type: ignore
+            h, off, klen, vlen = table[idx].tolist()  # type: ignore
+            off += start
+            yield h, mm[off : off + klen], mm[off + klen : off + klen + vlen]  # type: ignore
+
+    def _rebuild(self, n_slots: int):
+        """
+        Rewrites the file with *n_slots* slots, dropping the tombstones and
+        the unused bytes of the blob region.
+        """
+        tmp_path = self._path + ".tmp"
+        self._write_file(tmp_path, n_slots, self._seed, self._records())
+        self._unmap()
+        self._file.close()
+        os.replace(tmp_path, self._path)
+        self._file = open(self._path, "r+b")
+        self._map()
+
+    def _maybe_rebuild(self):
+        """
+        Rebuilds the file if the table is too loaded, or if too many bytes
+        of the blob region are unused.
+        """
+        if self._n_live + self._n_deleted > self._max_load * self._n_slots:
+            # Sized for twice the entries, as `HashMap`.
+            n_slots = 8
+            while 2 * self._n_live > self._max_load * n_slots:
+                n_slots *= 2
+            self._rebuild(n_slots)
+        elif 2 * self._n_unused > self._blob_end:
+            self._rebuild(self._n_slots)
+
+    def _find(self, k: bytes, h: int) -> tuple[int, int]:
+        """
+        Returns the index of the slot of *k*, whose hash is *h*, or `-1` if
+        not found, along with the index of the first free (empty or
+        tombstone) slot of its probe sequence.
+        """
+        hs = self._hs
+        offs = self._offs
+        klens = self._klens
+        mm = self._mm
+        start = self._blob_start
+        mask = self._n_slots - 1
+        idx = h & mask
+        i = 0
+        i_free = -1
+        while True:
+            off = int(offs[idx])
+            if off == _EMPTY:
+                return -1, idx if i_free == -1 else i_free
+            if off == _DELETED:
+                if i_free == -1:
+                    i_free = idx
+            elif hs[idx] == h and klens[idx] == len(k):
+                off += start
+                if mm[off : off + len(k)] == k:  # type: ignore
+                    return idx, i_free
+            i += 1
+            idx = (idx + i) & mask
+
+    def _hash(self, k) -> int:
+        if not isinstance(k, bytes):
+            raise TypeError("Key should be bytes.")
+        return self._hash_fn(k, self._seed) & _EMPTY
+
+    def _append(self, data: bytes) -> int:
+        """
+        Appends *data* to the blob region, growing the file if needed.
+
+        Returns the offset of *data* in the blob region.
+        """
+        end = self._blob_start + self._blob_end + len(data)
+        if end > len(self._mm):  # type: ignore
+            # Doubling the file size, so that appending takes amortized
+            # constant time.
+            new_size = max(end, 2 * len(self._mm))  # type: ignore
+            self._unmap()
+            self._file.truncate(new_size)
+            self._map()
+
+        off = self._blob_end
+        start = self._blob_start + off
+        self._mm[start : start + len(data)] = data  # type: ignore
+        self._blob_end += len(data)
+        return off
+
+    def __repr__(self) -> str:
+        s = "{"
+        is_first_item = True
+        for k, v in self.items():
+            if is_first_item:
+                s += "\n"
+                is_first_item = False
+            else:
+                s += ",\n"
+            s += "  " + repr(k) + ": " + repr(v)
+
+        if is_first_item:
+            s += "}"
+        else:
+            s += "\n}"
+
+        return s
+
+    def __len__(self) -> int:
+        return self._n_live
+
+    def __bool__(self) -> bool:
+        return len(self) != 0
+
+    def __iter__(self) -> Iterator[tuple[bytes, bytes]]:
+        return self.items()
+
+    def __getitem__(self, k) -> bytes:
+        idx, _ = self._find(k, self._hash(k))
+        if idx == -1:
+            raise KeyError(f"Key {k!r} not found.")
+
+        _, off, klen, vlen = self._table[idx].tolist()  # type: ignore
+        off += self._blob_start + klen
+        return self._mm[off : off + vlen]  # type: ignore
+
+    def __setitem__(self, k, v: bytes):
+        self._check_writable()
+        if not isinstance(v, bytes):
+            raise TypeError("Value should be bytes.")
+
+        h = self._hash(k)
+        idx, i_free = self._find(k, h)
+        if idx != -1:
+            _, off, klen, vlen = self._table[idx].tolist()  # type: ignore
+            if len(v) <= vlen:
+                start = self._blob_start + off + klen
+                self._mm[start : start + len(v)] = v  # type: ignore
+                self._vlens[idx] = len(v)  # type: ignore
+                self._n_unused += vlen - len(v)
+            else:
+                new_off = self._append(k + v)
+                self._table[idx] = (h, new_off, len(k), len(v))  # type: ignore
+                self._n_unused += klen + vlen
+            self._write_header()
+            self._maybe_rebuild()
+            return
+
+        if self._offs[i_free] == _DELETED:  # type: ignore
+            self._n_deleted -= 1
+        off = self._append(k + v)
+        self._table[i_free] = (h, off, len(k), len(v))  # type: ignore
+        self._n_live += 1
+        self._write_header()
+        self._maybe_rebuild()
+
+    def __delitem__(self, k):
+        self._check_writable()
+        idx, _ = self._find(k, self._hash(k))
+        if idx == -1:
+            raise KeyError(f"Key {k!r} not found.")
+
+        self._n_unused += int(self._klens[idx]) + int(self._vlens[idx])  # type: ignore
+        self._offs[idx] = _DELETED  # type: ignore
+        self._n_live -= 1
+        self._n_deleted += 1
+        self._write_header()
+        self._maybe_rebuild()
+
+    def items(self) -> Iterator[tuple[bytes, bytes]]:
+        """
+        Yields the `(key, value)` pairs of this map. The map must not be
+        modified while iterating.
+        """
+        for _, k, v in self._records():
+            yield k, v
+
+    def keys(self) -> Iterator[bytes]:
+        """
+        Yields the keys of this map. See `items`.
+        """
+        for _, k, _ in self._records():
+            yield k
+
+    def values(self) -> Iterator[bytes]:
+        """
+        Yields the values of this map. See `items`.
+        """
+        for _, _, v in self._records():
+            yield v
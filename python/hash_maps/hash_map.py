@@ -1,39 +1,93 @@
-import math
-from collections.abc import Callable, Iterator
-from functools import partial
+import operator
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from typing import Union
 
+from option import Option
 
-def _encode(s: str) -> int:
-    res = 0
-    for char in s:
-        res += ord(char)
-    return res
 
+_MASK64 = (1 << 64) - 1
+_FNV_OFFSET_BASIS = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
 
-def _compress(m: int, n: int) -> int:
-    return n % m
 
+def _mix64(x: int) -> int:
+    """
+    Scrambles the bits of *x* (the finalizer of SplitMix64), so that keys
+    differing in a few bits get unrelated hashes.
+    """
+    x &= _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def py_hash(k: Hashable, seed: int = 0) -> int:
+    """
+    Hashes *k* with Python's built-in `hash` (SipHash for strings, computed
+    in C and cached by the string), mixed with *seed*.
+
+    Note
+    ----
+    Python randomizes string hashes per process (see `PYTHONHASHSEED`),
+    so this hash must not be persisted.
 
-def my_hash(m: int, s: str) -> int:
-    return _compress(m, _encode(s))
+    Parameters
+    ----------
+    k
+    seed
 
+    Returns
+    -------
+    `int`
+        A 64-bit hash.
+    """
+    return _mix64(hash(k) ^ seed)
 
-def _py_hash(m: int, s: str) -> int:
-    return _compress(m, hash(s))
 
+def int_hash(k: int, seed: int = 0) -> int:
+    """
+    Hashes the integer *k* by mixing it with *seed*, skipping the call to
+    the built-in `hash`. Integers wider than 64 bits are truncated, which
+    only makes them collide more.
 
-def quadratic_probing(
-    h: Callable[[int, str], int], max_size: int, k: str
-) -> Iterator[int]:
-    i = 0
-    hval = h(max_size, k)
-    c1 = 0.5
-    c2 = 0.5
-    c3 = 0
-    while True:
-        yield _compress(max_size, int(hval + c1 * i**2 + c2 * i + c3))
-        i += 1
+    Unlike `py_hash` on strings, this hash is the same across processes.
+
+    Parameters
+    ----------
+    k
+    seed
+
+    Returns
+    -------
+    `int`
+        A 64-bit hash.
+    """
+    return _mix64(k ^ seed)
+
+
+def fnv1a_hash(s: str | bytes, seed: int = 0) -> int:
+    """
+    Hashes *s* with 64-bit FNV-1a over its bytes (its UTF-8 encoding for
+    a string), the offset basis being mixed with *seed*.
+
+    Unlike `py_hash`, this hash is the same across processes, but it is
+    computed in Python, one byte at a time.
+
+    Parameters
+    ----------
+    s
+    seed
+
+    Returns
+    -------
+    `int`
+        A 64-bit hash.
+    """
+    h = _FNV_OFFSET_BASIS ^ seed
+    for byte in s.encode() if isinstance(s, str) else s:
+        h = ((h ^ byte) * _FNV_PRIME) & _MASK64
+    return h
 
 
 class Sentinel(object):
@@ -48,9 +102,9 @@ Deleted = Sentinel("Deleted")
 EmptySlot = Union[None, Sentinel]
 
 
-class Entry[T]:
+class Entry[K, T]:
     """
-    An entry of `HashMap[T]`.
+    An entry of `HashMap[K, T]`.
 
     Parameters
     ----------
@@ -58,61 +112,161 @@ class Entry[T]:
         The key of the entry.
     v
         The value of the entry.
+    h
+        The hash of the key, cached so that it is never computed again.
     """
 
-    def __init__(self, k: str, v: T):
-        self.k: str = k
+    __slots__ = ("k", "v", "h")
+
+    def __init__(self, k: K, v: T, h: int):
+        self.k: K = k
         self.v: T = v
+        self.h: int = h
 
     def __repr__(self) -> str:
         return "(" + str(self.k) + ", " + str(self.v) + ")"
 
-    def to_tuple(self) -> tuple[str, T]:
+    def to_tuple(self) -> tuple[K, T]:
         return (self.k, self.v)
 
 
-class HashMap[T]:
+class HashMap[K, T]:
     """
     A hash map using quadratic probing for collision resolution.
 
+    Keys can be of any type, as long as *hash_fn* and *eq_fn* agree (keys
+    equal by *eq_fn* must have the same hash). By default, keys must be
+    hashable and are compared with `==`.
+
     Parameters
     ----------
     max_size
-        (Optional) The maximum number of entries this hash map can contain.
+        (Optional) The number of entries this hash map can contain before
+        having to grow.
 
         Defaults to `8`.
     items
         (Optional) A list of initial items to insert into this hash map.
 
         Defaults to `[]`.
+    hash_fn
+        (Optional) The function used to hash keys, called as
+        `hash_fn(k, seed)`.
+
+        Defaults to `py_hash`. For integer keys, `int_hash` is faster.
+    seed
+        (Optional) The seed passed to *hash_fn*.
+
+        Defaults to `0`.
+    max_load
+        (Optional) The load factor, i.e. the fraction of slots holding either
+        an entry or a tombstone (left by a deletion), over which the table is
+        resized (in-place). Must be in `(0, 1)`.
+
+        Defaults to `2/3`.
+    min_load
+        (Optional) The fraction of slots holding an entry under which the
+        table is shrunk after a deletion. Must be in `[0, max_load / 4]`,
+        `0` disabling shrinking.
+
+        Defaults to `0`.
+    max_deleted
+        (Optional) The fraction of slots holding a tombstone over which the
+        table is compacted (i.e. rehashed in-place without the tombstones)
+        after a deletion. Must be in `(0, 1)`.
+
+        Defaults to `1/4`.
+    eq_fn
+        (Optional) The function used to compare keys, only called on keys
+        with the same hash which are not the same object.
+
+        Defaults to `operator.eq`.
     """
 
-    def __init__(self, items: list[tuple[str, T]] = [], max_size: int = 8):
-        if len(items) > max_size:
-            max_size = len(items)
-
-        # Pour un fonctionnement optimal du sondage quadratique, il faut que max_size
-        # soit une puissance de deux. Il faut aussi size <= 2/3 max_size.
-        # Ducoup, on remplace max_size par la puissance de deux supérieure la plus proche.
-        # Cela revient à regarder le nombre de chiffres qu'il faudrait pour encoder
-        # max_size en base 2, plus un.
-        self._max_size = (
-            2 if max_size == 0 else 2 ** math.ceil(math.log(max_size) / math.log(2))
-        )
-
-        self._probe = partial(quadratic_probing, my_hash)
-        partial_probe = partial(self._probe, self._max_size)
+    def __init__(
+        self,
+        items: list[tuple[K, T]] = [],
+        max_size: int = 8,
+        hash_fn: Callable[[K, int], int] = py_hash,
+        seed: int = 0,
+        max_load: float = 2 / 3,
+        min_load: float = 0,
+        max_deleted: float = 1 / 4,
+        eq_fn: Callable[[K, K], bool] = operator.eq,
+    ):
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be in (0, 1)")
+        if not 0 <= min_load <= max_load / 4:
+            raise ValueError("min_load should be in [0, max_load / 4]")
+        if not 0 < max_deleted < 1:
+            raise ValueError("max_deleted should be in (0, 1)")
+
+        # Stored rather than bound in a closure, which could not be pickled.
+        self._hash_fn = hash_fn
+        self._seed = seed
+        self._eq = eq_fn
+        self._max_load = max_load
+        self._min_load = min_load
+        self._max_deleted = max_deleted
+
+        # Quadratic probing only visits every slot if the number of slots
+        # is a power of two.
+        self._max_size = self._capacity_for(max(max_size, len(items)))
         self._items: list[Entry | EmptySlot] = [None] * self._max_size
+        # Number of entries, and number of tombstones.
+        self._n_live = 0
+        self._n_deleted = 0
+        # Number of insertions, deletions and resizes, which invalidate
+        # iterators.
+        self._n_mods = 0
+        # Number of batch operations in progress, which `snapshot` waits for.
+        self._n_batches = 0
         for k, v in items:
-            n_tests = 0
-            gen_idx = partial_probe(k)
-            idx = next(gen_idx)
-            while n_tests <= self._max_size and self._items[idx] is not None:
-                idx = next(gen_idx)
-                n_tests += 1
-            self._items[idx] = Entry(k, v)
+            self[k] = v
+
+    def _hash(self, k: K) -> int:
+        # The seed is passed positionally, whatever *hash_fn* names it.
+        return self._hash_fn(k, self._seed)
+
+    def _capacity_for(self, n: int) -> int:
+        """
+        Returns the smallest number of slots (a power of two) holding *n*
+        entries without exceeding the maximum load factor.
+        """
+        max_size = 8
+        while n > self._max_load * max_size:
+            max_size *= 2
+        return max_size
 
-        self._i_next = 0
+    def _place(self, items: list[Entry | EmptySlot], entry: Entry[K, T]):
+        """
+        Places *entry* in the first empty slot of its probe sequence in
+        *items*, using its cached hash. *items* must have no tombstones and
+        not contain the key of *entry*.
+        """
+        mask = len(items) - 1
+        idx = entry.h & mask
+        i = 0
+        while items[idx] is not None:
+            i += 1
+            idx = (idx + i) & mask
+        items[idx] = entry
+
+    def _resize(self, max_size: int):
+        """
+        Rebuilds the table with *max_size* slots, dropping the tombstones.
+        Entries are placed using their cached hashes.
+        """
+        # The new table replaces the old one once filled, so that `snapshot`
+        # never sees it partially filled.
+        items: list[Entry | EmptySlot] = [None] * max_size
+        for item in self._items:
+            if not isinstance(item, EmptySlot):
+                self._place(items, item)
+        self._items = items
+        self._max_size = max_size
+        self._n_deleted = 0
+        self._n_mods += 1
 
     def __repr__(self) -> str:
         s = "{"
@@ -128,7 +282,7 @@ class HashMap[T]:
                     is_first_item = False
                 else:
                     s += ",\n"
-                s += "  '" + item.k + "': " + str(item.v)
+                s += "  " + repr(item.k) + ": " + str(item.v)
 
         if is_empty:
             s += "}"
@@ -138,11 +292,7 @@ class HashMap[T]:
         return s
 
     def __len__(self) -> int:
-        size = 0
-        for item in self._items:
-            if not isinstance(item, EmptySlot):
-                size += 1
-        return size
+        return self._n_live
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, HashMap):
@@ -157,124 +307,286 @@ class HashMap[T]:
 
         return True
 
-    def __iter__(self):
-        return self
-
-    def __next__(self) -> tuple[str, T]:
-        while self._i_next < len(self._items) and isinstance(
-            self._items[self._i_next], EmptySlot
-        ):
-            self._i_next += 1
-
-        if self._i_next >= len(self._items):
-            self._i_next = 0
-            raise StopIteration
-
-        v = self._items[self._i_next].to_tuple()  # type: ignore
-        self._i_next += 1
-        return v
+    def __iter__(self) -> Iterator[tuple[K, T]]:
+        return self.items()
 
     def __bool__(self) -> bool:
         return len(self) != 0
 
-    def __getitem__(self, k) -> T:
-        if not isinstance(k, str):
-            raise TypeError("Key should be a string.")
-
-        max_size = self._max_size
-        gen_idx = self._probe(max_size, k)
-        item = self._items[next(gen_idx)]
-        n_tests = 0
-        while (
-            n_tests <= max_size
-            and item is not None
-            and (item == Deleted or item.k != k)  # type: ignore
+    def _find(self, k: K, h: int) -> int:
+        """
+        Returns the index of the slot of *k*, whose hash is *h*, or `-1` if
+        not found.
+        """
+        items = self._items
+        eq = self._eq
+        mask = len(items) - 1
+        # Quadratic probing: offsets are the triangular numbers (i^2 + i) / 2,
+        # which visit every slot as the number of slots is a power of two.
+        idx = h & mask
+        i = 0
+        while i <= mask:
+            item = items[idx]
+            if item is None:
+                return -1
+            if (
+                item is not Deleted
+                and item.h == h  # type: ignore
+                and (item.k is k or eq(item.k, k))  # type: ignore
+            ):
+                return idx
+            i += 1
+            idx = (idx + i) & mask
+        return -1
+
+    def _set(self, k: K, v: T, h: int):
+        """
+        Sets the value of *k*, whose hash is *h*, to *v*, growing the table
+        if needed.
+        """
+        items = self._items
+        eq = self._eq
+        mask = len(items) - 1
+        idx = h & mask
+        i = 0
+        item = items[idx]
+        # The key may be further than a tombstone in the probe sequence, so
+        # keep probing, but remember the first tombstone to reuse it.
+        i_deleted = -1
+        # The load factor being below 1, an empty slot is always reached.
+        while item is not None and (
+            item is Deleted
+            or item.h != h  # type: ignore
+            or (item.k is not k and not eq(item.k, k))  # type: ignore
         ):
-            item = self._items[next(gen_idx)]
-            n_tests += 1
+            if item is Deleted and i_deleted == -1:
+                i_deleted = idx
+            i += 1
+            idx = (idx + i) & mask
+            item = items[idx]
+
+        if item is not None:
+            # The key was found.
+            item.v = v  # type: ignore
+            return
+
+        self._n_live += 1
+        self._n_mods += 1
+        if i_deleted != -1:
+            items[i_deleted] = Entry(k, v, h)
+            self._n_deleted -= 1
+            return
+
+        items[idx] = Entry(k, v, h)
+        # Tombstones count in the load, as they lengthen probe sequences too.
+        if self._n_live + self._n_deleted > self._max_load * self._max_size:
+            # Sized for twice the entries, so that it takes as many insertions
+            # to resize again. If the load was mostly tombstones, this
+            # rehashes without growing.
+            self._resize(self._capacity_for(2 * self._n_live))
+
+    def _shrink_or_compact(self):
+        """
+        Resizes the table after deletions if it has too few entries or too
+        many tombstones.
+        """
+        if self._max_size > 8 and self._n_live < self._min_load * self._max_size:
+            self._resize(self._capacity_for(2 * self._n_live))
+        elif self._n_deleted > self._max_deleted * self._max_size:
+            # Tombstones lengthen the probe sequences of all lookups.
+            self._resize(self._max_size)
 
-        if n_tests > max_size or item is None or item == Deleted:
-            raise KeyError(f"Key '{k}' not found.")
+    def __getitem__(self, k) -> T:
+        idx = self._find(k, self._hash(k))
+        if idx == -1:
+            raise KeyError(f"Key {k!r} not found.")
 
-        return item.v  # type: ignore
+        return self._items[idx].v  # type: ignore
 
     def __setitem__(self, k, v: T):
-        if not isinstance(k, str):
-            raise TypeError("Key should be a string.")
-
-        max_size = self._max_size
-        gen_idx = self._probe(max_size, k)
-        idx = next(gen_idx)
-        item = self._items[idx]
-        n_tests = 0
-        while (
-            n_tests <= max_size and item is not None and item != Deleted and item.k != k  # type: ignore
-        ):
-            idx = next(gen_idx)
-            item = self._items[idx]
-            n_tests += 1
+        self._set(k, v, self._hash(k))
 
-        if (
-            item is None or item == Deleted or item.k == k  # type: ignore
-        ):
-            self._items[idx] = Entry(k, v)
-
-        # Si plus de place dans la liste, il faut étendre la liste.
-        # La méthode de réindexation choisie est simplement de reconstruire un hash map de zéro
-        # avec la nouvelle taille prise en compte. Donc c'est essentiellement le même code
-        # que __init__. Il doit y avoir moyen de réindexer plus efficacement. En plus je ne
-        # fais pas le changement "in place". Je crée un nouveau hashmap.
-        if n_tests > max_size:
-            items: list[tuple[str, T]] = [(k, v)]
-            for item in self._items:
-                if item is not None and item != Deleted:
-                    items.append(
-                        (
-                            item.k,  # type: ignore
-                            item.v,  # type: ignore
-                        )
-                    )
-            return HashMap(items, len(items))
+    def _delete(self, k: K, h: int) -> int:
+        """
+        Deletes *k*, whose hash is *h*, shrinking or compacting the table if
+        needed.
 
-        return self
+        Returns the index of the slot of *k*, or `-1` if not found.
+        """
+        idx = self._find(k, h)
+        if idx == -1:
+            return -1
+
+        self._items[idx] = Deleted
+        self._n_live -= 1
+        self._n_deleted += 1
+        self._n_mods += 1
+        self._shrink_or_compact()
+        return idx
 
     def __delitem__(self, k):
-        if not isinstance(k, str):
-            raise TypeError("Key should be a string.")
-
-        max_size = self._max_size
-        gen_idx = self._probe(max_size, k)
-        idx = next(gen_idx)
-        item = self._items[idx]
-        n_tests = 0
-        while (
-            n_tests <= max_size
-            and item is not None
-            and (item == Deleted or item.k != k)  # type: ignore
-        ):
-            idx = next(gen_idx)
-            item = self._items[idx]
-            n_tests += 1
+        if self._delete(k, self._hash(k)) == -1:
+            raise KeyError(f"Key {k!r} not found.")
 
-        if n_tests > max_size or item is None:
-            # key not found
-            raise KeyError(f"Key '{k}' not found.")
-        else:
-            # key has been found, so delete
-            self._items[idx] = Deleted
+    def get_many(self, ks: Iterable[K]) -> list[Option[T]]:
+        """
+        Gets the values of several keys at once.
+
+        Parameters
+        ----------
+        ks
+            The keys to look up.
+
+        Returns
+        -------
+        `list[Option[T]]`
+            For each key of *ks*, in order, `Option.Some(v)` if it has value
+            `v` in this hash map, `Option.NONE()` otherwise.
+        """
+        hash_ = self._hash
+        find = self._find
+        items = self._items
+        vs: list[Option[T]] = []
+        for k in ks:
+            idx = find(k, hash_(k))
+            vs.append(Option.NONE() if idx == -1 else Option.Some(items[idx].v))  # type: ignore
+        return vs
+
+    def set_many(self, items: Iterable[tuple[K, T]]) -> "HashMap[K, T]":
+        """
+        Sets the values of several keys at once, later items overriding
+        earlier ones with the same key.
+
+        The keys are hashed up front and the table is grown at most once,
+        for the whole batch.
+
+        Parameters
+        ----------
+        items
+            The `(key, value)` pairs to set, e.g. another hash map.
 
-    def keys(self) -> Iterator[str]:
+        Returns
+        -------
+        `HashMap[K, T]`
+            This hash map (useful for chaining operations).
         """
-        Yields the keys of this hash map.
+        hash_ = self._hash
+        batch = [(k, v, hash_(k)) for k, v in items]
+        self._n_batches += 1
+        try:
+            # Sized as if no key of the batch was already in this hash map.
+            n = self._n_live + len(batch)
+            if n + self._n_deleted > self._max_load * self._max_size:
+                self._resize(self._capacity_for(n))
+
+            set_ = self._set
+            for k, v, h in batch:
+                set_(k, v, h)
+        finally:
+            self._n_batches -= 1
+        return self
+
+    update = set_many
+
+    def delete_many(self, ks: Iterable[K]) -> int:
         """
+        Deletes several keys at once, ignoring the keys not in this hash map.
+
+        The table is shrunk or compacted at most once, after all the
+        deletions.
+
+        Parameters
+        ----------
+        ks
+            The keys to delete.
+
+        Returns
+        -------
+        `int`
+            The number of keys deleted.
+        """
+        hash_ = self._hash
+        find = self._find
+        items = self._items
+        n_deleted = 0
+        batch = [(hash_(k), k) for k in ks]
+        self._n_batches += 1
+        try:
+            for h, k in batch:
+                idx = find(k, h)
+                if idx != -1:
+                    items[idx] = Deleted
+                    n_deleted += 1
+        finally:
+            self._n_live -= n_deleted
+            self._n_deleted += n_deleted
+            self._n_mods += n_deleted
+            self._n_batches -= 1
+        self._shrink_or_compact()
+        return n_deleted
+
+    def _entries(self) -> Iterator[Entry[K, T]]:
+        """
+        Yields the entries of this hash map, raising a `RuntimeError` if it
+        is modified (other than by updating the value of a key) in between.
+        """
+        n_mods = self._n_mods
         for item in self._items:
+            if self._n_mods != n_mods:
+                raise RuntimeError("HashMap modified during iteration.")
             if not isinstance(item, EmptySlot):
-                yield item.k
+                yield item
+
+    def items(self) -> Iterator[tuple[K, T]]:
+        """
+        Yields the `(key, value)` pairs of this hash map.
+
+        Each call returns an independent iterator. Modifying this hash map
+        (other than by updating the value of a key) while iterating makes
+        the iterator raise a `RuntimeError`, see `snapshot` for that.
+        """
+        for entry in self._entries():
+            yield (entry.k, entry.v)
+
+    def keys(self) -> Iterator[K]:
+        """
+        Yields the keys of this hash map. See `items`.
+        """
+        for entry in self._entries():
+            yield entry.k
 
     def values(self) -> Iterator[T]:
         """
-        Yields the values of this hash map.
+        Yields the values of this hash map. See `items`.
         """
-        for item in self._items:
-            if not isinstance(item, EmptySlot):
-                yield item.v
+        for entry in self._entries():
+            yield entry.v
+
+    def snapshot(self) -> Iterator[tuple[K, T]]:
+        """
+        Returns an iterator over the `(key, value)` pairs of this hash map at
+        the time of the call, unaffected by later modifications.
+
+        This is safe to call while another thread modifies this hash map:
+        single modifications only write one slot, or replace the whole
+        table, and the slots are copied at once. Batch operations (`set_many`
+        and `delete_many`) write several slots, so the slots are copied
+        again until no batch operation was in progress while copying them.
+
+        Returns
+        -------
+        `Iterator[tuple[K, T]]`
+        """
+        while True:
+            n_mods = self._n_mods
+            if self._n_batches == 0:
+                # Copying a list is atomic, holding the GIL, and fast, so
+                # that a busy writer cannot keep it from succeeding.
+                items = self._items[:]
+                if self._n_mods == n_mods and self._n_batches == 0:
+                    break
+            # Releases the GIL, for the batch in progress to finish.
+            time.sleep(0)
+        return iter(
+            [(item.k, item.v) for item in items if not isinstance(item, EmptySlot)]
+        )
@@ -0,0 +1,400 @@
+import operator
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from option import Option
+
+from hash_maps.hash_map import py_hash
+
+_MASK64 = (1 << 64) - 1
+# Probe distances are stored plus one, 0 marking an empty slot, in a byte
+# unless one of them does not fit.
+_MAX_DIST = 254
+
+
+class RobinHoodHashMap[K, T]:
+    """
+    A hash map using linear probing with Robin Hood hashing for collision
+    resolution.
+
+    When inserting, an entry takes the slot of any entry closer to its own
+    ideal slot (the "rich"), which then moves on. This keeps probe sequences
+    short and of similar lengths, and lets lookups of missing keys stop early.
+    Deletions shift the following entries back instead of leaving tombstones.
+
+    The probe distances (the "control bytes") are stored in a `bytearray`,
+    the cached hashes in an `array`, and keys and values in two parallel
+    lists, so that no object is allocated per entry. Reading a control byte
+    returns a cached small `int`, so probing does not allocate either.
+
+    This class has the same mapping API as `HashMap`, and the same
+    requirements on keys.
+
+    Parameters
+    ----------
+    items
+        (Optional) A list of initial items to insert into this hash map.
+
+        Defaults to `[]`.
+    max_size
+        (Optional) The number of entries this hash map can contain before
+        having to grow.
+
+        Defaults to `8`.
+    hash_fn
+        (Optional) The function used to hash keys, called as
+        `hash_fn(k, seed)`.
+
+        Defaults to `py_hash`.
+    seed
+        (Optional) The seed passed to *hash_fn*.
+
+        Defaults to `0`.
+    max_load
+        (Optional) The fraction of slots holding an entry over which the
+        table grows. Must be in `(0, 1)`.
+
+        Defaults to `0.9`.
+    eq_fn
+        (Optional) The function used to compare keys, only called on keys
+        with the same hash which are not the same object.
+
+        Defaults to `operator.eq`.
+    """
+
+    def __init__(
+        self,
+        items: list[tuple[K, T]] = [],
+        max_size: int = 8,
+        hash_fn: Callable[[K, int], int] = py_hash,
+        seed: int = 0,
+        max_load: float = 0.9,
+        eq_fn: Callable[[K, K], bool] = operator.eq,
+    ):
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be in (0, 1)")
+
+        self._hash_fn = hash_fn
+        self._seed = seed
+        self._eq = eq_fn
+        self._max_load = max_load
+        self._n_live = 0
+        # Number of insertions, deletions and resizes, which invalidate
+        # iterators.
+        self._n_mods = 0
+        # Number of modifications in progress, during which entries are
+        # moved around.
+        self._n_writers = 0
+        self._alloc(self._capacity_for(max(max_size, len(items))))
+        for k, v in items:
+            self[k] = v
+
+    def _hash(self, k: K) -> int:
+        return self._hash_fn(k, self._seed)
+
+    def _capacity_for(self, n: int) -> int:
+        """
+        Returns the smallest number of slots (a power of two) holding *n*
+        entries without exceeding the maximum load factor.
+        """
+        max_size = 8
+        while n > self._max_load * max_size:
+            max_size *= 2
+        return max_size
+
+    def _alloc(self, max_size: int):
+        # Allocated before being assigned, so that the table is left intact
+        # if an allocation fails.
+        ctrl = bytearray(max_size)
+        hashes = array("Q", bytes(8 * max_size))
+        keys: list[K | None] = [None] * max_size
+        vals: list[T | None] = [None] * max_size
+        self._max_size = max_size
+        self._mask = max_size - 1
+        self._ctrl: bytearray | array[int] = ctrl
+        self._hashes = hashes
+        self._keys = keys
+        self._vals = vals
+
+    def _resize(self, max_size: int):
+        """
+        Rebuilds the table with *max_size* slots. Entries are placed using
+        their cached hashes.
+        """
+        self._n_mods += 1
+        self._n_writers += 1
+        try:
+            ctrl = self._ctrl
+            hashes = self._hashes
+            keys = self._keys
+            vals = self._vals
+            self._alloc(max_size)
+            for i, c in enumerate(ctrl):
+                if c:
+                    self._place(hashes[i], keys[i], vals[i])  # type: ignore
+        finally:
+            self._n_writers -= 1
+
+    def _place(self, h: int, k: K, v: T):
+        """
+        Places a new entry, taking the slots of richer entries along the way.
+        The key *k* must not be in this hash map already.
+        """
+        ctrl = self._ctrl
+        hashes = self._hashes
+        keys = self._keys
+        vals = self._vals
+        mask = self._mask
+        idx = h & mask
+        dist = 0
+        while True:
+            c = ctrl[idx]
+            if c == 0:
+                ctrl[idx] = dist + 1
+                hashes[idx] = h
+                keys[idx] = k
+                vals[idx] = v
+                return
+            if c - 1 < dist:
+                # Take from the rich, the displaced entry moves on.
+                ctrl[idx] = dist + 1
+                dist = c - 1
+                h, hashes[idx] = hashes[idx], h
+                k, keys[idx] = keys[idx], k  # type: ignore
+                v, vals[idx] = vals[idx], v  # type: ignore
+            idx = (idx + 1) & mask
+            dist += 1
+            if dist > _MAX_DIST and type(ctrl) is bytearray:
+                # Only happens with a degenerate hash function, for which
+                # growing the table would not shorten probe sequences (keys
+                # whose hashes share their low bits keep colliding), so the
+                # distances are widened instead, until the next resize.
+                ctrl = self._ctrl = array("L", list(ctrl))
+
+    def _find(self, k: K, h: int) -> int:
+        """
+        Returns the index of the slot of *k*, or `-1` if not found.
+        """
+        ctrl = self._ctrl
+        hashes = self._hashes
+        keys = self._keys
+        eq = self._eq
+        mask = self._mask
+        idx = h & mask
+        dist = 0
+        while True:
+            # Past an empty slot (0) or a richer entry (at distance `c - 1`),
+            # *k* would have been placed before.
+            if ctrl[idx] <= dist:
+                return -1
+            if hashes[idx] == h and (keys[idx] is k or eq(keys[idx], k)):
+                return idx
+            idx = (idx + 1) & mask
+            dist += 1
+
+    def __repr__(self) -> str:
+        s = "{"
+        is_first_item = True
+        for k, v in zip(self.keys(), self.values()):
+            if is_first_item:
+                s += "\n"
+                is_first_item = False
+            else:
+                s += ",\n"
+            s += "  " + repr(k) + ": " + str(v)
+
+        if is_first_item:
+            s += "}"
+        else:
+            s += "\n}"
+
+        return s
+
+    def __len__(self) -> int:
+        return self._n_live
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RobinHoodHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+
+        for k, v in zip(self.keys(), self.values()):
+            try:
+                if other[k] != v:
+                    return False
+            except KeyError:
+                return False
+
+        return True
+
+    def __iter__(self) -> Iterator[tuple[K, T]]:
+        return self.items()
+
+    def __bool__(self) -> bool:
+        return len(self) != 0
+
+    def __getitem__(self, k) -> T:
+        idx = self._find(k, self._hash(k) & _MASK64)
+        if idx == -1:
+            raise KeyError(f"Key {k!r} not found.")
+        return self._vals[idx]  # type: ignore
+
+    def _set(self, k: K, v: T, h: int):
+        """
+        Sets the value of *k*, whose hash is *h*, to *v*, growing the table
+        if needed.
+        """
+        idx = self._find(k, h)
+        if idx != -1:
+            self._vals[idx] = v
+            return
+
+        n_live = self._n_live + 1
+        self._n_mods += 1
+        self._n_writers += 1
+        try:
+            if n_live > self._max_load * self._max_size:
+                self._resize(self._capacity_for(2 * n_live))
+            self._place(h, k, v)
+        finally:
+            self._n_writers -= 1
+        self._n_live = n_live
+
+    def _delete_at(self, idx: int):
+        """
+        Deletes the entry in slot *idx*, shifting back the following entries
+        which are not in their ideal slot.
+        """
+        self._n_mods += 1
+        self._n_writers += 1
+        try:
+            ctrl = self._ctrl
+            hashes = self._hashes
+            keys = self._keys
+            vals = self._vals
+            mask = self._mask
+            nxt = (idx + 1) & mask
+            while ctrl[nxt] > 1:
+                ctrl[idx] = ctrl[nxt] - 1
+                hashes[idx] = hashes[nxt]
+                keys[idx] = keys[nxt]
+                vals[idx] = vals[nxt]
+                idx = nxt
+                nxt = (nxt + 1) & mask
+            ctrl[idx] = 0
+            keys[idx] = None
+            vals[idx] = None
+            self._n_live -= 1
+        finally:
+            self._n_writers -= 1
+
+    def __setitem__(self, k, v: T):
+        self._set(k, v, self._hash(k) & _MASK64)
+
+    def __delitem__(self, k):
+        idx = self._find(k, self._hash(k) & _MASK64)
+        if idx == -1:
+            raise KeyError(f"Key {k!r} not found.")
+        self._delete_at(idx)
+
+    def get_many(self, ks: Iterable[K]) -> list[Option[T]]:
+        """
+        See `HashMap.get_many`.
+        """
+        hash_ = self._hash
+        find = self._find
+        vals = self._vals
+        vs: list[Option[T]] = []
+        for k in ks:
+            idx = find(k, hash_(k) & _MASK64)
+            vs.append(Option.NONE() if idx == -1 else Option.Some(vals[idx]))  # type: ignore
+        return vs
+
+    def set_many(self, items: Iterable[tuple[K, T]]) -> "RobinHoodHashMap[K, T]":
+        """
+        See `HashMap.set_many`.
+        """
+        hash_ = self._hash
+        batch = [(k, v, hash_(k) & _MASK64) for k, v in items]
+        n = self._n_live + len(batch)
+        if n > self._max_load * self._max_size:
+            self._resize(self._capacity_for(n))
+
+        set_ = self._set
+        for k, v, h in batch:
+            set_(k, v, h)
+        return self
+
+    update = set_many
+
+    def delete_many(self, ks: Iterable[K]) -> int:
+        """
+        See `HashMap.delete_many`.
+        """
+        hash_ = self._hash
+        find = self._find
+        n_deleted = 0
+        for h, k in [(hash_(k) & _MASK64, k) for k in ks]:
+            idx = find(k, h)
+            if idx != -1:
+                self._delete_at(idx)
+                n_deleted += 1
+        return n_deleted
+
+    def _slots(self) -> Iterator[int]:
+        """
+        Yields the indexes of the slots holding an entry, raising a
+        `RuntimeError` if this hash map is modified (other than by updating
+        the value of a key) in between.
+        """
+        n_mods = self._n_mods
+        for i, c in enumerate(self._ctrl):
+            if not c:
+                continue
+            if self._n_mods != n_mods:
+                raise RuntimeError("RobinHoodHashMap modified during iteration.")
+            yield i
+
+    def items(self) -> Iterator[tuple[K, T]]:
+        """
+        See `HashMap.items`.
+        """
+        for i in self._slots():
+            yield (self._keys[i], self._vals[i])  # type: ignore
+
+    def keys(self) -> Iterator[K]:
+        """
+        See `HashMap.keys`.
+        """
+        for i in self._slots():
+            yield self._keys[i]  # type: ignore
+
+    def values(self) -> Iterator[T]:
+        """
+        See `HashMap.values`.
+        """
+        for i in self._slots():
+            yield self._vals[i]  # type: ignore
+
+    def snapshot(self) -> Iterator[tuple[K, T]]:
+        """
+        See `HashMap.snapshot`.
+
+        Unlike for `HashMap`, modifications move entries around, so the
+        slots are copied again if a modification was in progress, after
+        letting it finish.
+        """
+        while True:
+            n_mods = self._n_mods
+            if self._n_writers == 0:
+                ctrl = self._ctrl[:]
+                keys = self._keys[:]
+                vals = self._vals[:]
+                if self._n_mods == n_mods:
+                    break
+            # Releases the GIL, rather than spinning while the writer waits
+            # for it.
+            time.sleep(0)
+        return iter([(keys[i], vals[i]) for i, c in enumerate(ctrl) if c])
@@ -0,0 +1,119 @@
+import threading
+import unittest
+
+from hash_maps import ConcurrentHashMap, int_hash
+
+
+class TestConcurrentHashMap(unittest.TestCase):
+    def test_init(self):
+        hm = ConcurrentHashMap()
+        self.assertFalse(bool(hm))
+        self.assertEqual(len(hm), 0)
+        self.assertEqual(repr(hm), "{}")
+
+        hm = ConcurrentHashMap([("a", 1), ("b", 2), ("c", 3)], n_segments=3)
+        self.assertTrue(bool(hm))
+        self.assertEqual(len(hm), 3)
+        self.assertEqual(len(hm._segments), 4)
+        self.assertEqual(hm, ConcurrentHashMap([("c", 3), ("b", 2), ("a", 1)]))
+        self.assertNotEqual(hm, ConcurrentHashMap([("a", 1)]))
+
+        self.assertRaises(ValueError, lambda: ConcurrentHashMap(n_segments=0))
+
+    def test_get_set_del(self):
+        hm = ConcurrentHashMap(hash_fn=int_hash)
+        for i in range(1000):
+            hm[i] = i
+            self.assertEqual(hm[i], i)
+        self.assertEqual(len(hm), 1000)
+        # Keys are spread across the segments.
+        self.assertTrue(all(len(segment) > 0 for segment in hm._segments))
+
+        self.assertRaises(KeyError, lambda: hm[1000])
+        for i in range(0, 1000, 2):
+            del hm[i]
+        self.assertRaises(KeyError, lambda: hm[0])
+        with self.assertRaises(KeyError):
+            del hm[0]
+        self.assertEqual(set(hm.keys()), set(range(1, 1000, 2)))
+        self.assertEqual(set(hm.values()), set(range(1, 1000, 2)))
+
+        # Keys are spread across the segments even by a hash without high
+        # bits.
+        hm = ConcurrentHashMap([(i, i) for i in range(100)], hash_fn=lambda k, _: k)
+        self.assertTrue(all(len(segment) > 0 for segment in hm._segments))
+        self.assertEqual(sorted(hm.keys()), list(range(100)))
+
+    def test_get_or_set(self):
+        hm = ConcurrentHashMap()
+        self.assertEqual(hm.get_or_set("a", 1), 1)
+        self.assertEqual(hm.get_or_set("a", 2), 1)
+        self.assertEqual(hm.compute_if_absent("b", lambda k: k * 2), "bb")
+        self.assertEqual(hm.compute_if_absent("b", lambda k: k * 3), "bb")
+        self.assertEqual(len(hm), 2)
+
+    def test_threads(self):
+        hm = ConcurrentHashMap(n_segments=4)
+        n_calls = [0] * 100
+        calls_lock = threading.Lock()
+
+        def compute(k: str) -> int:
+            i = int(k)
+            with calls_lock:
+                n_calls[i] += 1
+            return i
+
+        def work(tid: int):
+            for _ in range(20):
+                for i in range(100):
+                    self.assertEqual(hm.compute_if_absent(str(i), compute), i)
+                    hm[f"{tid}:{i}"] = i
+                for i in range(100):
+                    del hm[f"{tid}:{i}"]
+
+        threads = [threading.Thread(target=work, args=(tid,)) for tid in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(n_calls, [1] * 100)
+        self.assertEqual(sorted(hm.values()), list(range(100)))
+
+    def test_items_while_writing(self):
+        hm = ConcurrentHashMap([(i, i) for i in range(50_000)], n_segments=4)
+        stop = threading.Event()
+        pairs = []
+
+        def write():
+            i = -1
+            while not stop.is_set():
+                hm[i] = i
+                del hm[i]
+                i -= 1
+
+        def read():
+            pairs.extend(hm.items())
+
+        writer = threading.Thread(target=write)
+        # A daemon, not to hang the tests if it never finishes.
+        reader = threading.Thread(target=read, daemon=True)
+        writer.start()
+        try:
+            reader.start()
+            reader.join(timeout=10)
+            self.assertFalse(reader.is_alive())
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(
+            sorted(p for p in pairs if p[0] >= 0), [(i, i) for i in range(50_000)]
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
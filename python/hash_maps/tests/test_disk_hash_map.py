@@ -0,0 +1,115 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from hash_maps import DiskHashMap
+
+
+class TestDiskHashMap(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "map.bin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_init(self):
+        with DiskHashMap(self.path, "w") as hm:
+            self.assertFalse(bool(hm))
+            self.assertEqual(len(hm), 0)
+            self.assertEqual(repr(hm), "{}")
+
+        self.assertRaises(ValueError, lambda: DiskHashMap(self.path, "a"))
+        self.assertRaises(ValueError, lambda: DiskHashMap(self.path, max_load=1))
+        with open(self.path, "wb") as f:
+            f.write(bytes(128))
+        self.assertRaises(ValueError, lambda: DiskHashMap(self.path))
+
+    def test_get_set_del(self):
+        with DiskHashMap(self.path, "w") as hm:
+            ks = [f"user:{i}".encode() for i in range(1000)]
+            for i, k in enumerate(ks):
+                hm[k] = str(i).encode()
+                self.assertEqual(len(hm), i + 1)
+            for i, k in enumerate(ks):
+                self.assertEqual(hm[k], str(i).encode())
+            self.assertRaises(KeyError, lambda: hm[b"missing"])
+            self.assertRaises(TypeError, lambda: hm["user:0"])
+
+            # Shorter values are written in-place, longer ones appended.
+            hm[ks[0]] = b""
+            hm[ks[1]] = b"a longer value"
+            self.assertEqual(hm[ks[0]], b"")
+            self.assertEqual(hm[ks[1]], b"a longer value")
+
+            for k in ks[:500]:
+                del hm[k]
+            with self.assertRaises(KeyError):
+                del hm[ks[0]]
+            self.assertEqual(len(hm), 500)
+            self.assertEqual(set(hm.keys()), set(ks[500:]))
+            self.assertEqual(
+                dict(hm.items()),
+                {k: str(i).encode() for i, k in enumerate(ks) if i >= 500},
+            )
+
+    def test_persistence(self):
+        with DiskHashMap(self.path, "w", seed=42) as hm:
+            for i in range(100):
+                hm[str(i).encode()] = bytes([i]) * i
+
+        with DiskHashMap(self.path) as hm:
+            self.assertEqual(len(hm), 100)
+            for i in range(100):
+                self.assertEqual(hm[str(i).encode()], bytes([i]) * i)
+            with self.assertRaises(io.UnsupportedOperation):
+                hm[b"0"] = b""
+
+        with DiskHashMap(self.path, "r+") as hm:
+            del hm[b"0"]
+            hm[b"new"] = b"value"
+
+        with DiskHashMap(self.path) as hm:
+            self.assertEqual(len(hm), 100)
+            self.assertEqual(hm[b"new"], b"value")
+            self.assertRaises(KeyError, lambda: hm[b"0"])
+
+    def test_shared_across_processes(self):
+        with DiskHashMap(self.path, "w") as hm:
+            hm[b"key"] = b"value"
+
+        code = (
+            "import sys\n"
+            "from hash_maps import DiskHashMap\n"
+            "with DiskHashMap(sys.argv[1]) as hm:\n"
+            "    sys.stdout.write(hm[b'key'].decode())\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code, self.path],
+            capture_output=True,
+            check=True,
+            # The `python` directory, whatever the directory the tests are run
+            # from.
+            env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[2])},
+        ).stdout
+        self.assertEqual(out, b"value")
+
+    def test_compaction(self):
+        with DiskHashMap(self.path, "w") as hm:
+            for i in range(1000):
+                hm[b"key"] = bytes(i)
+            self.assertEqual(len(hm), 1)
+            self.assertEqual(hm[b"key"], bytes(999))
+            self.assertLess(os.path.getsize(self.path), 8 * 999)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
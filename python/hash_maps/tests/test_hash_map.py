@@ -1,6 +1,10 @@
+import pickle
+import threading
 import unittest
 
-from hash_maps import HashMap
+from option import Option
+
+from hash_maps import HashMap, fnv1a_hash, int_hash, py_hash
 
 
 class TestHashMap(unittest.TestCase):
@@ -13,6 +17,16 @@ class TestHashMap(unittest.TestCase):
         self.assertTrue(bool(hm))
         self.assertEqual(len(hm), 3)
 
+    def test_pickle(self):
+        hm = HashMap(
+            [(f"user:{i}", i) for i in range(100)], hash_fn=fnv1a_hash, seed=42
+        )
+        clone = pickle.loads(pickle.dumps(hm))
+        self.assertEqual(clone, hm)
+        clone["user:100"] = 100
+        self.assertEqual(clone["user:100"], 100)
+        self.assertEqual(len(clone), 101)
+
     def test_get_set_del(self):
         hm = HashMap()
         ks = ["a", "b", "c", "d", "e"]
@@ -23,6 +37,7 @@ class TestHashMap(unittest.TestCase):
             self.assertEqual(hm[k], v)
 
         self.assertRaises(KeyError, lambda: hm["f"])
+        self.assertRaises(TypeError, lambda: hm[["a"]])
 
         expected_size = 5
         for k in ks:
@@ -40,6 +55,235 @@ class TestHashMap(unittest.TestCase):
         self.assertEqual(set(hm.keys()), set(ks))
         self.assertEqual(set(hm.values()), set(vs))
 
+    def test_hash_fns(self):
+        self.assertEqual(fnv1a_hash(""), 0xCBF29CE484222325)
+        self.assertEqual(fnv1a_hash("a"), 0xAF63DC4C8601EC8C)
+
+        for hash_fn in [py_hash, fnv1a_hash]:
+            self.assertNotEqual(hash_fn("user:123"), hash_fn("user:132"))
+            self.assertNotEqual(hash_fn("user:123"), hash_fn("user:123", seed=1))
+            self.assertEqual(hash_fn("user:123", seed=1), hash_fn("user:123", seed=1))
+
+            hm = HashMap(max_size=128, hash_fn=hash_fn, seed=42)
+            ks = [f"user:{i}" for i in range(100)]
+            for i, k in enumerate(ks):
+                hm[k] = i
+            for i, k in enumerate(ks):
+                self.assertEqual(hm[k], i)
+
+    def test_generic_keys(self):
+        self.assertEqual(fnv1a_hash(b"a"), fnv1a_hash("a"))
+        self.assertNotEqual(int_hash(1), int_hash(2))
+        self.assertEqual(int_hash(-1), int_hash((1 << 64) - 1))
+
+        hm = HashMap(hash_fn=int_hash)
+        for i in range(1000):
+            hm[i] = str(i)
+        for i in range(1000):
+            self.assertEqual(hm[i], str(i))
+        for i in range(0, 1000, 2):
+            del hm[i]
+        self.assertEqual(set(hm.keys()), set(range(1, 1000, 2)))
+
+        hm = HashMap([((1, "a"), 1), ((1, "b"), 2), (3, 3)])
+        self.assertEqual(hm[(1, "a")], 1)
+        self.assertEqual(hm[3], 3)
+        self.assertRaises(KeyError, lambda: hm[(1, "c")])
+
+        hm = HashMap(
+            # The seed is passed positionally, whatever its name.
+            hash_fn=lambda k, s: py_hash(k.lower(), s),
+            eq_fn=lambda a, b: a.lower() == b.lower(),
+        )
+        hm["Key"] = 1
+        hm["KEY"] = 2
+        self.assertEqual(len(hm), 1)
+        self.assertEqual(hm["key"], 2)
+        self.assertEqual(repr(hm), "{\n  'Key': 2\n}")
+
+    def test_hash_is_cached(self):
+        n_calls = 0
+
+        def counting_hash(s: str, seed: int) -> int:
+            nonlocal n_calls
+            n_calls += 1
+            return py_hash(s, seed)
+
+        hm = HashMap([("a", 1), ("b", 2)], hash_fn=counting_hash)
+        self.assertEqual(n_calls, 2)
+        ks = [str(i) for i in range(100)]
+        for k in ks:
+            hm[k] = 0
+        # One call per insertion, none for moving entries when resizing.
+        self.assertEqual(n_calls, 102)
+
+    def test_resize(self):
+        hm = HashMap(max_size=4, min_load=0.1)
+        ks = [f"user:{i}" for i in range(1000)]
+        for i, k in enumerate(ks):
+            hm[k] = i
+        self.assertEqual(len(hm), 1000)
+        for i, k in enumerate(ks):
+            self.assertEqual(hm[k], i)
+
+        # Overwriting a key behind a tombstone does not duplicate it.
+        for k in ks[:500]:
+            del hm[k]
+        for i, k in enumerate(ks):
+            hm[k] = -i
+        self.assertEqual(len(hm), 1000)
+        self.assertEqual(sorted(hm.values()), sorted(-i for i in range(1000)))
+
+        for k in ks[:990]:
+            del hm[k]
+        self.assertEqual(len(hm), 10)
+        self.assertLessEqual(len(hm._items), 64)
+        for i, k in enumerate(ks[990:], 990):
+            self.assertEqual(hm[k], -i)
+
+        self.assertRaises(ValueError, lambda: HashMap(max_load=1))
+        self.assertRaises(ValueError, lambda: HashMap(min_load=0.5))
+
+    def test_compaction(self):
+        hm = HashMap(max_size=64)
+        for i in range(10000):
+            hm[str(i)] = i
+            self.assertEqual(len(hm), 1)
+            del hm[str(i)]
+            self.assertEqual(len(hm), 0)
+            self.assertLessEqual(hm._n_deleted, len(hm._items) // 4)
+        self.assertFalse(bool(hm))
+        self.assertLessEqual(len(hm._items), 128)
+
+        self.assertRaises(ValueError, lambda: HashMap(max_deleted=0))
+
+    def test_batch(self):
+        hm = HashMap()
+        n_resizes = 0
+        resize = hm._resize
+
+        def counting_resize(max_size: int):
+            nonlocal n_resizes
+            n_resizes += 1
+            resize(max_size)
+
+        hm._resize = counting_resize
+        ks = [f"user:{i}" for i in range(10000)]
+        self.assertIs(hm.set_many((k, i) for i, k in enumerate(ks)), hm)
+        self.assertEqual(n_resizes, 1)
+        self.assertEqual(len(hm), 10000)
+
+        hm.update([("user:0", -1), ("user:0", -2), ("new", 0)])
+        self.assertEqual(len(hm), 10001)
+        self.assertEqual(
+            hm.get_many(["user:0", "user:1", "missing", "new"]),
+            [Option.Some(-2), Option.Some(1), Option.NONE(), Option.Some(0)],
+        )
+
+        self.assertEqual(hm.delete_many(ks[:5000] + ["missing", "user:0"]), 5000)
+        self.assertEqual(len(hm), 5001)
+        vs = hm.get_many(ks)
+        self.assertTrue(all(v.is_none for v in vs[:5000]))
+        self.assertEqual([v.unwrap() for v in vs[5000:]], list(range(5000, 10000)))
+
+    def test_independent_iterators(self):
+        hm = HashMap([(i, i) for i in range(100)])
+        pairs = [(a, b) for a, _ in hm for b, _ in hm]
+        self.assertEqual(len(pairs), 100 * 100)
+        self.assertEqual(set(hm.items()), {(i, i) for i in range(100)})
+
+        # Updating values is allowed, modifying the keys is not.
+        for k, v in hm.items():
+            hm[k] = v + 1
+        self.assertEqual(sorted(hm.values()), list(range(1, 101)))
+        with self.assertRaises(RuntimeError):
+            for k in hm.keys():
+                del hm[k]
+        with self.assertRaises(RuntimeError):
+            for k, _ in hm:
+                hm[-k - 1000] = 0
+
+        snapshot = hm.snapshot()
+        hm.delete_many(list(hm.keys()))
+        self.assertEqual(len(hm), 0)
+        self.assertEqual(len(list(snapshot)), 100)
+
+    def test_snapshot_while_writing(self):
+        hm = HashMap([(f"stable:{i}", i) for i in range(1000)])
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                hm[f"tmp:{i}"] = i
+                if i >= 100:
+                    del hm[f"tmp:{i - 100}"]
+                i += 1
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(50):
+                stable = [(k, v) for k, v in hm.snapshot() if k.startswith("stable")]
+                self.assertEqual(sorted(v for _, v in stable), list(range(1000)))
+                for k, v in stable:
+                    self.assertEqual(k, f"stable:{v}")
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_snapshot_during_batches(self):
+        hm = HashMap(max_size=4096)
+        ks = [f"batch:{i}" for i in range(1000)]
+        stop = threading.Event()
+
+        def write():
+            while not stop.is_set():
+                hm.set_many((k, 0) for k in ks)
+                hm.delete_many(ks)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(200):
+                # Batches are seen either whole or not at all.
+                self.assertIn(len(list(hm.snapshot())), [0, 1000])
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_snapshot_of_busy_map(self):
+        # Copying the pairs of a large map takes longer than the writer
+        # takes to modify it, which must not make the snapshot retry forever.
+        hm = HashMap([(i, i) for i in range(100_000)], hash_fn=int_hash)
+        stop = threading.Event()
+        pairs = []
+
+        def write():
+            i = -1
+            while not stop.is_set():
+                hm[i] = i
+                del hm[i]
+                i -= 1
+
+        def read():
+            pairs.extend(hm.snapshot())
+
+        writer = threading.Thread(target=write)
+        # A daemon, not to hang the tests if it never finishes.
+        reader = threading.Thread(target=read, daemon=True)
+        writer.start()
+        try:
+            reader.start()
+            reader.join(timeout=10)
+            self.assertFalse(reader.is_alive())
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(
+            sorted(p for p in pairs if p[0] >= 0), [(i, i) for i in range(100_000)]
+        )
+
 
 def main():
     unittest.main()
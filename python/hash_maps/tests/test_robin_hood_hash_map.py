@@ -0,0 +1,215 @@
+import pickle
+import random
+import threading
+import unittest
+
+from option import Option
+
+from hash_maps import RobinHoodHashMap, fnv1a_hash, int_hash
+
+
+class TestRobinHoodHashMap(unittest.TestCase):
+    def test_init(self):
+        hm = RobinHoodHashMap()
+        self.assertFalse(bool(hm))
+        self.assertEqual(len(hm), 0)
+
+        hm = RobinHoodHashMap([("a", 1), ("b", 2), ("c", 3)])
+        self.assertTrue(bool(hm))
+        self.assertEqual(len(hm), 3)
+        self.assertEqual(hm, RobinHoodHashMap([("c", 3), ("b", 2), ("a", 1)]))
+        self.assertNotEqual(hm, RobinHoodHashMap([("a", 1), ("b", 2)]))
+
+        self.assertRaises(ValueError, lambda: RobinHoodHashMap(max_load=1))
+
+    def test_pickle(self):
+        hm = RobinHoodHashMap(
+            [(f"user:{i}", i) for i in range(100)], hash_fn=fnv1a_hash, seed=42
+        )
+        clone = pickle.loads(pickle.dumps(hm))
+        self.assertEqual(clone, hm)
+        clone["user:100"] = 100
+        self.assertEqual(clone["user:100"], 100)
+        self.assertEqual(len(clone), 101)
+
+    def test_get_set_del(self):
+        hm = RobinHoodHashMap()
+        ks = ["a", "b", "c", "d", "e"]
+        vs = [1, 2, 3, 4, 5]
+        for k, v in zip(ks, vs):
+            hm[k] = v
+            self.assertEqual(len(hm), v)
+            self.assertEqual(hm[k], v)
+
+        self.assertRaises(KeyError, lambda: hm["f"])
+        self.assertRaises(TypeError, lambda: hm[[1]])
+
+        expected_size = 5
+        for k in ks:
+            del hm[k]
+            expected_size -= 1
+            self.assertEqual(len(hm), expected_size)
+            self.assertRaises(KeyError, lambda: hm[k])
+
+    def test_iter(self):
+        hm = RobinHoodHashMap()
+        ks = ["a", "b", "c", "d", "e"]
+        vs = [1, 2, 3, 4, 5]
+        for c, i in zip(ks, vs):
+            hm[c] = i
+
+        self.assertEqual(set(hm.keys()), set(ks))
+        self.assertEqual(set(hm.values()), set(vs))
+        self.assertEqual(set(hm), set(zip(ks, vs)))
+
+    def test_against_dict(self):
+        rng = random.Random(0)
+        for hash_fn in [fnv1a_hash, lambda s, _: len(s)]:
+            hm = RobinHoodHashMap(hash_fn=hash_fn, seed=42)
+            d = {}
+            for _ in range(5000):
+                k = str(rng.randrange(300))
+                if rng.random() < 0.4 and k in d:
+                    del hm[k]
+                    del d[k]
+                else:
+                    v = rng.random()
+                    hm[k] = v
+                    d[k] = v
+                self.assertEqual(len(hm), len(d))
+            for k, v in d.items():
+                self.assertEqual(hm[k], v)
+            self.assertEqual(dict(zip(hm.keys(), hm.values())), d)
+
+    def test_generic_keys(self):
+        hm = RobinHoodHashMap(hash_fn=int_hash)
+        for i in range(1000):
+            hm[i] = str(i)
+        for i in range(1000):
+            self.assertEqual(hm[i], str(i))
+        for i in range(0, 1000, 2):
+            del hm[i]
+        self.assertEqual(set(hm.keys()), set(range(1, 1000, 2)))
+
+        hm = RobinHoodHashMap([((1, "a"), 1), ((1, "b"), 2)])
+        self.assertEqual(hm[(1, "a")], 1)
+        self.assertEqual(repr(RobinHoodHashMap([((1, "a"), 1)])), "{\n  (1, 'a'): 1\n}")
+
+    def test_probe_lengths(self):
+        hm = RobinHoodHashMap()
+        for i in range(10000):
+            hm[f"user:{i}"] = i
+        self.assertLessEqual(len(hm) / hm._max_size, 0.9)
+        # Distances are stored plus one.
+        dists = [c - 1 for c in hm._ctrl if c > 0]
+        self.assertLess(sum(dists) / len(dists), 3)
+
+    def test_degenerate_hash(self):
+        # Growing the table does not separate keys sharing their low hash
+        # bits, so long probe sequences must not make it grow.
+        for hash_fn in [lambda k, _: k << 40, lambda k, _: 0]:
+            hm = RobinHoodHashMap(hash_fn=hash_fn)
+            for i in range(300):
+                hm[i] = i
+            self.assertLessEqual(hm._max_size, 1024)
+            self.assertEqual(hm._n_writers, 0)
+            self.assertEqual(sorted(hm.snapshot()), [(i, i) for i in range(300)])
+            for i in range(0, 300, 2):
+                del hm[i]
+            for i in range(300):
+                self.assertEqual(hm.get_many([i])[0].is_some, i % 2 == 1)
+
+    def test_failed_write(self):
+        hm = RobinHoodHashMap([(0, 0)])
+
+        def failing_place(h: int, k: int, v: int):
+            raise MemoryError
+
+        hm._place = failing_place
+        self.assertRaises(MemoryError, hm.__setitem__, 1, 1)
+        self.assertEqual(hm._n_writers, 0)
+        self.assertEqual(len(hm), 1)
+        self.assertEqual(list(hm.snapshot()), [(0, 0)])
+
+    def test_batch(self):
+        hm = RobinHoodHashMap()
+        n_resizes = 0
+        resize = hm._resize
+
+        def counting_resize(max_size: int):
+            nonlocal n_resizes
+            n_resizes += 1
+            resize(max_size)
+
+        hm._resize = counting_resize
+        ks = [f"user:{i}" for i in range(10000)]
+        self.assertIs(hm.set_many((k, i) for i, k in enumerate(ks)), hm)
+        self.assertEqual(n_resizes, 1)
+        self.assertEqual(len(hm), 10000)
+
+        hm.update([("user:0", -1), ("user:0", -2), ("new", 0)])
+        self.assertEqual(len(hm), 10001)
+        self.assertEqual(
+            hm.get_many(["user:0", "user:1", "missing", "new"]),
+            [Option.Some(-2), Option.Some(1), Option.NONE(), Option.Some(0)],
+        )
+
+        self.assertEqual(hm.delete_many(ks[:5000] + ["missing", "user:0"]), 5000)
+        self.assertEqual(len(hm), 5001)
+        vs = hm.get_many(ks)
+        self.assertTrue(all(v.is_none for v in vs[:5000]))
+        self.assertEqual([v.unwrap() for v in vs[5000:]], list(range(5000, 10000)))
+
+    def test_independent_iterators(self):
+        hm = RobinHoodHashMap([(i, i) for i in range(100)])
+        pairs = [(a, b) for a, _ in hm for b, _ in hm]
+        self.assertEqual(len(pairs), 100 * 100)
+        self.assertEqual(set(hm.items()), {(i, i) for i in range(100)})
+
+        # Updating values is allowed, modifying the keys is not.
+        for k, v in hm.items():
+            hm[k] = v + 1
+        self.assertEqual(sorted(hm.values()), list(range(1, 101)))
+        with self.assertRaises(RuntimeError):
+            for k in hm.keys():
+                del hm[k]
+        with self.assertRaises(RuntimeError):
+            for k, _ in hm:
+                hm[-k - 1000] = 0
+
+        snapshot = hm.snapshot()
+        hm.delete_many(list(hm.keys()))
+        self.assertEqual(len(hm), 0)
+        self.assertEqual(len(list(snapshot)), 100)
+
+    def test_snapshot_while_writing(self):
+        hm = RobinHoodHashMap([(f"stable:{i}", i) for i in range(1000)])
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                hm[f"tmp:{i}"] = i
+                if i >= 100:
+                    del hm[f"tmp:{i - 100}"]
+                i += 1
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(50):
+                stable = [(k, v) for k, v in hm.snapshot() if k.startswith("stable")]
+                self.assertEqual(sorted(v for _, v in stable), list(range(1000)))
+                for k, v in stable:
+                    self.assertEqual(k, f"stable:{v}")
+        finally:
+            stop.set()
+            writer.join()
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
+from lists.array_doubly_linked_list import (
+    ArrayDoublyLinkedList as ArrayDoublyLinkedList,
+)
 from lists.array_list import ArrayList as ArrayList
 from lists.doubly_linked_list import DLLNode as DLLNode
 from lists.doubly_linked_list import DoublyLinkedList as DoublyLinkedList
+from lists.indexed_doubly_linked_list import IDLLNode as IDLLNode
+from lists.indexed_doubly_linked_list import (
+    IndexedDoublyLinkedList as IndexedDoublyLinkedList,
+)
 from lists.singly_linked_list import SinglyLinkedList as SinglyLinkedList
 from lists.singly_linked_list import SLLNode as SLLNode
+from lists.unrolled_linked_list import ULLNode as ULLNode
+from lists.unrolled_linked_list import UnrolledLinkedList as UnrolledLinkedList
@@ -0,0 +1,79 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+def split(node, n: int):
+    """
+    Cuts the chain of nodes starting at *node* after its *n*-th node, and
+    returns the rest of the chain (or `None`).
+    """
+    for _ in range(n - 1):
+        if node is None:
+            return None
+        node = node._nxt
+    if node is None:
+        return None
+    rest = node._nxt
+    node._nxt = None
+    return rest
+
+
+def merge_sort(hd, n: int, key: Callable[[Any], Any] | None, reverse: bool):
+    """
+    Sorts the chain of *n* nodes starting at *hd*, linked through their
+    `_nxt` attribute, using a stable bottom-up merge sort. Only the `_nxt`
+    links are updated.
+
+    Returns
+    -------
+    `tuple`
+        The new head and tail of the chain.
+    """
+    # Keys are computed once per node. Nodes hash by identity.
+    ks = None if key is None else {node: key(node._v) for node in iter_nodes(hd)}
+    tl = hd
+    width = 1
+    while width < n:
+        # Merges each pair of consecutive runs of *width* nodes.
+        new_hd = tl = None
+        rest = hd
+        while rest is not None:
+            left = rest
+            right = split(left, width)
+            rest = split(right, width)
+            while left is not None and right is not None:
+                if ks is None:
+                    kl, kr = left._v, right._v
+                else:
+                    kl, kr = ks[left], ks[right]
+                # Taking from the left run on ties keeps the sort stable.
+                if (kl < kr) if reverse else (kr < kl):
+                    node, right = right, right._nxt
+                else:
+                    node, left = left, left._nxt
+                if tl is None:
+                    new_hd = node
+                else:
+                    tl._nxt = node
+                tl = node
+            remaining = left if left is not None else right
+            if tl is None:
+                new_hd = remaining
+            else:
+                tl._nxt = remaining
+            while tl._nxt is not None:  # type: ignore
+                tl = tl._nxt  # type: ignore
+        hd = new_hd
+        width *= 2
+
+    return hd, tl
+
+
+def iter_nodes(hd) -> Iterator:
+    """
+    Yields the nodes of the chain starting at *hd*.
+    """
+    node = hd
+    while node is not None:
+        yield node
+        node = node._nxt
@@ -0,0 +1,29 @@
+def index_add(index: dict | None, node):
+    """
+    Adds *node* to the value *index* of a list, if any.
+    """
+    if index is not None:
+        index.setdefault(node._v, set()).add(node)
+
+
+def index_remove(index: dict | None, node):
+    """
+    Removes *node* from the value *index* of a list, if any.
+    """
+    if index is not None:
+        nodes = index[node._v]
+        nodes.discard(node)
+        if not nodes:
+            del index[node._v]
+
+
+def build_index(hd) -> dict:
+    """
+    Returns the value index of the chain of nodes starting at *hd*.
+    """
+    index: dict = {}
+    node = hd
+    while node is not None:
+        index.setdefault(node._v, set()).add(node)
+        node = node._nxt
+    return index
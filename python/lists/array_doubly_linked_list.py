@@ -0,0 +1,839 @@
+import copy
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from option import Option
+
+_MIN_CAPACITY = 8
+# The handle of no node, in the link arrays.
+_NIL = -1
+
+
+class ArrayDoublyLinkedList[T]:
+    """
+    A non-circular doubly-linked list, whose nodes are stored in parallel
+    NumPy arrays (a "struct of arrays") instead of one object per node.
+
+    Nodes are designated by handles, the integer indexes of their slots in
+    the arrays, which stay valid until the node is deleted. The slots of
+    deleted nodes are reused by later insertions.
+
+    With a native *dtype*, a node takes as little as 16 bytes (an 8-byte value
+    and two 4-byte links), and the links can be processed in bulk, e.g.
+    `reverse` swaps the two link arrays.
+
+    This class has the same API as `DoublyLinkedList`, with handles in place
+    of nodes.
+
+    Parameters
+    ----------
+    lst
+        (Optional) The initial elements.
+
+        Defaults to `[]`.
+    dtype
+        (Optional) The NumPy dtype of the values, see `ArrayList`.
+
+        Defaults to `object`.
+    """
+
+    def __init__(self, lst: list[T] = [], dtype: npt.DTypeLike = object):
+        self._dtype: np.dtype = np.dtype(dtype)
+        n = len(lst)
+        capacity = _MIN_CAPACITY
+        while capacity < n:
+            capacity *= 2
+        self._vals = np.empty(capacity, dtype=self._dtype)
+        self._prv = np.full(capacity, _NIL, dtype=np.int32)
+        self._nxt = np.full(capacity, _NIL, dtype=np.int32)
+        # Handle of the first free slot. The free slots are chained by their
+        # links, in both arrays as `reverse` swaps them.
+        self._free_hd: int = _NIL
+        self._hd: int = _NIL
+        self._tl: int = _NIL
+        self._size: int = n
+
+        if n > 0:
+            # Slots are filled in order, so the links are set in bulk.
+            # `np.fromiter` never treats nested sequences as extra dimensions.
+            self._vals[:n] = np.fromiter(lst, dtype=self._dtype, count=n)
+            self._prv[1:n] = np.arange(n - 1, dtype=np.int32)
+            self._nxt[: n - 1] = np.arange(1, n, dtype=np.int32)
+            self._hd = 0
+            self._tl = n - 1
+        self._chain_free(n, capacity)
+
+    def _chain_free(self, start: int, stop: int):
+        """
+        Makes the unused slots `[[start, stop - 1]]` the free list, which must
+        be empty.
+        """
+        if start == stop:
+            return
+        links = np.arange(start + 1, stop + 1, dtype=np.int32)
+        links[-1] = _NIL
+        self._prv[start:stop] = links
+        self._nxt[start:stop] = links
+        self._free_hd = start
+
+    def _grow(self):
+        """
+        Doubles the capacity of the arrays, making the new slots the free list.
+        """
+        capacity = len(self._vals)
+        new_capacity = 2 * capacity
+        vals = np.empty(new_capacity, dtype=self._dtype)
+        vals[:capacity] = self._vals
+        self._vals = vals
+        self._prv = np.concatenate([self._prv, np.empty(capacity, np.int32)])
+        self._nxt = np.concatenate([self._nxt, np.empty(capacity, np.int32)])
+        self._chain_free(capacity, new_capacity)
+
+    def _alloc(self, v: T) -> int:
+        """
+        Returns the handle of a free slot holding *v*, not linked yet.
+        """
+        if self._free_hd == _NIL:
+            self._grow()
+        node = self._free_hd
+        self._free_hd = int(self._nxt[node])
+        self._vals[node] = v
+        return node
+
+    def _release(self, node: int):
+        """
+        Pushes the unlinked *node* on the free list.
+        """
+        self._prv[node] = self._free_hd
+        self._nxt[node] = self._free_hd
+        if self._dtype.kind == "O":
+            # Do not keep the value alive.
+            self._vals[node] = None
+        self._free_hd = node
+
+    def _order(self) -> list[int]:
+        """
+        Returns the handles of the nodes, from head to tail.
+        """
+        nxt = self._nxt.tolist()
+        order = []
+        node = self._hd
+        while node != _NIL:
+            order.append(node)
+            node = nxt[node]
+        return order
+
+    def __repr__(self) -> str:
+        """
+        Printable representation of `ArrayDoublyLinkedList`, used for debugging.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(n)` where `n` is the length of the list.
+
+        Returns
+        -------
+        `str`
+        """
+        s = "["
+        for i, v in enumerate(self):
+            if i > 0:
+                s += "< "
+            s += f"{v}"
+            if i < self._size - 1:
+                s += " >"
+        s += "]"
+
+        return s
+
+    def __len__(self) -> int:
+        """
+        Returns the length of the list, i.e. its number of elements.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(1)` (constant).
+
+        Returns
+        -------
+        `int`
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        vals = self._vals
+        nxt = self._nxt
+        node = self._hd
+        while node != _NIL:
+            yield vals[node]
+            node = int(nxt[node])
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Returns whether the list is empty (has no elements) or not.
+
+        Returns
+        -------
+        `bool`
+            `True` if the list is empty, `False` otherwise.
+        """
+        return self._size == 0
+
+    def __bool__(self) -> bool:
+        """
+        Returns `True` if this list is non-empty, `False` otherwise.
+
+        Returns
+        -------
+        `bool`
+        """
+        return not self.is_empty
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ArrayDoublyLinkedList):
+            return False
+
+        if len(self) != len(other):
+            return False
+
+        for el1, el2 in zip(self, other):
+            if el1 != el2:
+                return False
+
+        return True
+
+    @property
+    def head(self) -> Option[int]:
+        """
+        Returns the handle of the first node, or `Option.NONE()` if the list
+        is empty.
+        """
+        return Option.NONE() if self._hd == _NIL else Option.Some(self._hd)
+
+    @property
+    def tail(self) -> Option[int]:
+        """
+        Returns the handle of the last node, or `Option.NONE()` if the list
+        is empty.
+        """
+        return Option.NONE() if self._tl == _NIL else Option.Some(self._tl)
+
+    def nxt(self, node: int) -> Option[int]:
+        """
+        Returns the handle of the node after *node*, or `Option.NONE()` if
+        *node* is the tail.
+        """
+        n = int(self._nxt[node])
+        return Option.NONE() if n == _NIL else Option.Some(n)
+
+    def prv(self, node: int) -> Option[int]:
+        """
+        Returns the handle of the node before *node*, or `Option.NONE()` if
+        *node* is the head.
+        """
+        p = int(self._prv[node])
+        return Option.NONE() if p == _NIL else Option.Some(p)
+
+    def get(self, node: int) -> T:
+        """
+        Returns the value of *node*.
+
+        Parameters
+        ----------
+        node
+
+        Returns
+        -------
+        `T`
+        """
+        return self._vals[node]
+
+    def get_at_idx(self, i: int) -> Option[int]:
+        """
+        Returns the node at index *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Complexity
+        ----------
+        Best-case time complexity is `O(1)` (accessing the head or the tail).
+        Worst-case time complexity is `O(n/2)`, which amounts to linear (accessing the middle element).
+
+        Parameters
+        ----------
+        i
+            The index (0-based) of the node to get.
+
+        Returns
+        -------
+        `Option[int]`
+            The node at index *i* if it exists, `Option.NONE()` otherwise.
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return Option.NONE()
+
+        if i <= (self._size - 1) // 2:
+            node = self._hd
+            for _ in range(i):
+                node = int(self._nxt[node])
+        else:
+            node = self._tl
+            for _ in range(self._size - 1 - i):
+                node = int(self._prv[node])
+
+        return Option.Some(node)
+
+    def get_by_val(self, v: T) -> Option[int]:
+        """
+        Returns the first node with value *v* if found.
+
+        Complexity
+        ----------
+        Best-case time complexity is `O(1)` (element with value *v* is the head).
+        Worst-case time complexity is `O(n)` (element with value *v* is the tail, or not found).
+
+        Parameters
+        ----------
+        v
+            The value of the node to get.
+
+        Returns
+        -------
+        `Option[int]`
+        """
+        vals = self._vals
+        nxt = self._nxt
+        node = self._hd
+        while node != _NIL:
+            if vals[node] == v:
+                return Option.Some(node)
+            node = int(nxt[node])
+        return Option.NONE()
+
+    def __getitem__(self, key) -> T:
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        res = self.get_at_idx(key)
+        if res.is_none:
+            raise IndexError()
+        return self._vals[res.unwrap()]
+
+    def set(self, node: int, v: T):
+        """
+        Sets the value of *node* to *v*.
+
+        Parameters
+        ----------
+        node
+        v
+        """
+        self._vals[node] = v
+
+    def set_at_idx(self, i: int, v: T) -> Option[int]:
+        """
+        Sets the value of node at index *i* to *v*.
+
+        Parameters
+        ----------
+        i
+        v
+
+        Returns
+        -------
+        `Option[int]`
+            The node at index *i*, or `Option.NONE()` if *i* out of bounds.
+        """
+        node = self.get_at_idx(i)
+        if node.is_some:
+            self._vals[node.unwrap()] = v
+        return node
+
+    def set_by_val(self, v: T, new_v: T) -> Option[int]:
+        """
+        Sets the value of first encountered node with value *v* to *new_v*.
+
+        Parameters
+        ----------
+        v
+        new_v
+
+        Returns
+        -------
+        `Option[int]`
+            The first encountered node with value *v*, or `Option.NONE()` if not found.
+        """
+        node = self.get_by_val(v)
+        if node.is_some:
+            self._vals[node.unwrap()] = new_v
+        return node
+
+    def __setitem__(self, key, value: T):
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        res = self.set_at_idx(key, value)
+        if res.is_none:
+            raise IndexError()
+
+    def _link_after(self, node: int, nbr: int):
+        """
+        Links the free *node* after *nbr*, or as the head if *nbr* is `_NIL`.
+        """
+        nxt = self._hd if nbr == _NIL else int(self._nxt[nbr])
+        self._prv[node] = nbr
+        self._nxt[node] = nxt
+        if nbr == _NIL:
+            self._hd = node
+        else:
+            self._nxt[nbr] = node
+        if nxt == _NIL:
+            self._tl = node
+        else:
+            self._prv[nxt] = node
+        self._size += 1
+
+    def insert(self, v: T, neighbor: Option[int], after: bool = True) -> int:
+        """
+        Inserts an element before or *after* the node *neighbor*.
+
+        Complexity
+        ----------
+        Time complexity is `O(1)` (amortized, as the arrays may grow).
+
+        Parameters
+        ----------
+        v
+            The element to insert.
+        neighbor
+            The neighbor of the node to create.
+
+            If `Option.NONE()`, inserts at the end of the list.
+        after
+            Whether to insert the new node after *neighbor* or before.
+
+        Returns
+        -------
+        `int`
+            The newly created node.
+        """
+        node = self._alloc(v)
+        if neighbor.is_none:
+            self._link_after(node, self._tl)
+        elif after:
+            self._link_after(node, neighbor.unwrap())
+        else:
+            self._link_after(node, int(self._prv[neighbor.unwrap()]))
+        return node
+
+    def insert_at_idx(self, i: int, v: T) -> Option[int]:
+        """
+        Inserts an element at index (0-based) *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the end of the list.
+
+        Complexity
+        ----------
+        Best-case time complexity is `O(1)` (inserting at the beginning or the end).
+        Worst-case time complexity is `O(n/2)`, which amounts to linear (inserting in the middle).
+
+        Parameters
+        ----------
+        i
+        v
+
+        Returns
+        -------
+        `Option[int]`
+            The inserted node or `Option.NONE()` if *i* is out of bounds.
+        """
+        if i == -1:
+            i = self._size
+        if i < 0 or i > self._size:
+            return Option.NONE()
+
+        prv = (
+            self._tl if i == self._size else int(self._prv[self.get_at_idx(i).unwrap()])
+        )
+        node = self._alloc(v)
+        self._link_after(node, prv)
+        return Option.Some(node)
+
+    def prepend(self, v: T) -> int:
+        """
+        Prepends an element to the list, meaning inserts it at the beginning of the list.
+
+        Parameters
+        ----------
+        v
+            The element to insert.
+
+        Returns
+        -------
+        `int`
+            The newly created node.
+        """
+        node = self._alloc(v)
+        self._link_after(node, _NIL)
+        return node
+
+    def append(self, v: T) -> int:
+        """
+        Appends an element to the list, meaning inserts it at the end of the list.
+
+        Parameters
+        ----------
+        v
+            The element to insert.
+
+        Returns
+        -------
+        `int`
+            The newly created node.
+        """
+        node = self._alloc(v)
+        self._link_after(node, self._tl)
+        return node
+
+    def delete(self, node: int) -> T:
+        """
+        Deletes a *node* from the list. Its handle must not be used anymore.
+
+        Note
+        ----
+        Time complexity (in all cases) is `O(1)`.
+
+        Parameters
+        ----------
+        node
+            The node to delete.
+
+        Returns
+        -------
+        `T`
+            The value of the deleted node.
+        """
+        prv = int(self._prv[node])
+        nxt = int(self._nxt[node])
+        if prv == _NIL:
+            self._hd = nxt
+        else:
+            self._nxt[prv] = nxt
+        if nxt == _NIL:
+            self._tl = prv
+        else:
+            self._prv[nxt] = prv
+
+        v = self._vals[node]
+        self._release(node)
+        self._size -= 1
+        return v
+
+    def delete_at_idx(self, i: int) -> Option[T]:
+        """
+        Deletes the node at index (0-based) *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Parameters
+        ----------
+        i
+            The index (0-based) of the node to delete.
+
+        Returns
+        -------
+        `Option[T]`
+            The value of the deleted node or `Option.NONE()` if *i* is out of
+            bounds.
+        """
+        node = self.get_at_idx(i)
+        if node.is_none:
+            return Option.NONE()
+        return Option.Some(self.delete(node.unwrap()))
+
+    def delete_by_val(self, v: T) -> Option[T]:
+        """
+        Deletes the first node with value *v*, if found.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `Option[T]`
+            The value of the deleted node or `Option.NONE()` if there is no
+            node with value *v*.
+        """
+        node = self.get_by_val(v)
+        if node.is_none:
+            return Option.NONE()
+        return Option.Some(self.delete(node.unwrap()))
+
+    def __delitem__(self, key):
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        res = self.delete_at_idx(key)
+        if res.is_none:
+            raise IndexError()
+
+    def rotate(self, r: int) -> "ArrayDoublyLinkedList[T]":
+        """
+        Rotates (in-place) the list so that so that item `i` becomes item `(i + r) mod n`,
+        for all `i` in `[[0, n-1]]` (`n` being the length of the list).
+
+        Complexity
+        ----------
+        Best-case time complexity is `O(1)` (offset congruent to zero modulo n).
+        Worst-case time complexity is `O(n/2)`, which amounts to linear (offset congruent to half of n modulo n).
+
+        Parameters
+        ----------
+        r
+            Rotation offset.
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        n = self._size
+        if n < 2 or r % n == 0:
+            return self
+
+        # The new head is the node at index `n - r`.
+        hd = self.get_at_idx(n - r % n).unwrap()
+        # Close the list into a ring, then open it before the new head.
+        self._nxt[self._tl] = self._hd
+        self._prv[self._hd] = self._tl
+        self._hd = hd
+        self._tl = int(self._prv[hd])
+        self._prv[hd] = _NIL
+        self._nxt[self._tl] = _NIL
+
+        return self
+
+    def reverse(self) -> "ArrayDoublyLinkedList[T]":
+        """
+        Reverses the order of elements in the list (in-place).
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(1)`, as the arrays of previous
+        and next links are swapped.
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        self._prv, self._nxt = self._nxt, self._prv
+        self._hd, self._tl = self._tl, self._hd
+        return self
+
+    def extend(self, lst: "ArrayDoublyLinkedList[T]") -> "ArrayDoublyLinkedList[T]":
+        """
+        Extends this list with elements in *lst*.
+
+        This is equivalent to appending the elements of *lst* one-by-one,
+        from left to right.
+
+        Parameters
+        ----------
+        lst
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        for el in list(lst):
+            self.append(el)
+        return self
+
+    def __add__(self, other) -> "ArrayDoublyLinkedList[T]":
+        """
+        Extends this list with elements in *other*.
+
+        Parameters
+        ----------
+        other
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if not isinstance(other, ArrayDoublyLinkedList):
+            raise TypeError("unsupported operand for operator +")
+        return self.extend(other)
+
+    def to_python_list(self) -> list[T]:
+        """
+        Converts this list to a Python list.
+
+        Returns
+        -------
+        `list[T]`
+        """
+        return self.to_numpy().tolist()
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns the values of this list, in order, as a new NumPy array.
+
+        The order of the nodes is found by following the links, then the
+        values are gathered at once.
+
+        Returns
+        -------
+        `np.ndarray`
+        """
+        return self._vals[np.asarray(self._order(), dtype=np.intp)]
+
+    def clone(self) -> "ArrayDoublyLinkedList[T]":
+        """
+        Returns a clone (i.e. a deep copy) of this list.
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+        """
+        return copy.deepcopy(self)
+
+    def selection_sort(self):
+        """
+        Sorts this list using selection sort (in-place).
+        """
+        vals = self._vals
+        order = self._order()
+        for i, n1 in enumerate(order):
+            nmin = n1
+            for n2 in order[i + 1 :]:
+                if vals[n2] < vals[nmin]:
+                    nmin = n2
+
+            vals[n1], vals[nmin] = vals[nmin], vals[n1]
+
+    def insertion_sort(self):
+        """
+        Sorts this list using insertion sort (in-place).
+
+        Nodes are relinked, so they keep their values.
+        """
+        if self._size <= 1:
+            return
+
+        vals = self._vals
+        n1 = int(self._nxt[self._hd])
+        while n1 != _NIL:
+            nxt = int(self._nxt[n1])
+            # Find the last node before *n1* not greater than it.
+            n2 = int(self._prv[n1])
+            while n2 != _NIL and vals[n1] < vals[n2]:
+                n2 = int(self._prv[n2])
+
+            if n2 != int(self._prv[n1]):
+                # Unlink *n1* and link it back after *n2*.
+                prv = int(self._prv[n1])
+                self._nxt[prv] = nxt
+                if nxt == _NIL:
+                    self._tl = prv
+                else:
+                    self._prv[nxt] = prv
+                self._size -= 1
+                self._link_after(n1, n2)
+            n1 = nxt
+
+    def merge_sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "ArrayDoublyLinkedList[T]":
+        """
+        Sorts this list (in-place), see `DoublyLinkedList.merge_sort`.
+
+        The handles are sorted by value with Python's sort (a stable merge
+        sort), then all the links are rewritten at once.
+
+        Parameters
+        ----------
+        key
+            (Optional) A function computing the key to compare elements by.
+
+            Defaults to `None`, meaning elements are compared directly.
+        reverse
+            (Optional) Whether to sort in descending order.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `ArrayDoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if self._size < 2:
+            return self
+
+        vals = self._vals.tolist()
+        order = self._order()
+        if key is None:
+            order.sort(key=vals.__getitem__, reverse=reverse)
+        else:
+            order.sort(key=lambda node: key(vals[node]), reverse=reverse)
+
+        nodes = np.asarray(order, dtype=np.int32)
+        self._nxt[nodes[:-1]] = nodes[1:]
+        self._nxt[nodes[-1]] = _NIL
+        self._prv[nodes[1:]] = nodes[:-1]
+        self._prv[nodes[0]] = _NIL
+        self._hd = order[0]
+        self._tl = order[-1]
+        return self
+
+    sort = merge_sort
+
+    def quicksort(self):
+        """
+        Sorts this list using quicksort (in-place).
+        """
+        order = self._order()
+        ArrayDoublyLinkedList._quicksort(self._vals, order, 0, len(order) - 1)
+
+    @staticmethod
+    def _quicksort(vals: np.ndarray, order: list[int], lo: int, hi: int):
+        """
+        Sorts the values of the nodes `order[lo:hi + 1]`, by swapping values.
+        """
+        while lo < hi:
+            # The middle value is taken as pivot, to avoid the worst case on
+            # already sorted lists.
+            mid = (lo + hi) // 2
+            vals[order[mid]], vals[order[hi]] = vals[order[hi]], vals[order[mid]]
+            pivot = vals[order[hi]]
+            i = lo
+            for j in range(lo, hi):
+                if vals[order[j]] <= pivot:
+                    vals[order[i]], vals[order[j]] = vals[order[j]], vals[order[i]]
+                    i += 1
+            vals[order[i]], vals[order[hi]] = vals[order[hi]], vals[order[i]]
+
+            # Recurse on the smaller side, loop on the larger one.
+            if i - lo < hi - i:
+                ArrayDoublyLinkedList._quicksort(vals, order, lo, i - 1)
+                lo = i + 1
+            else:
+                ArrayDoublyLinkedList._quicksort(vals, order, i + 1, hi)
+                hi = i - 1
@@ -1,19 +1,202 @@
 import copy
-import random
+from collections.abc import Buffer, Callable, Collection, Sequence
+from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 from option import Option
 
+_MIN_CAPACITY = 8
+# Ranges at most this long are sorted with insertion sort by `_introsort`.
+_INSERTION_SORT_CUTOFF = 16
+
+
+def _swap(ks: list, vs: list | None, i: int, j: int):
+    ks[i], ks[j] = ks[j], ks[i]
+    if vs is not None:
+        vs[i], vs[j] = vs[j], vs[i]
+
+
+def _insertion_sort(ks: list, vs: list | None, lo: int, hi: int):
+    for i in range(lo + 1, hi + 1):
+        k = ks[i]
+        v = vs[i] if vs is not None else None
+        j = i - 1
+        while j >= lo and k < ks[j]:
+            ks[j + 1] = ks[j]
+            if vs is not None:
+                vs[j + 1] = vs[j]
+            j -= 1
+        ks[j + 1] = k
+        if vs is not None:
+            vs[j + 1] = v
+
+
+def _is_sorted(ks: list, lo: int, hi: int) -> bool:
+    for i in range(lo, hi):
+        if ks[i + 1] < ks[i]:
+            return False
+    return True
+
+
+def _sift_down(ks: list, vs: list | None, lo: int, i: int, n: int):
+    # *i* and *n* are relative to *lo*, the root of the heap.
+    while True:
+        i_child = 2 * i + 1
+        if i_child >= n:
+            return
+        if i_child + 1 < n and ks[lo + i_child] < ks[lo + i_child + 1]:
+            i_child += 1
+        if not ks[lo + i] < ks[lo + i_child]:
+            return
+        _swap(ks, vs, lo + i, lo + i_child)
+        i = i_child
+
+
+def _heapsort(ks: list, vs: list | None, lo: int, hi: int):
+    n = hi - lo + 1
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down(ks, vs, lo, i, n)
+    for end in range(n - 1, 0, -1):
+        _swap(ks, vs, lo, lo + end)
+        _sift_down(ks, vs, lo, 0, end)
+
+
+def _partition3(ks: list, vs: list | None, lo: int, hi: int) -> tuple[int, int]:
+    """
+    Partitions *ks* (and *vs* alongside) from index *lo* to index *hi*
+    (included) in three parts: keys less than, equal to and greater than
+    a median-of-three pivot.
+
+    Returns the bounds `(lt, gt)` of the middle part (both included).
+    """
+    mid = (lo + hi) // 2
+    a, b, c = ks[lo], ks[mid], ks[hi]
+    if a < b:
+        pivot = b if b < c else (c if a < c else a)
+    else:
+        pivot = a if a < c else (c if b < c else b)
+
+    lt = lo
+    i = lo
+    gt = hi
+    while i <= gt:
+        k = ks[i]
+        if k < pivot:
+            _swap(ks, vs, lt, i)
+            lt += 1
+            i += 1
+        elif pivot < k:
+            _swap(ks, vs, i, gt)
+            gt -= 1
+        else:
+            i += 1
+
+    return lt, gt
+
+
+def _introsort(ks: list, vs: list | None, lo: int, hi: int):
+    """
+    Sorts *ks* from index *lo* to index *hi* (included) using introsort,
+    applying the same moves to *vs* if given.
+
+    The quicksort uses three-way partitioning, so that runs of equal keys
+    are settled in one pass, and always continues with the smaller part,
+    so that at most `O(log n)` ranges are pending. Ranges already in order are
+    detected and left as is. It falls back to heapsort when the partitions
+    degenerate, and to insertion sort on small ranges.
+    Only the `<` operator is used to compare keys.
+    """
+    n = hi - lo + 1
+    if n < 2:
+        return
+
+    pending = [(lo, hi, 2 * n.bit_length())]
+    while pending:
+        lo, hi, depth = pending.pop()
+        while True:
+            if hi - lo < _INSERTION_SORT_CUTOFF:
+                _insertion_sort(ks, vs, lo, hi)
+                break
+            if depth == 0:
+                _heapsort(ks, vs, lo, hi)
+                break
+            # Cheap on unsorted ranges, as it stops at the first inversion.
+            if _is_sorted(ks, lo, hi):
+                break
+            depth -= 1
+
+            lt, gt = _partition3(ks, vs, lo, hi)
+            if lt - lo < hi - gt:
+                pending.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                pending.append((lo, lt - 1, depth))
+                lo = gt + 1
+
 
 class ArrayList[T]:
-    def __init__(self, lst: list[T] = []):
-        self._size: int = len(lst)
-        self._capacity: int = 8
-        while self._size >= self._capacity:
-            self._capacity *= 2
-        self._arr = np.empty(self._capacity, dtype=object)
-        for i in range(self._size):
-            self._arr[i] = lst[i]
+    """
+    A dynamic array, backed by a NumPy array.
+
+    Parameters
+    ----------
+    lst
+        (Optional) The initial elements, as any collection of known length
+        (e.g. a list, another `ArrayList` or a NumPy array) or any object
+        supporting the buffer protocol (e.g. `bytes` or `array.array`).
+
+        They are copied in bulk, without a Python-level loop.
+
+        Defaults to `[]`.
+    dtype
+        (Optional) The NumPy dtype of the backing array.
+
+        With the default `object` dtype, any Python value can be stored.
+        With a native dtype (e.g. `np.int64`, `np.float64` or `"S16"`),
+        elements are stored unboxed, which uses less memory and enables
+        vectorized equality tests, searches, copies and sorts. Values are then
+        returned as NumPy scalars, and are subject to NumPy's conversion rules
+        (e.g. byte strings longer than the dtype's width are truncated).
+
+        Defaults to `object`.
+    growth_factor
+        (Optional) The factor by which the capacity is multiplied when
+        the backing array is full. Must be greater than 1.
+
+        Defaults to `2`.
+    shrink_threshold
+        (Optional) The occupancy (size over capacity) under which the backing
+        array is shrunk after a deletion, so that long-lived lists give back
+        memory. Must be in `[0, 1 / growth_factor)`, `0` disabling shrinking.
+
+        Defaults to `0.25`.
+    """
+
+    def __init__(
+        self,
+        lst: "Collection[T] | Buffer | ArrayList[T]" = [],
+        dtype: npt.DTypeLike = object,
+        growth_factor: float = 2,
+        shrink_threshold: float = 0.25,
+    ):
+        if growth_factor <= 1:
+            raise ValueError("growth_factor should be greater than 1")
+        if not 0 <= shrink_threshold < 1 / growth_factor:
+            raise ValueError("shrink_threshold should be in [0, 1 / growth_factor)")
+
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._typed: bool = self._dtype.kind != "O"
+        self._growth_factor: float = growth_factor
+        self._shrink_threshold: float = shrink_threshold
+        # The capacity under which the backing array is never shrunk.
+        self._min_capacity: int = _MIN_CAPACITY
+
+        src = self._to_array(lst)
+        self._size: int = len(src)
+        self._capacity: int = self._grown_capacity(_MIN_CAPACITY, self._size)
+        self._arr = np.empty(self._capacity, dtype=self._dtype)
+        self._arr[: self._size] = src
 
         self._it_idx: int = 0
 
@@ -52,12 +235,73 @@ class ArrayList[T]:
         if len1 != len2:
             return False
 
+        if self._typed and other._typed:
+            return bool(np.array_equal(self._arr[:len1], other._arr[:len2]))
+
         for i in range(len1):
             if self._arr[i] != other._arr[i]:
                 return False
 
         return True
 
+    def _grown_capacity(self, capacity: int, n: int) -> int:
+        """
+        Returns the capacity obtained by growing *capacity* geometrically
+        until it can hold *n* elements.
+        """
+        while n > capacity:
+            capacity = max(capacity + 1, int(capacity * self._growth_factor))
+        return capacity
+
+    def _realloc(self, capacity: int):
+        """
+        Moves the elements to a new backing array of the given *capacity*,
+        copying them in a single block.
+        """
+        new_arr = np.empty(capacity, dtype=self._dtype)
+        new_arr[: self._size] = self._arr[: self._size]
+        self._arr = new_arr
+        self._capacity = capacity
+
+    def _ensure_capacity(self, n: int):
+        """
+        Grows the backing array (if needed) so that it can hold at least
+        *n* elements.
+        """
+        if n > self._capacity:
+            self._realloc(self._grown_capacity(self._capacity, n))
+
+    def _maybe_shrink(self):
+        """
+        Shrinks the backing array if its occupancy fell under the shrink
+        threshold, leaving room to grow by the growth factor.
+        """
+        if (
+            self._capacity > self._min_capacity
+            and self._size < self._shrink_threshold * self._capacity
+        ):
+            capacity = int(self._size * self._growth_factor)
+            self._realloc(max(capacity, self._min_capacity))
+
+    def _to_array(self, vs: "Collection[T] | Buffer | ArrayList[T]") -> np.ndarray:
+        """
+        Returns *vs* as a 1-D NumPy array with the dtype of this list.
+        """
+        if vs is self:
+            # Shifting elements would otherwise overwrite the source.
+            return self._arr[: self._size].copy()
+        if isinstance(vs, ArrayList):
+            return vs._arr[: vs._size]
+        if isinstance(vs, np.ndarray):
+            return vs.astype(self._dtype, copy=False)
+        if isinstance(vs, Buffer):
+            return np.asarray(memoryview(vs)).astype(self._dtype, copy=False)
+        if self._typed and isinstance(vs, Sequence):
+            return np.asarray(vs, dtype=self._dtype)
+        # `np.fromiter` (unlike `np.asarray`) never treats nested sequences
+        # as extra dimensions.
+        return np.fromiter(vs, dtype=self._dtype, count=len(vs))
+
     def __bool__(self) -> bool:
         """
         Returns `True` if this list is non-empty, `False` otherwise.
@@ -75,6 +319,56 @@ class ArrayList[T]:
         """
         return self._size == 0
 
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The NumPy dtype of the array backing this list.
+        """
+        return self._dtype
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of elements this list can hold without reallocating.
+        """
+        return self._capacity
+
+    def reserve(self, n: int) -> "ArrayList[T]":
+        """
+        Makes room for at least *n* elements, so that growing this list up to
+        *n* elements will not reallocate.
+
+        The reserved capacity is kept by automatic shrinking, until
+        `shrink_to_fit` is called.
+
+        Parameters
+        ----------
+        n
+
+        Returns
+        -------
+        `ArrayList[T]`
+            This list (useful for chaining operations).
+        """
+        self._min_capacity = max(self._min_capacity, n)
+        if n > self._capacity:
+            self._realloc(n)
+        return self
+
+    def shrink_to_fit(self) -> "ArrayList[T]":
+        """
+        Releases the unused capacity of this list, including any capacity
+        previously reserved with `reserve`.
+
+        Returns
+        -------
+        `ArrayList[T]`
+            This list (useful for chaining operations).
+        """
+        self._min_capacity = _MIN_CAPACITY
+        self._realloc(max(self._size, _MIN_CAPACITY))
+        return self
+
     def get_at_idx(self, i: int) -> Option[T]:
         """
         Returns the value at index *i* in this list.
@@ -122,6 +416,12 @@ class ArrayList[T]:
         `Option[int]`
             The index of *v* if found, `Option.NONE` otherwise.
         """
+        if self._typed:
+            matches = np.flatnonzero(self._arr[: self._size] == v)
+            if len(matches) == 0:
+                return Option.NONE()
+            return Option.Some(int(matches[0]))
+
         for i in range(self._size):
             if self._arr[i] == v:
                 return Option.Some(i)
@@ -193,9 +493,44 @@ class ArrayList[T]:
         if i < 0 or i >= self._size:
             return self
 
-        for j in range(i, self._size - 1):
-            self._arr[j] = self._arr[j + 1]
-        self._size -= 1
+        return self.delete_range(i, i)
+
+    def delete_range(self, start: int, end: int = -1) -> "ArrayList[T]":
+        """
+        Deletes values from index *start* to index *end* (included).
+
+        The elements after *end* are shifted left in a single block move.
+
+        If *start* or *end* is out of bounds, or if *start* is greater than
+        *end*, nothing will be done and the function will exit *without* error.
+
+        Note
+        ----
+        A value of -1 for *end* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Parameters
+        ----------
+        start
+        end
+
+        Returns
+        -------
+        `ArrayList[T]`
+            This list (useful for chaining operations).
+        """
+        if end == -1:
+            end = self._size - 1
+        if start < 0 or end >= self._size or start > end:
+            return self
+
+        n = end - start + 1
+        self._arr[start : self._size - n] = self._arr[end + 1 : self._size]
+        if not self._typed:
+            # Drop references to the deleted objects.
+            self._arr[self._size - n : self._size] = None
+        self._size -= n
+        self._maybe_shrink()
 
         return self
 
@@ -237,29 +572,57 @@ class ArrayList[T]:
         if i < 0 or i > self._size:
             return self
 
-        should_realloc = False
-        while self._size >= self._capacity:
-            self._capacity *= 2
-            should_realloc = True
-
-        if should_realloc:
-            new_arr = np.empty(self._capacity, dtype=object)
-            for j in range(i):
-                new_arr[j] = self._arr[j]
-            new_arr[i] = v
-            for j in range(i, self._size):
-                new_arr[j + 1] = self._arr[j]
-            self._arr = new_arr
-        else:
-            # offset elements starting from *i*
-            for j in range(self._size, i, -1):
-                self._arr[j] = self._arr[j - 1]
-            # then insert *v* at *i*
-            self._arr[i] = v
+        self._ensure_capacity(self._size + 1)
+        # offset elements starting from *i*
+        self._arr[i + 1 : self._size + 1] = self._arr[i : self._size]
+        # then insert *v* at *i*
+        self._arr[i] = v
 
         self._size += 1
         return self
 
+    def insert_many(
+        self, i: int, vs: "Collection[T] | Buffer | ArrayList[T]"
+    ) -> "ArrayList[T]":
+        """
+        Inserts values *vs* at index *i*, the first value of *vs* ending up at
+        index *i*.
+
+        The elements from *i* onward are shifted right in a single block move,
+        whatever the number of inserted values.
+
+        If *i* is out of bounds, nothing will be done and the
+        function will exit *without* error.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and means insert in
+        last position.
+
+        Parameters
+        ----------
+        i
+        vs
+
+        Returns
+        -------
+        `ArrayList[T]`
+            This list (useful for chaining operations).
+        """
+        if i == -1:
+            i = self._size
+        if i < 0 or i > self._size:
+            return self
+
+        src = self._to_array(vs)
+        n = len(src)
+        self._ensure_capacity(self._size + n)
+        self._arr[i + n : self._size + n] = self._arr[i : self._size]
+        self._arr[i : i + n] = src
+
+        self._size += n
+        return self
+
     def prepend(self, v: T) -> "ArrayList[T]":
         """
         Prepends *v* to this list, i.e. inserts it at the *beginning* of this list.
@@ -306,10 +669,7 @@ class ArrayList[T]:
         `ArrayList[T]`
             This list (useful for chaining operations).
         """
-        for i in range(len(arr)):
-            self.append(arr._arr[i])
-
-        return self
+        return self.insert_many(self._size, arr)
 
     def __add__(self, other) -> "ArrayList[T]":
         """
@@ -339,11 +699,27 @@ class ArrayList[T]:
         -------
         `list[T]`
         """
+        if self._typed:
+            return self._arr[: self._size].tolist()
+
         py_lst = []
         for i in range(self._size):
             py_lst.append(self._arr[i])
         return py_lst
 
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns a NumPy view on the elements of this list.
+
+        Modifying the view modifies this list, until this list reallocates
+        its backing array.
+
+        Returns
+        -------
+        `np.ndarray`
+        """
+        return self._arr[: self._size]
+
     def clone(self) -> "ArrayList[T]":
         """
         Returns a clone (i.e. a deep copy) of this list.
@@ -385,40 +761,59 @@ class ArrayList[T]:
             self._arr[j] = self._arr[i_min]
             self._arr[i_min] = tmp
 
-    def _partition(self, start: int, end: int, pivot: int) -> int:
-        # Place the pivot value at the end of the array.
-        tmp = self._arr[pivot]
-        self._arr[pivot] = self._arr[end]
-        self._arr[end] = tmp
-
-        i_pivot = start
-        for i in range(start, end):
-            if self._arr[i] <= self._arr[end]:
-                tmp = self._arr[i]
-                self._arr[i] = self._arr[i_pivot]
-                self._arr[i_pivot] = tmp
-                i_pivot += 1
-
-        # Put the pivot value where it should be.
-        tmp = self._arr[i_pivot]
-        self._arr[i_pivot] = self._arr[end]
-        self._arr[end] = tmp
-
-        return i_pivot
-
-    def _quicksort_rec(self, start: int, end: int):
-        if start >= end:
-            return
+    def sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "ArrayList[T]":
+        """
+        Sorts this list (in-place) using introsort.
+
+        The sort is not stable.
+
+        Parameters
+        ----------
+        key
+            (Optional) A function computing the key to compare elements by.
+            It is called once per element.
+
+            Defaults to `None`, meaning elements are compared directly.
+        reverse
+            (Optional) Whether to sort in descending order.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `ArrayList[T]`
+            This list (useful for chaining operations).
+        """
+        n = self._size
+        if n < 2:
+            return self
 
-        pivot = random.randint(start, end)
-        pivot = self._partition(start, end, pivot)
-        self._quicksort_rec(start, pivot - 1)
-        self._quicksort_rec(pivot + 1, end)
+        if self._typed and key is None:
+            # NumPy's quicksort is an introsort running in native code.
+            self._arr[:n].sort(kind="quicksort")
+        else:
+            vs = self._arr[:n].tolist()
+            if key is None:
+                _introsort(vs, None, 0, n - 1)
+            else:
+                ks = [key(v) for v in vs]
+                _introsort(ks, vs, 0, n - 1)
+            self._arr[:n] = self._to_array(vs)
+
+        if reverse:
+            self._arr[:n] = self._arr[n - 1 :: -1]
+
+        return self
 
     def quicksort(self, start: int = 0, end: int = -1):
         """
         Sorts the elements from index *start* to index *end* (included) using quicksort.
 
+        Specifically, this is an introsort: a quicksort with three-way
+        partitioning and bounded recursion depth (see `sort`).
+
         Note
         ----
         A value of -1 for *end* is accepted and is equivalent to
@@ -432,7 +827,14 @@ class ArrayList[T]:
         if end == -1:
             end = self._size - 1
 
-        self._quicksort_rec(start, end)
+        if self._typed:
+            # NumPy's quicksort is an introsort running in native code.
+            self._arr[start : end + 1].sort(kind="quicksort")
+            return
+
+        vs = self._arr[start : end + 1].tolist()
+        _introsort(vs, None, 0, len(vs) - 1)
+        self._arr[start : end + 1] = self._to_array(vs)
 
     def insertion_sort(self, start: int = 0, end: int = -1):
         """
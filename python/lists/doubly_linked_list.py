@@ -1,8 +1,12 @@
 import copy
-from typing import Iterator
+from collections.abc import Callable
+from typing import Any, Iterator
 
 from option import Option
 
+from lists._merge_sort import merge_sort
+from lists._value_index import build_index, index_add, index_remove
+
 
 class DLLNode[T]:
     """
@@ -14,6 +18,8 @@ class DLLNode[T]:
         The value of the node.
     """
 
+    __slots__ = ("_v", "_prv", "_nxt")
+
     def __init__(self, v: T):
         self._v: T = v
         self._prv: DLLNode[T] | None = None
@@ -68,12 +74,28 @@ class DLLIterator[T](Iterator):
 class DoublyLinkedList[T]:
     """
     A non-circular doubly-linked list.
+
+    Parameters
+    ----------
+    lst
+        (Optional) The initial elements.
+
+        Defaults to `[]`.
+    index_values
+        (Optional) Whether to maintain an index from values to their nodes,
+        making `get_by_val`, `set_by_val`, `delete_by_val` and `contains`
+        take `O(1)` time. Values must then be hashable, and the node found
+        for a value is any node with that value rather than the first one.
+
+        Defaults to `False`.
     """
 
-    def __init__(self, lst: list[T] = []):
+    def __init__(self, lst: list[T] = [], index_values: bool = False):
         self._hd: DLLNode[T] | None = None
         self._tl: DLLNode[T] | None = None
         self._size: int = 0
+        # Nodes by value, if values are indexed.
+        self._index: dict[T, set[DLLNode[T]]] | None = {} if index_values else None
 
         for el in lst:
             self.append(el)
@@ -247,6 +269,9 @@ class DoublyLinkedList[T]:
         Best-case time complexity is `O(1)` (element with value *val* is the head).
         Worst-case time complexity is `O(n)` (element with value *val* is the tail, or not found).
 
+        If values are indexed, time complexity (in all cases) is `O(1)`, but
+        the node returned is any node with value *v*.
+
         Parameters
         ----------
         v
@@ -256,6 +281,12 @@ class DoublyLinkedList[T]:
         -------
         `Option[DLLNode[T]]`
         """
+        if self._index is not None:
+            nodes = self._index.get(v)
+            if not nodes:
+                return Option.NONE()
+            return Option.Some(next(iter(nodes)))
+
         if self._size == 0:
             return Option.NONE()
         assert self._hd is not None
@@ -277,6 +308,29 @@ class DoublyLinkedList[T]:
             raise IndexError()
         return res.unwrap()._v
 
+    def contains(self, v: T) -> bool:
+        """
+        Returns whether this list has an element with value *v*.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n)`, or `O(1)` if values are indexed.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `bool`
+        """
+        if self._index is not None:
+            return v in self._index
+        return self.get_by_val(v).is_some
+
+    def __contains__(self, v) -> bool:
+        return self.contains(v)
+
     def set(self, node: DLLNode[T], v: T):
         """
         Sets the value of *node* to *v*.
@@ -286,7 +340,9 @@ class DoublyLinkedList[T]:
         node
         v
         """
+        index_remove(self._index, node)
         node._v = v
+        index_add(self._index, node)
 
     def set_at_idx(self, i: int, v: T) -> Option[DLLNode[T]]:
         """
@@ -307,7 +363,7 @@ class DoublyLinkedList[T]:
             return Option.NONE()
 
         node = node.unwrap()
-        node._v = v
+        self.set(node, v)
         return Option.Some(node)
 
     def set_by_val(self, v: T, new_v: T) -> Option[DLLNode[T]]:
@@ -329,7 +385,7 @@ class DoublyLinkedList[T]:
             return Option.NONE()
 
         node = node.unwrap()
-        node._v = new_v
+        self.set(node, new_v)
         return Option.Some(node)
 
     def __setitem__(self, key, value: T):
@@ -370,6 +426,7 @@ class DoublyLinkedList[T]:
             The newly created node.
         """
         new_node = DLLNode(v)
+        index_add(self._index, new_node)
 
         if neighbor == Option.NONE():
             if self._hd is None:
@@ -435,6 +492,7 @@ class DoublyLinkedList[T]:
 
         # Instantiate new node.
         new_node = DLLNode(v)
+        index_add(self._index, new_node)
 
         # Handle case where list is empty.
         if self._size == 0:
@@ -547,6 +605,36 @@ class DoublyLinkedList[T]:
 
         # Decrement size.
         self._size -= 1
+        index_remove(self._index, node)
+
+    def move_to_front(self, node: DLLNode[T]):
+        """
+        Moves *node* to the beginning of the list, relinking it rather than
+        creating a new node, so that references to it stay valid.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(1)`.
+
+        Parameters
+        ----------
+        node
+            The node to move, which must be in the list.
+        """
+        if node is self._hd:
+            return
+
+        # Not being the head, the node has a previous node.
+        node._prv._nxt = node._nxt  # type: ignore
+        if node is self._tl:
+            self._tl = node._prv
+        else:
+            node._nxt._prv = node._prv  # type: ignore
+
+        node._prv = None
+        node._nxt = self._hd
+        self._hd._prv = node  # type: ignore
+        self._hd = node
 
     def delete_at_idx(self, i: int) -> Option[DLLNode[T]]:
         """
@@ -588,6 +676,7 @@ class DoublyLinkedList[T]:
             self._hd = None
             self._tl = None
             self._size -= 1
+            index_remove(self._index, node)
             return Option.Some(node)
 
         # Handle case when deleting at the beginning of the list.
@@ -596,6 +685,7 @@ class DoublyLinkedList[T]:
             self._hd._nxt._prv = None  # type: ignore
             self._hd = self._hd._nxt  # type: ignore
             self._size -= 1
+            index_remove(self._index, node)
             return Option.Some(node)
         # Handle case when deleting at the end of the list.
         if i == self._size - 1:
@@ -603,6 +693,7 @@ class DoublyLinkedList[T]:
             self._tl._prv._nxt = None  # type: ignore
             self._tl = self._tl._prv  # type: ignore
             self._size -= 1
+            index_remove(self._index, node)
             return Option.Some(node)
 
         # Handle the "normal" case.
@@ -612,6 +703,7 @@ class DoublyLinkedList[T]:
         node._nxt._prv = node._prv  # type: ignore
         # Decrement size.
         self._size -= 1
+        index_remove(self._index, node)
 
         return Option.Some(node)
 
@@ -624,6 +716,9 @@ class DoublyLinkedList[T]:
         Best-case time complexity is `O(1)` (element with value *v* is the head).
         Worst-case time complexity is `O(n)` (element with value *v* is the tail, or not found).
 
+        If values are indexed, time complexity (in all cases) is `O(1)`, but
+        the node deleted is any node with value *v*.
+
         Parameters
         ----------
         v
@@ -633,6 +728,12 @@ class DoublyLinkedList[T]:
         `Option[DLLNode[T]]`
             The deleted node or `Option.NONE()` if there is no node with value *v*.
         """
+        if self._index is not None:
+            node = self.get_by_val(v)
+            if node.is_some:
+                self.delete(node.unwrap())
+            return node
+
         if self._size == 0:
             return Option.NONE()
 
@@ -657,6 +758,7 @@ class DoublyLinkedList[T]:
 
         # Decrement size.
         self._size -= 1
+        index_remove(self._index, node)
 
         return Option.Some(node)
 
@@ -846,6 +948,10 @@ class DoublyLinkedList[T]:
             nmin._v = tmp
             n1 = n1._nxt
 
+        if self._index is not None:
+            # Values were swapped between nodes.
+            self._index = build_index(self._hd)
+
     def insertion_sort(self):
         """
         Sorts this list using insertion sort (in-place).
@@ -882,20 +988,77 @@ class DoublyLinkedList[T]:
                 self._hd = n
             n2._prv = n
 
+    def merge_sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "DoublyLinkedList[T]":
+        """
+        Sorts this list (in-place) using a bottom-up merge sort.
+
+        The sort is stable, and nodes are relinked rather than having their
+        values swapped, so each node keeps its value.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(n log(n))`, with `O(1)` extra
+        space if *key* is `None` (`O(n)` otherwise, to hold the keys).
+
+        Parameters
+        ----------
+        key
+            (Optional) A function computing the key to compare elements by.
+            It is called once per element.
+
+            Defaults to `None`, meaning elements are compared directly.
+        reverse
+            (Optional) Whether to sort in descending order.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `DoublyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        # Sorts following the next links only, then restores the previous
+        # links.
+        self._hd, self._tl = merge_sort(self._hd, self._size, key, reverse)
+        prv = None
+        node = self._hd
+        while node is not None:
+            node._prv = prv
+            prv = node
+            node = node._nxt
+        return self
+
+    sort = merge_sort
+
     def quicksort(self):
         """
         Sorts this list using quicksort (in-place).
+
+        The middle node is taken as pivot, and recursion is on the smaller
+        partition only, so the recursion depth is at most `log(n)`.
         """
         DoublyLinkedList._quicksort(self._hd, self._tl, self._size)
+        if self._index is not None:
+            # Values were swapped between nodes.
+            self._index = build_index(self._hd)
 
     @staticmethod
     def _quicksort(hd: DLLNode[T] | None, tl: DLLNode[T] | None, cnt: int):
-        if cnt <= 1:
-            return
-
-        pivot, pidx = DoublyLinkedList._partition(hd, tl, tl)  # type: ignore
-        DoublyLinkedList._quicksort(hd, pivot._prv, pidx)
-        DoublyLinkedList._quicksort(pivot._nxt, tl, cnt - pidx - 1)
+        while cnt > 1:
+            # Finding the middle node costs as much as the partitioning, and
+            # avoids the worst case on already sorted lists.
+            mid = hd
+            for _ in range(cnt // 2):
+                mid = mid._nxt  # type: ignore
+            pivot, pidx = DoublyLinkedList._partition(hd, tl, mid)  # type: ignore
+            if pidx < cnt - pidx - 1:
+                DoublyLinkedList._quicksort(hd, pivot._prv, pidx)
+                hd, cnt = pivot._nxt, cnt - pidx - 1
+            else:
+                DoublyLinkedList._quicksort(pivot._nxt, tl, cnt - pidx - 1)
+                tl, cnt = pivot._prv, pidx
 
     @staticmethod
     def _partition(
@@ -0,0 +1,452 @@
+import random
+from collections.abc import Callable
+from typing import Any
+
+from option import Option
+
+from lists.doubly_linked_list import DLLNode, DoublyLinkedList
+from lists._value_index import build_index, index_add, index_remove
+
+# Probability for a node to also be in the level above.
+_P = 0.25
+_MAX_LEVEL = 32
+
+
+class IDLLNode[T](DLLNode[T]):
+    """
+    A node of `IndexedDoublyLinkedList[T]`.
+
+    On top of its links in the list, a node has a tower of forward links,
+    one per level of the skip list it belongs to. Each forward link comes
+    with its span, the number of positions it skips.
+
+    Parameters
+    ----------
+    v
+        The value of the node.
+    height
+        The number of levels of the node.
+    """
+
+    __slots__ = ("_fwd", "_span")
+
+    def __init__(self, v: T, height: int):
+        super().__init__(v)
+        # Level 0 is the list itself, so `_fwd[0]` is the same as `_nxt`.
+        self._fwd: list[IDLLNode[T] | None] = [None] * height
+        # The span of a link to `None` is the number of nodes after this one.
+        self._span: list[int] = [0] * height
+
+
+def _random_height() -> int:
+    height = 1
+    while height < _MAX_LEVEL and random.random() < _P:
+        height += 1
+    return height
+
+
+class IndexedDoublyLinkedList[T](DoublyLinkedList[T]):
+    """
+    A `DoublyLinkedList` indexed by an indexable skip list, making positional
+    access (`get_at_idx`, `set_at_idx`, `insert_at_idx`, `delete_at_idx` and
+    the item operators) `O(log(n))` expected instead of `O(n)`.
+
+    Nodes are still returned as handles, and finding the index of a node
+    (e.g. to delete it) is also `O(log(n))` expected. Operations relinking
+    the whole list (`rotate`, `reverse` and the sorts relinking nodes)
+    rebuild the index in `O(n)`.
+
+    Each node is in the skip list's level `l` with probability `0.25^l`, so
+    nodes have 1.33 forward links on average.
+
+    Parameters
+    ----------
+    lst
+    index_values
+        See `DoublyLinkedList`.
+    """
+
+    def __init__(self, lst: list[T] = [], index_values: bool = False):
+        super().__init__(index_values=index_values)
+        # Sentinel before the first node, as tall as the skip list can be.
+        self._header: IDLLNode[T] = IDLLNode(None, _MAX_LEVEL)  # type: ignore
+        # Number of levels in use.
+        self._level: int = 1
+
+        prv = None
+        for v in lst:
+            node = IDLLNode(v, _random_height())
+            if prv is None:
+                self._hd = node
+            else:
+                prv._nxt = node
+            node._prv = prv
+            prv = node
+        self._tl = prv
+        self._size = len(lst)
+        self._rebuild()
+        if index_values:
+            self._index = build_index(self._hd)
+
+    def _rebuild(self):
+        """
+        Relinks the skip list following the links of the list, keeping the
+        height of each node.
+        """
+        header = self._header
+        self._level = 1
+        last: list[IDLLNode[T]] = [header] * _MAX_LEVEL
+        last_pos = [0] * _MAX_LEVEL
+        pos = 0
+        node = self._hd
+        while node is not None:
+            pos += 1
+            height = len(node._fwd)  # type: ignore
+            self._level = max(self._level, height)
+            for lvl in range(height):
+                last[lvl]._fwd[lvl] = node  # type: ignore
+                last[lvl]._span[lvl] = pos - last_pos[lvl]
+                last[lvl] = node  # type: ignore
+                last_pos[lvl] = pos
+            node = node._nxt
+
+        for lvl in range(_MAX_LEVEL):
+            last[lvl]._fwd[lvl] = None
+            last[lvl]._span[lvl] = pos - last_pos[lvl]
+
+    def _predecessors(self, pos: int) -> tuple[list[IDLLNode[T]], list[int]]:
+        """
+        Returns, for each level in use, the last node before position *pos*
+        (1-based, the header being at position 0) and its position.
+        """
+        update: list[IDLLNode[T]] = [self._header] * self._level
+        ranks = [0] * self._level
+        node = self._header
+        rank = 0
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node._fwd[lvl]
+            while nxt is not None and rank + node._span[lvl] < pos:
+                rank += node._span[lvl]
+                node = nxt
+                nxt = node._fwd[lvl]
+            update[lvl] = node
+            ranks[lvl] = rank
+        return update, ranks
+
+    def _index_of(self, node: IDLLNode[T]) -> int:
+        """
+        Returns the index (0-based) of *node*, by following the tallest links
+        to the end of the list and counting the positions skipped.
+        """
+        n_after = 0
+        while True:
+            top = len(node._fwd) - 1
+            n_after += node._span[top]
+            nxt = node._fwd[top]
+            if nxt is None:
+                return self._size - 1 - n_after
+            node = nxt
+
+    def _insert_at(self, i: int, v: T) -> IDLLNode[T]:
+        """
+        Inserts a node with value *v* at index *i*, which must be in
+        `[[0, n]]`.
+        """
+        node = IDLLNode(v, _random_height())
+        self._link_at(i, node)
+        return node
+
+    def _link_at(self, i: int, node: IDLLNode[T]):
+        """
+        Links the detached *node* at index *i*, which must be in `[[0, n]]`.
+        """
+        index_add(self._index, node)
+        height = len(node._fwd)
+        header = self._header
+        if height > self._level:
+            # The header's links to `None` at the new levels skip all nodes.
+            for lvl in range(self._level, height):
+                header._fwd[lvl] = None
+                header._span[lvl] = self._size
+            self._level = height
+
+        pos = i + 1
+        update, ranks = self._predecessors(pos)
+        for lvl in range(height):
+            prv = update[lvl]
+            node._fwd[lvl] = prv._fwd[lvl]
+            node._span[lvl] = prv._span[lvl] - (pos - 1 - ranks[lvl])
+            prv._fwd[lvl] = node
+            prv._span[lvl] = pos - ranks[lvl]
+        for lvl in range(height, self._level):
+            update[lvl]._span[lvl] += 1
+
+        prv = update[0]
+        nxt = node._fwd[0]
+        node._prv = None if prv is header else prv
+        node._nxt = nxt
+        if prv is header:
+            self._hd = node
+        else:
+            prv._nxt = node
+        if nxt is None:
+            self._tl = node
+        else:
+            nxt._prv = node
+
+        self._size += 1
+
+    def _delete_at(self, i: int) -> IDLLNode[T]:
+        """
+        Deletes the node at index *i*, which must be in `[[0, n - 1]]`, and
+        returns it.
+        """
+        update, _ = self._predecessors(i + 1)
+        node: IDLLNode[T] = update[0]._fwd[0]  # type: ignore
+        height = len(node._fwd)
+        for lvl in range(height):
+            prv = update[lvl]
+            prv._span[lvl] += node._span[lvl] - 1
+            prv._fwd[lvl] = node._fwd[lvl]
+        for lvl in range(height, self._level):
+            update[lvl]._span[lvl] -= 1
+
+        prv = node._prv
+        nxt = node._nxt
+        if prv is None:
+            self._hd = nxt
+        else:
+            prv._nxt = nxt
+        if nxt is None:
+            self._tl = prv
+        else:
+            nxt._prv = prv
+
+        # Detach node from the list.
+        node._prv = None
+        node._nxt = None
+        node._fwd = [None] * height
+
+        self._size -= 1
+        index_remove(self._index, node)
+        return node
+
+    def get_at_idx(self, i: int) -> Option[DLLNode[T]]:
+        """
+        Returns the node at index *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        i
+            The index (0-based) of the node to get.
+
+        Returns
+        -------
+        `Option[DLLNode[T]]`
+            The node at index *i* if it exists, `Option.NONE()` otherwise.
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return Option.NONE()
+
+        update, _ = self._predecessors(i + 1)
+        return Option.Some(update[0]._fwd[0])
+
+    def index(self, node: DLLNode[T]) -> int:
+        """
+        Returns the index (0-based) of *node*.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        node
+
+        Returns
+        -------
+        `int`
+        """
+        return self._index_of(node)  # type: ignore
+
+    def insert(
+        self, v: T, neighbor: Option[DLLNode[T]], after: bool = True
+    ) -> DLLNode[T]:
+        """
+        Inserts an element before or *after* the node *neighbor*.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        v
+            The element to insert.
+        neighbor
+            The neighbor of the node to create.
+
+            If `Option.NONE()`, inserts at the end of the list.
+        after
+            Whether to insert the new node after *neighbor* or before.
+
+        Returns
+        -------
+        `DLLNode[T]`
+            The newly created node.
+        """
+        if neighbor.is_none:
+            return self._insert_at(self._size, v)
+        i = self._index_of(neighbor.unwrap())  # type: ignore
+        return self._insert_at(i + 1 if after else i, v)
+
+    def insert_at_idx(self, i: int, v: T) -> Option[DLLNode[T]]:
+        """
+        Inserts an element at index (0-based) *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the end of the list.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        i
+        v
+
+        Returns
+        -------
+        `Option[DLLNode[T]]`
+            The inserted node or `Option.NONE()` if *i* is out of bounds.
+        """
+        if i == -1:
+            i = self._size
+        if i < 0 or i > self._size:
+            return Option.NONE()
+        return Option.Some(self._insert_at(i, v))
+
+    def delete(self, node: DLLNode[T]):
+        """
+        Deletes a *node* from the list.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        node
+            The node to delete.
+        """
+        self._delete_at(self._index_of(node))  # type: ignore
+
+    def move_to_front(self, node: DLLNode[T]):
+        """
+        See `DoublyLinkedList.move_to_front`.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+        """
+        self._link_at(0, self._delete_at(self._index_of(node)))  # type: ignore
+
+    def delete_at_idx(self, i: int) -> Option[DLLNode[T]]:
+        """
+        Deletes the node at index (0-based) *i*.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Complexity
+        ----------
+        Expected time complexity is `O(log(n))`.
+
+        Parameters
+        ----------
+        i
+            The index (0-based) of the node to delete.
+
+        Returns
+        -------
+        `Option[DLLNode[T]]`
+            The deleted node or `Option.NONE()` if *i* is out of bounds.
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return Option.NONE()
+        return Option.Some(self._delete_at(i))
+
+    def delete_by_val(self, v: T) -> Option[DLLNode[T]]:
+        """
+        Deletes the first node with value *v*, if found.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n)` (finding the node), or
+        `O(log(n))` expected if values are indexed.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `Option[DLLNode[T]]`
+            The deleted node or `Option.NONE()` if there is no node with value *v*.
+        """
+        node = self.get_by_val(v)
+        if node.is_some:
+            self.delete(node.unwrap())
+        return node
+
+    def rotate(self, r: int) -> "IndexedDoublyLinkedList[T]":
+        """
+        See `DoublyLinkedList.rotate`. The index is rebuilt in `O(n)`.
+        """
+        super().rotate(r)
+        self._rebuild()
+        return self
+
+    def reverse(self) -> "IndexedDoublyLinkedList[T]":
+        """
+        See `DoublyLinkedList.reverse`. The index is rebuilt in `O(n)`.
+        """
+        super().reverse()
+        self._rebuild()
+        return self
+
+    def insertion_sort(self):
+        """
+        See `DoublyLinkedList.insertion_sort`. The index is rebuilt in `O(n)`.
+        """
+        super().insertion_sort()
+        self._rebuild()
+
+    def merge_sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "IndexedDoublyLinkedList[T]":
+        """
+        See `DoublyLinkedList.merge_sort`. The index is rebuilt in `O(n)`.
+        """
+        super().merge_sort(key, reverse)
+        self._rebuild()
+        return self
+
+    sort = merge_sort
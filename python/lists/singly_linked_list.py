@@ -1,8 +1,12 @@
 import copy
-from typing import Iterator
+from collections.abc import Callable, Iterable
+from typing import Any, Iterator
 
 from option import Option
 
+from lists._merge_sort import iter_nodes, merge_sort
+from lists._value_index import index_add, index_remove
+
 
 class SLLNode[T]:
     """
@@ -14,6 +18,8 @@ class SLLNode[T]:
         The value of the node.
     """
 
+    __slots__ = ("_v", "_nxt")
+
     def __init__(self, v: T):
         self._v: T = v
         self._nxt: SLLNode[T] | None = None
@@ -61,15 +67,79 @@ class SLLIterator[T](Iterator):
 
 class SinglyLinkedList[T]:
     """
-    A singly-linked list.
+    A singly-linked list, keeping track of its tail so that appending is
+    `O(1)`.
+
+    Parameters
+    ----------
+    lst
+        (Optional) The initial elements.
+
+        Defaults to `[]`.
+    index_values
+        (Optional) Whether to maintain an index from values to their nodes,
+        making `get_by_val`, `set_by_val` and `contains` take `O(1)` time
+        (`delete_by_val` still has to find the previous node). Values must
+        then be hashable, and the node found for a value is any node with
+        that value rather than the first one.
+
+        Defaults to `False`.
     """
 
-    def __init__(self, lst: list[T] = []):
+    def __init__(self, lst: list[T] = [], index_values: bool = False):
         self._hd: SLLNode[T] | None = None
+        self._tl: SLLNode[T] | None = None
         self._size: int = 0
+        # Nodes by value, if values are indexed.
+        self._index: dict[T, set[SLLNode[T]]] | None = {} if index_values else None
+
+        self._link_all(lst)
+
+    @classmethod
+    def from_iterable(
+        cls, vs: Iterable[T], index_values: bool = False
+    ) -> "SinglyLinkedList[T]":
+        """
+        Returns a new list with the elements of *vs*, linked in one pass.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(n)` where `n` is the number of
+        elements.
+
+        Parameters
+        ----------
+        vs
+        index_values
+            (Optional) See `SinglyLinkedList`.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `SinglyLinkedList[T]`
+        """
+        lst = cls(index_values=index_values)
+        lst._link_all(vs)
+        return lst
 
-        for i in range(len(lst) - 1, -1, -1):
-            self.prepend(lst[i])
+    def _link_all(self, vs: Iterable[T]):
+        """
+        Appends the elements of *vs*, linking each new node to the next one.
+        """
+        tl = self._tl
+        n = 0
+        for v in vs:
+            node = SLLNode(v)
+            index_add(self._index, node)
+            if tl is None:
+                self._hd = node
+            else:
+                tl._nxt = node
+            tl = node
+            n += 1
+        self._tl = tl
+        self._size += n
 
     def __repr__(self) -> str:
         """
@@ -219,6 +289,9 @@ class SinglyLinkedList[T]:
         Best-case time complexity is `O(1)` (element with value *v* is the head).
         Worst-case time complexity is `O(n)` (element with value *v* is the tail, or not found).
 
+        If values are indexed, time complexity (in all cases) is `O(1)`, but
+        the node returned is any node with value *v*.
+
         Parameters
         ----------
         v
@@ -230,6 +303,12 @@ class SinglyLinkedList[T]:
             The first node with value *v* if it exists, `Option.NONE()` if
             *v* not found.
         """
+        if self._index is not None:
+            nodes = self._index.get(v)
+            if not nodes:
+                return Option.NONE()
+            return Option.Some(next(iter(nodes)))
+
         node = self._hd
         while node is not None and node._v != v:
             node = node._nxt
@@ -247,6 +326,29 @@ class SinglyLinkedList[T]:
             raise IndexError()
         return res.unwrap()._v
 
+    def contains(self, v: T) -> bool:
+        """
+        Returns whether this list has an element with value *v*.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n)`, or `O(1)` if values are indexed.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `bool`
+        """
+        if self._index is not None:
+            return v in self._index
+        return self.get_by_val(v).is_some
+
+    def __contains__(self, v) -> bool:
+        return self.contains(v)
+
     def set(self, node: SLLNode[T], v: T):
         """
         Sets the value of *node* to *v*.
@@ -256,7 +358,9 @@ class SinglyLinkedList[T]:
         node
         v
         """
+        index_remove(self._index, node)
         node._v = v
+        index_add(self._index, node)
 
     def set_at_idx(self, i: int, v: T) -> Option[SLLNode[T]]:
         """
@@ -277,7 +381,7 @@ class SinglyLinkedList[T]:
             return Option.NONE()
 
         node = node.unwrap()
-        node._v = v
+        self.set(node, v)
         return Option.Some(node)
 
     def set_by_val(self, v: T, new_v: T) -> Option[SLLNode[T]]:
@@ -299,7 +403,7 @@ class SinglyLinkedList[T]:
             return Option.NONE()
 
         node = node.unwrap()
-        node._v = new_v
+        self.set(node, new_v)
         return Option.Some(node)
 
     def __setitem__(self, key, value: T):
@@ -336,10 +440,13 @@ class SinglyLinkedList[T]:
             The newly created node.
         """
         new_node = SLLNode(v)
+        index_add(self._index, new_node)
 
         if neighbor == Option.NONE():
             if self._hd is not None:
                 new_node._nxt = self._hd
+            else:
+                self._tl = new_node
             self._hd = new_node
             self._size += 1
             return new_node
@@ -347,6 +454,8 @@ class SinglyLinkedList[T]:
         nbr = neighbor.unwrap()
         new_node._nxt = nbr._nxt
         nbr._nxt = new_node
+        if nbr is self._tl:
+            self._tl = new_node
         self._size += 1
         return new_node
 
@@ -361,8 +470,8 @@ class SinglyLinkedList[T]:
 
         Complexity
         ----------
-        Best-case time complexity is `O(1)` (inserting at the beginning).
-        Worst-case time complexity is `O(n)` (inserting at the end).
+        Best-case time complexity is `O(1)` (inserting at the beginning or the end).
+        Worst-case time complexity is `O(n)` (inserting before the tail).
 
         Parameters
         ----------
@@ -383,11 +492,21 @@ class SinglyLinkedList[T]:
 
         # Instantiate new node.
         new_node = SLLNode(v)
+        index_add(self._index, new_node)
 
         # Handle case when inserting at the beginning of the list (aka. prepend).
         if i == 0:
             new_node._nxt = self._hd
             self._hd = new_node
+            if self._tl is None:
+                self._tl = new_node
+            self._size += 1
+            return Option.Some(new_node)
+
+        # Handle case when inserting at the end of the list (aka. append).
+        if i == self._size:
+            self._tl._nxt = new_node  # type: ignore
+            self._tl = new_node
             self._size += 1
             return Option.Some(new_node)
 
@@ -429,7 +548,7 @@ class SinglyLinkedList[T]:
 
         Complexity
         ----------
-        Time complexity (in all cases) is `O(n)` (equivalent to inserting at the end).
+        Time complexity (in all cases) is `O(1)` (equivalent to inserting at the end).
 
         Parameters
         ----------
@@ -460,9 +579,12 @@ class SinglyLinkedList[T]:
         if node == self._hd:
             # Re-arrange pointers.
             self._hd = node._nxt
+            if self._hd is None:
+                self._tl = None
             node._nxt = None
             # Decrement count.
             self._size -= 1
+            index_remove(self._index, node)
             return
 
         # Find the node before the one to delete.
@@ -476,10 +598,13 @@ class SinglyLinkedList[T]:
 
         # Re-arrange pointers.
         prv_node._nxt = node._nxt
+        if node is self._tl:
+            self._tl = prv_node
         node._nxt = None
 
         # Decrement count.
         self._size -= 1
+        index_remove(self._index, node)
 
     def delete_at_idx(self, i: int) -> Option[SLLNode[T]]:
         """
@@ -515,9 +640,12 @@ class SinglyLinkedList[T]:
             node = self._hd
             # Re-arrange pointers.
             self._hd = node._nxt  # type: ignore
+            if self._hd is None:
+                self._tl = None
             node._nxt = None  # type: ignore
             # Decrement count.
             self._size -= 1
+            index_remove(self._index, node)
             return Option.Some(node)
 
         # Find node before the one to delete.
@@ -530,14 +658,17 @@ class SinglyLinkedList[T]:
 
         # Re-arrange pointers
         prv_node._nxt = node._nxt  # type: ignore
+        if node is self._tl:
+            self._tl = prv_node
         node._nxt = None  # type: ignore
 
         # Decrement count.
         self._size -= 1
+        index_remove(self._index, node)
 
         return Option.Some(node)
 
-    def delete_by_val(self, v: int) -> Option[SLLNode[T]]:
+    def delete_by_val(self, v: T) -> Option[SLLNode[T]]:
         """
         Deletes the first node with value *v*, if found.
 
@@ -555,6 +686,13 @@ class SinglyLinkedList[T]:
         `Option[SLLNode[T]]`
             The deleted node or `Option.NONE()` if there is no node with value *v*.
         """
+        if self._index is not None:
+            # The node is found in `O(1)`, but not the one before it.
+            node = self.get_by_val(v)
+            if node.is_some:
+                self.delete(node.unwrap())
+            return node
+
         if self._size == 0:
             return Option.NONE()
         assert self._hd is not None
@@ -575,10 +713,13 @@ class SinglyLinkedList[T]:
             prv_node._nxt = node._nxt
         else:  # `node` is the head
             self._hd = node._nxt
+        if node is self._tl:
+            self._tl = prv_node
         node._nxt = None
 
         # Decrement count.
         self._size -= 1
+        index_remove(self._index, node)
 
         return Option.Some(node)
 
@@ -595,10 +736,15 @@ class SinglyLinkedList[T]:
 
     def extend(self, lst: "SinglyLinkedList[T]") -> "SinglyLinkedList[T]":
         """
-        Extends this list with elements in *lst*.
+        Extends this list with elements in *lst*, by moving the nodes of *lst*
+        to the end of this list. *lst* is left empty.
+
+        If *lst* is this list, its elements are appended again instead.
 
-        This is equivalent to appending the elements of *lst* one-by-one,
-        from left to right.
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(1)`, or `O(m)` where `m` is the
+        length of *lst* if the values of this list are indexed.
 
         Parameters
         ----------
@@ -609,23 +755,39 @@ class SinglyLinkedList[T]:
         `SinglyLinkedList[T]`
             This list (useful for chaining operations).
         """
-        # Could do more efficient if kept track of the tail of the list.
-        # In fact, that is not the only operation that would benefit
-        # from that. Append would to.
-        for el in lst:
-            self.append(el)
+        if lst is self:
+            self._link_all(self.to_python_list())
+            return self
+        if lst._hd is None:
+            return self
+
+        if self._index is not None:
+            for node in iter_nodes(lst._hd):
+                index_add(self._index, node)
+        if self._tl is None:
+            self._hd = lst._hd
+        else:
+            self._tl._nxt = lst._hd
+        self._tl = lst._tl
+        self._size += lst._size
+
+        lst._hd = None
+        lst._tl = None
+        lst._size = 0
+        if lst._index is not None:
+            lst._index = {}
         return self
 
     def __add__(self, other) -> "SinglyLinkedList[T]":
         """
         Extends this list with elements in *other*.
 
-        This is equivalent to appending the elements of *lst* one-by-one,
-        from left to right.
+        This is equivalent to appending the elements of *other* one-by-one,
+        from left to right. Unlike `extend`, *other* is left unchanged.
 
         Parameters
         ----------
-        lst
+        other
 
         Returns
         -------
@@ -634,7 +796,8 @@ class SinglyLinkedList[T]:
         """
         if not isinstance(other, SinglyLinkedList):
             raise TypeError("unsupported operand for operator +")
-        return self.extend(other)
+        self._link_all(list(other))
+        return self
 
     def to_python_list(self) -> list[T]:
         """
@@ -658,3 +821,39 @@ class SinglyLinkedList[T]:
         `SinglyLinkedList[T]`
         """
         return copy.deepcopy(self)
+
+    def merge_sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "SinglyLinkedList[T]":
+        """
+        Sorts this list (in-place) using a bottom-up merge sort.
+
+        The sort is stable, and nodes are relinked rather than having their
+        values swapped, so each node keeps its value.
+
+        Complexity
+        ----------
+        Time complexity (in all cases) is `O(n log(n))`, with `O(1)` extra
+        space if *key* is `None` (`O(n)` otherwise, to hold the keys).
+
+        Parameters
+        ----------
+        key
+            (Optional) A function computing the key to compare elements by.
+            It is called once per element.
+
+            Defaults to `None`, meaning elements are compared directly.
+        reverse
+            (Optional) Whether to sort in descending order.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `SinglyLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        self._hd, self._tl = merge_sort(self._hd, self._size, key, reverse)
+        return self
+
+    sort = merge_sort
@@ -0,0 +1,223 @@
+import random
+import unittest
+
+import numpy as np
+from option import Option
+
+from lists import ArrayDoublyLinkedList
+
+
+class TestArrayDoublyLinkedList(unittest.TestCase):
+    def test_init(self):
+        lst = ArrayDoublyLinkedList()
+        self.assertEqual(len(lst), 0)
+        self.assertTrue(lst.is_empty)
+        self.assertFalse(lst)
+        self.assertTrue(lst.head.is_none)
+
+        lst = ArrayDoublyLinkedList([(0, 1), (2, 3)])
+        self.assertListEqual(list(lst), [(0, 1), (2, 3)])
+
+    def test_repr(self):
+        test_cases = [
+            (ArrayDoublyLinkedList(), "[]"),
+            (ArrayDoublyLinkedList([0]), "[0]"),
+            (ArrayDoublyLinkedList([0, 1, 2, 3, 4]), "[0 >< 1 >< 2 >< 3 >< 4]"),
+        ]
+
+        for lst, expected_repr in test_cases:
+            self.assertEqual(str(lst), expected_repr)
+
+    def test_get_at_idx(self):
+        lst = ArrayDoublyLinkedList(list(range(5)))
+        for i in range(5):
+            node = lst.get_at_idx(i)
+            self.assertTrue(node.is_some)
+            self.assertEqual(lst.get(node.unwrap()), i)
+        self.assertEqual(lst.get(lst.get_at_idx(-1).unwrap()), 4)
+        self.assertTrue(lst.get_at_idx(5).is_none)
+        self.assertTrue(lst.get_at_idx(-2).is_none)
+
+    def test_getitem_setitem(self):
+        lst = ArrayDoublyLinkedList([0, 1, 2])
+        self.assertEqual(lst[1], 1)
+        lst[1] = 5
+        lst[-1] = 6
+        self.assertListEqual(lst.to_python_list(), [0, 5, 6])
+        self.assertRaises(IndexError, lambda: lst[3])
+
+        def f():
+            lst[3] = 3
+
+        self.assertRaises(IndexError, f)
+        self.assertTrue(lst.set_by_val(5, 1).is_some)
+        self.assertTrue(lst.set_by_val(5, 1).is_none)
+        self.assertListEqual(lst.to_python_list(), [0, 1, 6])
+
+    def test_navigation(self):
+        lst = ArrayDoublyLinkedList([0, 1, 2])
+        node = lst.head.unwrap()
+        vs = []
+        while True:
+            vs.append(lst.get(node))
+            nxt = lst.nxt(node)
+            if nxt.is_none:
+                break
+            node = nxt.unwrap()
+        self.assertListEqual(vs, [0, 1, 2])
+        self.assertEqual(node, lst.tail.unwrap())
+        self.assertEqual(lst.get(lst.prv(node).unwrap()), 1)
+        self.assertTrue(lst.prv(lst.head.unwrap()).is_none)
+
+    def test_insert(self):
+        lst = ArrayDoublyLinkedList()
+        n1 = lst.insert(1, Option.NONE())
+        lst.insert(3, Option.Some(n1))
+        lst.insert(0, Option.Some(n1), after=False)
+        lst.prepend(-1)
+        lst.append(4)
+        self.assertTrue(lst.insert_at_idx(3, 2).is_some)
+        self.assertTrue(lst.insert_at_idx(-1, 5).is_some)
+        self.assertTrue(lst.insert_at_idx(8, 5).is_none)
+        self.assertListEqual(lst.to_python_list(), [-1, 0, 1, 2, 3, 4, 5])
+
+    def test_delete(self):
+        lst = ArrayDoublyLinkedList(list(range(5)))
+        self.assertEqual(lst.delete(lst.head.unwrap()), 0)
+        self.assertEqual(lst.delete_at_idx(-1), Option.Some(4))
+        self.assertEqual(lst.delete_by_val(2), Option.Some(2))
+        self.assertTrue(lst.delete_by_val(2).is_none)
+        self.assertTrue(lst.delete_at_idx(2).is_none)
+        self.assertListEqual(lst.to_python_list(), [1, 3])
+        del lst[0]
+        del lst[0]
+        self.assertTrue(lst.is_empty)
+        self.assertTrue(lst.head.is_none and lst.tail.is_none)
+
+        def f():
+            del lst[0]
+
+        self.assertRaises(IndexError, f)
+
+    def test_handles(self):
+        lst = ArrayDoublyLinkedList([0, 1, 2])
+        handles = [lst.get_at_idx(i).unwrap() for i in range(3)]
+        # Handles stay valid across other modifications.
+        for i in range(20):
+            lst.prepend(-i)
+        lst.reverse()
+        lst.rotate(7)
+        lst.delete(handles[1])
+        self.assertEqual(lst.get(handles[0]), 0)
+        self.assertEqual(lst.get(handles[2]), 2)
+        # Slots of deleted nodes are reused.
+        self.assertEqual(lst.append(5), handles[1])
+
+        # The last released slot is reused first, even across a reversal.
+        lst = ArrayDoublyLinkedList(list(range(8)))
+        lst.delete(2)
+        lst.delete(5)
+        lst.reverse()
+        self.assertEqual([lst.append(v) for v in range(4)], [5, 2, 8, 9])
+        self.assertListEqual(lst.to_python_list(), [7, 6, 4, 3, 1, 0, 0, 1, 2, 3])
+        self.assertEqual(len(lst._vals), 16)
+
+    def test_against_python_list(self):
+        rng = random.Random(0)
+        lst = ArrayDoublyLinkedList(dtype=np.int64)
+        expected = []
+        for _ in range(1000):
+            op = rng.randrange(4)
+            if op < 2 or not expected:
+                i = rng.randint(0, len(expected))
+                v = rng.randrange(100)
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                self.assertEqual(lst.delete_at_idx(i).unwrap(), expected.pop(i))
+            else:
+                r = rng.randrange(-10, 10)
+                lst.rotate(r)
+                if expected:
+                    r %= len(expected)
+                    expected = expected[-r:] + expected[:-r]
+        self.assertListEqual(lst.to_python_list(), expected)
+        self.assertEqual(len(lst), len(expected))
+
+    def test_rotate(self):
+        for n in range(6):
+            for r in range(-7, 8):
+                lst = ArrayDoublyLinkedList(list(range(n)))
+                expected = list(range(n))
+                if n > 0:
+                    k = r % n
+                    expected = expected[-k:] + expected[:-k] if k else expected
+                self.assertListEqual(lst.rotate(r).to_python_list(), expected)
+
+    def test_reverse(self):
+        lst = ArrayDoublyLinkedList(list(range(5)))
+        self.assertListEqual(lst.reverse().to_python_list(), [4, 3, 2, 1, 0])
+        lst.append(-1)
+        lst.prepend(5)
+        self.assertListEqual(lst.to_python_list(), [5, 4, 3, 2, 1, 0, -1])
+        self.assertListEqual(list(lst.reverse()), [-1, 0, 1, 2, 3, 4, 5])
+
+    def test_extend(self):
+        lst = ArrayDoublyLinkedList([0, 1])
+        lst + ArrayDoublyLinkedList([2, 3])
+        self.assertListEqual(lst.to_python_list(), [0, 1, 2, 3])
+        lst.extend(lst)
+        self.assertListEqual(lst.to_python_list(), [0, 1, 2, 3] * 2)
+        self.assertRaises(TypeError, lambda: lst + [4])
+
+    def test_clone(self):
+        lst = ArrayDoublyLinkedList([[0], [1]])
+        clone = lst.clone()
+        self.assertEqual(lst, clone)
+        clone[0].append(2)
+        self.assertListEqual(lst[0], [0])
+
+    def test_to_numpy(self):
+        lst = ArrayDoublyLinkedList([1, 2, 3], dtype=np.int32)
+        lst.prepend(0)
+        arr = lst.to_numpy()
+        self.assertEqual(arr.dtype, np.int32)
+        self.assertListEqual(arr.tolist(), [0, 1, 2, 3])
+
+    def test_sorts(self):
+        rng = random.Random(0)
+        for sort in ["selection_sort", "insertion_sort", "quicksort"]:
+            for n in [0, 1, 2, 10, 100]:
+                for dtype in [object, np.float64]:
+                    vs = [rng.randrange(50) for _ in range(n)]
+                    lst = ArrayDoublyLinkedList(dtype=dtype)
+                    for v in vs:
+                        # Scatter the slots.
+                        lst.insert_at_idx(rng.randint(0, len(lst)), v)
+                    expected = sorted(lst.to_python_list())
+                    getattr(lst, sort)()
+                    self.assertListEqual(lst.to_python_list(), expected)
+
+    def test_merge_sort(self):
+        vs = [(i % 3, i) for i in range(30)]
+        for reverse in [False, True]:
+            lst = ArrayDoublyLinkedList(vs)
+            lst.reverse().reverse()
+            head = lst.head.unwrap()
+            lst.merge_sort(key=lambda v: v[0], reverse=reverse)
+            expected = sorted(vs, key=lambda v: v[0], reverse=reverse)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.assertListEqual(list(lst.reverse()), expected[::-1])
+            self.assertEqual(lst.get(head), (0, 0))
+
+        lst = ArrayDoublyLinkedList([2.0, 3.0, 1.0], dtype=np.float64)
+        self.assertListEqual(lst.sort().to_python_list(), [1.0, 2.0, 3.0])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
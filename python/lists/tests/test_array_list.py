@@ -1,5 +1,8 @@
+import array
+import random
 import unittest
 
+import numpy as np
 from option import Option
 
 from lists import ArrayList
@@ -11,6 +14,49 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.assertEqual(len(lst), 0)
         self.assertEqual(lst.is_empty, True)
 
+    def test_init_from_collections(self):
+        test_cases = [
+            (ArrayList(range(3)), [0, 1, 2]),
+            (ArrayList((0, 1, 2)), [0, 1, 2]),
+            (ArrayList(ArrayList([0, 1, 2])), [0, 1, 2]),
+            (ArrayList(np.arange(3)), [0, 1, 2]),
+            (ArrayList(array.array("i", [0, 1, 2])), [0, 1, 2]),
+            (ArrayList(b"\x00\x01\x02"), [0, 1, 2]),
+            (ArrayList(array.array("i", [0, 1, 2]), dtype=np.int64), [0, 1, 2]),
+            (ArrayList(range(3), dtype=np.float64), [0.0, 1.0, 2.0]),
+            (ArrayList([[0], [1]]), [[0], [1]]),
+        ]
+
+        for lst, expected_py_lst in test_cases:
+            self.assertListEqual(lst.to_python_list(), expected_py_lst)
+
+        self.assertRaises(ValueError, lambda: ArrayList(growth_factor=1))
+        self.assertRaises(ValueError, lambda: ArrayList(shrink_threshold=0.5))
+
+    def test_capacity(self):
+        lst = ArrayList(growth_factor=1.5)
+        for i in range(100):
+            lst.append(i)
+            self.assertGreaterEqual(lst.capacity, len(lst))
+        self.assertEqual(lst, ArrayList(range(100)))
+
+        # Deleting most elements gives back memory.
+        peak_capacity = lst.capacity
+        lst.delete_range(10)
+        self.assertEqual(lst, ArrayList(range(10)))
+        self.assertLess(lst.capacity, peak_capacity)
+
+        # Reserved capacity is kept until shrunk to fit.
+        lst = ArrayList([0]).reserve(1000)
+        self.assertEqual(lst.capacity, 1000)
+        lst.insert_many(-1, range(999))
+        self.assertEqual(lst.capacity, 1000)
+        lst.delete_range(1)
+        self.assertEqual(lst.capacity, 1000)
+        lst.shrink_to_fit()
+        self.assertLess(lst.capacity, 1000)
+        self.assertEqual(lst, ArrayList([0]))
+
     def test_is_empty(self):
         test_cases = [
             (ArrayList(), True),
@@ -85,6 +131,13 @@ class TestDoublyLinkedList(unittest.TestCase):
         for lst, expected_py_lst in test_cases:
             self.assertListEqual(lst.to_python_list(), expected_py_lst)
 
+    def test_to_numpy(self):
+        lst = ArrayList([2, 0, 1], dtype=np.int64)
+        arr = lst.to_numpy()
+        self.assertTrue(np.array_equal(arr, np.array([2, 0, 1])))
+        arr.sort()
+        self.assertEqual(lst, ArrayList([0, 1, 2]))
+
     def test_get_at_idx(self):
         test_cases = [
             (ArrayList([]), 0, Option.NONE()),
@@ -137,6 +190,56 @@ class TestDoublyLinkedList(unittest.TestCase):
         for lst, i, v, expected_lst in test_cases:
             self.assertEqual(lst.insert_at_idx(i, v), expected_lst)
 
+    def test_insert_many(self):
+        test_cases = [
+            (ArrayList(), -1, [], ArrayList()),
+            (ArrayList(), 0, [0, 1], ArrayList([0, 1])),
+            (ArrayList(), 1, [0, 1], ArrayList()),
+            (ArrayList([0, 1, 2]), -1, [3, 4], ArrayList([0, 1, 2, 3, 4])),
+            (ArrayList([0, 1, 2]), 0, [3, 4], ArrayList([3, 4, 0, 1, 2])),
+            (ArrayList([0, 1, 2]), 1, ArrayList([3, 4]), ArrayList([0, 3, 4, 1, 2])),
+            (ArrayList([0, 1, 2]), 4, [3, 4], ArrayList([0, 1, 2])),
+            (ArrayList([[0]]), 0, [[1], [2]], ArrayList([[1], [2], [0]])),
+            (
+                ArrayList(list(range(7))),
+                3,
+                list(range(10)),
+                ArrayList(list(range(3)) + list(range(10)) + list(range(3, 7))),
+            ),
+        ]
+
+        for lst, i, vs, expected_lst in test_cases:
+            self.assertEqual(lst.insert_many(i, vs), expected_lst)
+
+        lst = ArrayList([0, 1, 2])
+        self.assertEqual(lst.insert_many(1, lst), ArrayList([0, 0, 1, 2, 1, 2]))
+
+    def test_delete_at_idx(self):
+        test_cases = [
+            (ArrayList(), 0, ArrayList()),
+            (ArrayList([0]), -1, ArrayList()),
+            (ArrayList([0, 1, 2]), 0, ArrayList([1, 2])),
+            (ArrayList([0, 1, 2]), 1, ArrayList([0, 2])),
+            (ArrayList([0, 1, 2]), 3, ArrayList([0, 1, 2])),
+        ]
+
+        for lst, i, expected_lst in test_cases:
+            self.assertEqual(lst.delete_at_idx(i), expected_lst)
+
+    def test_delete_range(self):
+        test_cases = [
+            (ArrayList(), 0, -1, ArrayList()),
+            (ArrayList([0, 1, 2]), 0, -1, ArrayList()),
+            (ArrayList([0, 1, 2]), 1, 1, ArrayList([0, 2])),
+            (ArrayList([0, 1, 2, 3]), 1, 2, ArrayList([0, 3])),
+            (ArrayList([0, 1, 2]), 2, 1, ArrayList([0, 1, 2])),
+            (ArrayList([0, 1, 2]), 1, 3, ArrayList([0, 1, 2])),
+            (ArrayList([0, 1, 2]), -2, 1, ArrayList([0, 1, 2])),
+        ]
+
+        for lst, start, end, expected_lst in test_cases:
+            self.assertEqual(lst.delete_range(start, end), expected_lst)
+
     def test_prepend(self):
         test_cases = [
             (ArrayList(), 0, ArrayList([0])),
@@ -268,6 +371,51 @@ class TestDoublyLinkedList(unittest.TestCase):
             self._check_is_sorted(lst)
             self.assertEqual(lst, expected_lst)
 
+    def test_sort(self):
+        test_cases = [
+            (ArrayList(), {}, ArrayList()),
+            (ArrayList([0]), {}, ArrayList([0])),
+            (ArrayList([1, 0]), {}, ArrayList([0, 1])),
+            (ArrayList([2, 1, 5, 4, 7]), {}, ArrayList([1, 2, 4, 5, 7])),
+            (ArrayList([2, 1, 5, 4, 7]), {"reverse": True}, ArrayList([7, 5, 4, 2, 1])),
+            (ArrayList([2, -1, -5, 4]), {"key": abs}, ArrayList([-1, 2, 4, -5])),
+            (
+                ArrayList([[2], [1, 1], []]),
+                {"key": len, "reverse": True},
+                ArrayList([[1, 1], [2], []]),
+            ),
+            (ArrayList([2, 1, 3], dtype=np.int64), {}, ArrayList([1, 2, 3])),
+            (
+                ArrayList([2, 1, 3], dtype=np.int64),
+                {"reverse": True},
+                ArrayList([3, 2, 1]),
+            ),
+            (
+                ArrayList([2, -1, -3], dtype=np.int64),
+                {"key": abs},
+                ArrayList([-1, 2, -3]),
+            ),
+        ]
+
+        for lst, kwargs, expected_lst in test_cases:
+            self.assertEqual(lst.sort(**kwargs), expected_lst)
+
+        # Large inputs with many duplicates, already sorted or reverse sorted
+        # must neither degrade nor hit the recursion limit.
+        rng = random.Random(0)
+        for xs in [
+            [rng.randint(0, 3) for _ in range(10000)],
+            [rng.random() for _ in range(10000)],
+            [1] * 10000,
+            list(range(10000)),
+            list(range(10000, 0, -1)),
+        ]:
+            self.assertListEqual(ArrayList(xs).sort().to_python_list(), sorted(xs))
+            self.assertListEqual(
+                ArrayList(xs).sort(reverse=True).to_python_list(),
+                sorted(xs, reverse=True),
+            )
+
     def test_insertion_sort(self):
         test_cases = [
             (ArrayList(), ArrayList()),
@@ -300,6 +448,32 @@ class TestDoublyLinkedList(unittest.TestCase):
             self._check_is_sorted(lst)
             self.assertEqual(lst, expected_lst)
 
+    def test_typed_storage(self):
+        lst = ArrayList([3, 1, 2], dtype=np.int64)
+        self.assertEqual(lst.dtype, np.dtype(np.int64))
+        self.assertEqual(str(lst), "[3, 1, 2]")
+        self.assertEqual(lst.get_by_val(2), Option.Some(2))
+        self.assertEqual(lst.get_by_val(4), Option.NONE())
+
+        lst.extend(ArrayList(list(range(10)), dtype=np.int64))
+        self.assertEqual(len(lst), 13)
+        self.assertListEqual(lst.to_python_list(), [3, 1, 2] + list(range(10)))
+        self.assertEqual(lst, ArrayList([3, 1, 2] + list(range(10))))
+
+        lst.quicksort()
+        self._check_is_sorted(lst)
+        self.assertEqual(
+            lst, ArrayList(sorted([3, 1, 2] + list(range(10))), dtype=np.int64)
+        )
+
+        lst = ArrayList([b"b", b"a"], dtype="S4")
+        lst.append(b"c")
+        lst.quicksort()
+        self.assertListEqual(lst.to_python_list(), [b"a", b"b", b"c"])
+
+        lst = ArrayList([0.5, 1.5], dtype=np.float64)
+        self.assertNotEqual(lst, ArrayList([0.5, 2.5], dtype=np.float64))
+
     def _check_is_sorted[T](self, lst: ArrayList[T]):
         prev = None
         for el in lst:
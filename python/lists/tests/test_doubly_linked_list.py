@@ -1,8 +1,10 @@
+import random
 import unittest
 
 from option import Option
 
 from lists import DoublyLinkedList
+from lists._value_index import build_index
 
 
 class TestDoublyLinkedList(unittest.TestCase):
@@ -342,6 +344,23 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.assertEqual(len(lst), 4)
         self.assertEqual(str(lst), "[0 >< 1 >< 3 >< 4]")
 
+    def test_move_to_front(self):
+        lst = DoublyLinkedList([0, 1, 2, 3])
+        nodes = [lst.get_at_idx(i).unwrap() for i in range(4)]
+        lst.move_to_front(nodes[2])
+        self.assertListEqual(lst.to_python_list(), [2, 0, 1, 3])
+        lst.move_to_front(nodes[3])
+        self.assertListEqual(lst.to_python_list(), [3, 2, 0, 1])
+        lst.move_to_front(nodes[3])
+        self.assertListEqual(lst.to_python_list(), [3, 2, 0, 1])
+        self.assertIs(lst.get_at_idx(-1).unwrap(), nodes[1])
+        self.assertListEqual(list(lst.reverse()), [1, 0, 2, 3])
+        self.assertEqual(len(lst), 4)
+
+        lst = DoublyLinkedList([0])
+        lst.move_to_front(lst.get_at_idx(0).unwrap())
+        self.assertListEqual(lst.to_python_list(), [0])
+
     def test_delete_at_idx(self):
         lst = DoublyLinkedList(list(range(5)))
 
@@ -613,6 +632,103 @@ class TestDoublyLinkedList(unittest.TestCase):
             self.check_doubly_linked_list_is_sorted(lst)
             self.assertEqual(str(lst), expected_output)
 
+    def test_quicksort_sorted_input(self):
+        lst = DoublyLinkedList(list(range(20_000)))
+        lst.quicksort()
+        self.assertListEqual(lst.to_python_list(), list(range(20_000)))
+
+    def test_merge_sort(self):
+        rng = random.Random(0)
+        for n in [0, 1, 2, 3, 7, 8, 100, 1000]:
+            vs = [rng.randrange(n // 2 + 1) for _ in range(n)]
+            lst = DoublyLinkedList(vs)
+            nodes = [lst.get_at_idx(i).unwrap() for i in range(n)]
+            self.assertIs(lst.merge_sort(), lst)
+            self.check_doubly_linked_list_is_sorted(lst)
+            self.assertListEqual(lst.to_python_list(), sorted(vs))
+            self.assertEqual(len(lst), n)
+            # Nodes are relinked, not given other values.
+            self.assertTrue(all(node.v == v for node, v in zip(nodes, vs)))
+            # Previous links are consistent with next links.
+            self.assertListEqual(backward(lst), sorted(vs, reverse=True))
+
+    def test_merge_sort_key_reverse(self):
+        vs = [(i % 3, i) for i in range(30)]
+        for reverse in [False, True]:
+            lst = DoublyLinkedList(vs)
+            lst.merge_sort(key=lambda v: v[0], reverse=reverse)
+            # Stable: ties keep their original order.
+            expected = sorted(vs, key=lambda v: v[0], reverse=reverse)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.assertListEqual(backward(lst), expected[::-1])
+
+        lst = DoublyLinkedList([2, 3, 1])
+        self.assertListEqual(lst.sort(reverse=True).to_python_list(), [3, 2, 1])
+
+    def test_contains(self):
+        for index_values in [False, True]:
+            lst = DoublyLinkedList([0, 1, 2], index_values=index_values)
+            self.assertTrue(lst.contains(1))
+            self.assertIn(2, lst)
+            self.assertNotIn(3, lst)
+
+    def test_index_values(self):
+        rng = random.Random(0)
+        lst = DoublyLinkedList([0, 1, 1], index_values=True)
+        expected = [0, 1, 1]
+        for _ in range(500):
+            op = rng.randrange(6)
+            v = rng.randrange(10)
+            if op == 0 or not expected:
+                i = rng.randint(0, len(expected))
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 1:
+                lst.append(v)
+                expected.append(v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                lst.delete_at_idx(i)
+                del expected[i]
+            elif op == 3:
+                node = lst.delete_by_val(v)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v)
+                    expected.remove(v)
+                    # Any node with value *v* may have been deleted.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            elif op == 4:
+                i = rng.randrange(len(expected))
+                lst[i] = v
+                expected[i] = v
+            else:
+                node = lst.set_by_val(v, v + 1)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v + 1)
+                    expected[expected.index(v)] = v + 1
+                    # Any node with value *v* may have been set.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            for w in range(11):
+                self.assertEqual(lst.contains(w), w in expected)
+                node = lst.get_by_val(w)
+                self.assertEqual(node.is_some, w in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, w)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.assertEqual(lst._index, build_index(lst._hd))
+
+    def test_index_values_sorts(self):
+        for sort in ["selection_sort", "insertion_sort", "quicksort", "merge_sort"]:
+            lst = DoublyLinkedList([3, 1, 2, 1], index_values=True)
+            getattr(lst, sort)()
+            self.assertListEqual(lst.to_python_list(), [1, 1, 2, 3])
+            self.assertEqual(lst._index, build_index(lst._hd))
+            self.assertEqual(lst.get_by_val(3).unwrap(), lst._tl)
+
     def check_doubly_linked_list_is_sorted(self, lst: DoublyLinkedList):
         n = lst._hd
         while n is not None:
@@ -620,6 +736,15 @@ class TestDoublyLinkedList(unittest.TestCase):
             n = n._nxt
 
 
+def backward(lst: DoublyLinkedList) -> list:
+    vs = []
+    n = lst._tl
+    while n is not None:
+        vs.append(n._v)
+        n = n._prv
+    return vs
+
+
 def main():
     unittest.main()
 
@@ -0,0 +1,221 @@
+import random
+import unittest
+
+from option import Option
+
+from lists import DoublyLinkedList, IndexedDoublyLinkedList
+from lists._value_index import build_index
+
+
+class TestIndexedDoublyLinkedList(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_init(self):
+        lst = IndexedDoublyLinkedList()
+        self.assertEqual(len(lst), 0)
+        self.assertTrue(lst.get_at_idx(0).is_none)
+        self.assertTrue(lst.get_at_idx(-1).is_none)
+
+        lst = IndexedDoublyLinkedList(list(range(100)))
+        self.assertEqual(lst, DoublyLinkedList(list(range(100))))
+        self.check_index(lst)
+
+    def test_get_at_idx(self):
+        lst = IndexedDoublyLinkedList(list(range(200)))
+        for i in range(200):
+            node = lst.get_at_idx(i).unwrap()
+            self.assertEqual(node.v, i)
+            self.assertEqual(lst.index(node), i)
+        self.assertEqual(lst.get_at_idx(-1).unwrap().v, 199)
+        self.assertEqual(lst[150], 150)
+        lst[150] = -1
+        self.assertEqual(lst[150], -1)
+        self.assertTrue(lst.get_at_idx(200).is_none)
+        self.assertRaises(IndexError, lambda: lst[-2])
+
+    def test_insert(self):
+        lst = IndexedDoublyLinkedList()
+        n1 = lst.insert(1, Option.NONE())
+        lst.insert(3, Option.Some(n1))
+        lst.insert(0, Option.Some(n1), after=False)
+        lst.prepend(-1)
+        lst.append(4)
+        self.assertEqual(lst.insert_at_idx(3, 2).unwrap().v, 2)
+        self.assertTrue(lst.insert_at_idx(-1, 5).is_some)
+        self.assertTrue(lst.insert_at_idx(8, 6).is_none)
+        self.assertListEqual(lst.to_python_list(), [-1, 0, 1, 2, 3, 4, 5])
+        self.check_index(lst)
+
+    def test_delete(self):
+        lst = IndexedDoublyLinkedList(list(range(5)))
+        lst.delete(lst.get_at_idx(2).unwrap())
+        self.assertEqual(lst.delete_at_idx(-1).unwrap().v, 4)
+        self.assertEqual(lst.delete_by_val(0).unwrap().v, 0)
+        self.assertTrue(lst.delete_by_val(0).is_none)
+        self.assertTrue(lst.delete_at_idx(2).is_none)
+        self.assertListEqual(lst.to_python_list(), [1, 3])
+        self.check_index(lst)
+        del lst[0]
+        del lst[-1]
+        self.assertTrue(lst.is_empty)
+        self.assertIsNone(lst._hd)
+        self.assertIsNone(lst._tl)
+        self.check_index(lst)
+
+    def test_move_to_front(self):
+        lst = IndexedDoublyLinkedList(list(range(50)))
+        node = lst.get_at_idx(30).unwrap()
+        lst.move_to_front(node)
+        self.assertIs(lst.get_at_idx(0).unwrap(), node)
+        self.assertEqual(lst.index(node), 0)
+        self.assertListEqual(
+            lst.to_python_list(), [30] + list(range(30)) + list(range(31, 50))
+        )
+        self.check_index(lst)
+
+    def test_against_python_list(self):
+        rng = random.Random(0)
+        lst = IndexedDoublyLinkedList()
+        expected = []
+        for _ in range(2000):
+            op = rng.randrange(5)
+            if op < 2 or not expected:
+                i = rng.randint(0, len(expected))
+                v = rng.randrange(1000)
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                self.assertEqual(lst.delete_at_idx(i).unwrap().v, expected.pop(i))
+            elif op == 3:
+                i = rng.randrange(len(expected))
+                node = lst.get_at_idx(i).unwrap()
+                self.assertEqual(node.v, expected[i])
+                self.assertEqual(lst.index(node), i)
+                lst.insert(-1, Option.Some(node), after=False)
+                expected.insert(i, -1)
+            else:
+                r = rng.randrange(-10, 10)
+                lst.rotate(r)
+                r %= len(expected)
+                expected = expected[-r:] + expected[:-r]
+        self.assertListEqual(lst.to_python_list(), expected)
+        self.check_index(lst)
+
+    def test_relinking_operations(self):
+        vs = [random.randrange(50) for _ in range(300)]
+        lst = IndexedDoublyLinkedList(vs)
+
+        lst.reverse()
+        self.assertListEqual(lst.to_python_list(), vs[::-1])
+        self.check_index(lst)
+
+        lst.merge_sort()
+        self.assertListEqual(lst.to_python_list(), sorted(vs))
+        self.check_index(lst)
+
+        lst.sort(reverse=True)
+        self.assertListEqual(lst.to_python_list(), sorted(vs, reverse=True))
+        self.check_index(lst)
+
+        lst.insertion_sort()
+        self.assertListEqual(lst.to_python_list(), sorted(vs))
+        self.check_index(lst)
+
+        lst.extend(DoublyLinkedList([1, 2]))
+        self.assertListEqual(lst.to_python_list(), sorted(vs) + [1, 2])
+        self.check_index(lst)
+
+    def test_contains(self):
+        for index_values in [False, True]:
+            lst = IndexedDoublyLinkedList([0, 1, 2], index_values=index_values)
+            self.assertTrue(lst.contains(1))
+            self.assertIn(2, lst)
+            self.assertNotIn(3, lst)
+
+    def test_index_values(self):
+        rng = random.Random(0)
+        lst = IndexedDoublyLinkedList([0, 1, 1], index_values=True)
+        expected = [0, 1, 1]
+        for _ in range(500):
+            op = rng.randrange(6)
+            v = rng.randrange(10)
+            if op == 0 or not expected:
+                i = rng.randint(0, len(expected))
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 1:
+                lst.append(v)
+                expected.append(v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                lst.delete_at_idx(i)
+                del expected[i]
+            elif op == 3:
+                node = lst.delete_by_val(v)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v)
+                    expected.remove(v)
+                    # Any node with value *v* may have been deleted.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            elif op == 4:
+                i = rng.randrange(len(expected))
+                lst[i] = v
+                expected[i] = v
+            else:
+                node = lst.set_by_val(v, v + 1)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v + 1)
+                    expected[expected.index(v)] = v + 1
+                    # Any node with value *v* may have been set.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            for w in range(11):
+                self.assertEqual(lst.contains(w), w in expected)
+                node = lst.get_by_val(w)
+                self.assertEqual(node.is_some, w in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, w)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.assertEqual(lst._index, build_index(lst._hd))
+
+    def check_index(self, lst: IndexedDoublyLinkedList):
+        """
+        Checks the links and spans of every level of the skip list against
+        the positions of the nodes in the list.
+        """
+        pos = {}
+        node = lst._hd
+        prv = None
+        while node is not None:
+            self.assertIs(node._prv, prv)
+            self.assertIs(node._fwd[0], node._nxt)
+            pos[id(node)] = len(pos) + 1
+            prv = node
+            node = node._nxt
+        self.assertIs(lst._tl, prv)
+        self.assertEqual(len(lst), len(pos))
+
+        for lvl in range(lst._level):
+            node = lst._header
+            node_pos = 0
+            while True:
+                nxt = node._fwd[lvl]
+                if nxt is None:
+                    self.assertEqual(node._span[lvl], len(lst) - node_pos)
+                    break
+                self.assertEqual(node._span[lvl], pos[id(nxt)] - node_pos)
+                node = nxt
+                node_pos = pos[id(nxt)]
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
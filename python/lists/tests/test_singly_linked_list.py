@@ -1,8 +1,10 @@
+import random
 import unittest
 
 from option import Option
 
 from lists import SinglyLinkedList
+from lists._value_index import build_index
 
 
 class TestSinglyLinkedList(unittest.TestCase):
@@ -498,6 +500,166 @@ class TestSinglyLinkedList(unittest.TestCase):
         for lst1, lst2, expected_lst in test_cases:
             self.assertEqual(lst1 + lst2, expected_lst)
 
+    def test_merge_sort(self):
+        rng = random.Random(0)
+        for n in [0, 1, 2, 3, 7, 8, 100, 1000]:
+            vs = [rng.randrange(n // 2 + 1) for _ in range(n)]
+            lst = SinglyLinkedList(vs)
+            nodes = [lst.get_at_idx(i).unwrap() for i in range(n)]
+            self.assertIs(lst.merge_sort(), lst)
+            self.assertListEqual(lst.to_python_list(), sorted(vs))
+            self.assertEqual(len(lst), n)
+            # Nodes are relinked, not given other values.
+            self.assertTrue(all(node.v == v for node, v in zip(nodes, vs)))
+
+    def test_merge_sort_key_reverse(self):
+        vs = [(i % 3, i) for i in range(30)]
+        for reverse in [False, True]:
+            lst = SinglyLinkedList(vs)
+            lst.merge_sort(key=lambda v: v[0], reverse=reverse)
+            # Stable: ties keep their original order.
+            expected = sorted(vs, key=lambda v: v[0], reverse=reverse)
+            self.assertListEqual(lst.to_python_list(), expected)
+
+        lst = SinglyLinkedList([2, 3, 1])
+        self.assertListEqual(lst.sort(reverse=True).to_python_list(), [3, 2, 1])
+
+    def test_contains(self):
+        for index_values in [False, True]:
+            lst = SinglyLinkedList([0, 1, 2], index_values=index_values)
+            self.assertTrue(lst.contains(1))
+            self.assertIn(2, lst)
+            self.assertNotIn(3, lst)
+
+    def test_index_values(self):
+        rng = random.Random(0)
+        lst = SinglyLinkedList([0, 1, 1], index_values=True)
+        expected = [0, 1, 1]
+        for _ in range(500):
+            op = rng.randrange(6)
+            v = rng.randrange(10)
+            if op == 0 or not expected:
+                i = rng.randint(0, len(expected))
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 1:
+                lst.append(v)
+                expected.append(v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                lst.delete_at_idx(i)
+                del expected[i]
+            elif op == 3:
+                node = lst.delete_by_val(v)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v)
+                    expected.remove(v)
+                    # Any node with value *v* may have been deleted.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            elif op == 4:
+                i = rng.randrange(len(expected))
+                lst[i] = v
+                expected[i] = v
+            else:
+                node = lst.set_by_val(v, v + 1)
+                self.assertEqual(node.is_some, v in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, v + 1)
+                    expected[expected.index(v)] = v + 1
+                    # Any node with value *v* may have been set.
+                    self.assertListEqual(sorted(lst.to_python_list()), sorted(expected))
+                    expected = lst.to_python_list()
+            for w in range(11):
+                self.assertEqual(lst.contains(w), w in expected)
+                node = lst.get_by_val(w)
+                self.assertEqual(node.is_some, w in expected)
+                if node.is_some:
+                    self.assertEqual(node.unwrap().v, w)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.assertEqual(lst._index, build_index(lst._hd))
+
+    def test_from_iterable(self):
+        lst = SinglyLinkedList.from_iterable(v * 2 for v in range(5))
+        self.assertEqual(lst, SinglyLinkedList([0, 2, 4, 6, 8]))
+        self.assertEqual(lst._tl.v, 8)
+        lst = SinglyLinkedList.from_iterable([], index_values=True)
+        self.assertTrue(lst.is_empty)
+        self.assertIsNone(lst._tl)
+        lst.append(1)
+        self.assertIn(1, lst)
+
+    def test_extend_splices(self):
+        lst1 = SinglyLinkedList([0, 1])
+        lst2 = SinglyLinkedList([2, 3])
+        node = lst2.get_at_idx(0).unwrap()
+        lst1.extend(lst2)
+        self.assertEqual(lst1, SinglyLinkedList([0, 1, 2, 3]))
+        # Nodes are moved, and the argument is left empty.
+        self.assertIs(lst1.get_at_idx(2).unwrap(), node)
+        self.assertTrue(lst2.is_empty)
+        self.assertIsNone(lst2._hd)
+        self.assertIsNone(lst2._tl)
+        lst1.append(4)
+        self.assertEqual(lst1._tl.v, 4)
+
+        lst1.extend(lst1)
+        self.assertListEqual(lst1.to_python_list(), [0, 1, 2, 3, 4] * 2)
+
+        lst1 = SinglyLinkedList([0], index_values=True)
+        lst2 = SinglyLinkedList([1, 2], index_values=True)
+        lst1.extend(lst2)
+        self.assertIn(2, lst1)
+        self.assertNotIn(2, lst2)
+        lst2.append(5)
+        self.assertListEqual(lst2.to_python_list(), [5])
+
+        lst1 = SinglyLinkedList([0])
+        lst2 = SinglyLinkedList([1])
+        lst1 + lst2
+        self.assertListEqual(lst1.to_python_list(), [0, 1])
+        self.assertListEqual(lst2.to_python_list(), [1])
+
+    def test_tail(self):
+        rng = random.Random(0)
+        lst = SinglyLinkedList()
+        expected = []
+        for _ in range(1000):
+            op = rng.randrange(7)
+            v = rng.randrange(20)
+            if op == 0 or not expected:
+                i = rng.randint(0, len(expected))
+                lst.insert_at_idx(i, v)
+                expected.insert(i, v)
+            elif op == 1:
+                lst.append(v)
+                expected.append(v)
+            elif op == 2:
+                i = rng.randrange(len(expected))
+                lst.insert(v, Option.Some(lst.get_at_idx(i).unwrap()))
+                expected.insert(i + 1, v)
+            elif op == 3:
+                i = rng.randrange(len(expected))
+                lst.delete_at_idx(i)
+                del expected[i]
+            elif op == 4:
+                i = rng.randrange(len(expected))
+                lst.delete(lst.get_at_idx(i).unwrap())
+                del expected[i]
+            elif op == 5:
+                if lst.delete_by_val(v).is_some:
+                    expected.remove(v)
+            else:
+                lst.merge_sort(reverse=bool(v % 2))
+                expected.sort(reverse=bool(v % 2))
+            self.assertListEqual(lst.to_python_list(), expected)
+            if expected:
+                self.assertEqual(lst._tl.v, expected[-1])
+                self.assertIsNone(lst._tl.nxt)
+            else:
+                self.assertIsNone(lst._tl)
+
 
 def main():
     unittest.main()
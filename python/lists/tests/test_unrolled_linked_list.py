@@ -0,0 +1,189 @@
+import random
+import unittest
+
+from option import Option
+
+from lists import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def test_init(self):
+        lst = UnrolledLinkedList()
+        self.assertEqual(len(lst), 0)
+        self.assertTrue(lst.is_empty)
+        self.assertFalse(lst)
+        self.assertRaises(ValueError, lambda: UnrolledLinkedList(block_size=1))
+
+        lst = UnrolledLinkedList(range(10), block_size=4)
+        self.assertListEqual(list(lst), list(range(10)))
+        self.check_blocks(lst)
+
+    def test_repr(self):
+        test_cases = [
+            (UnrolledLinkedList(), "[]"),
+            (UnrolledLinkedList([0]), "[0]"),
+            (UnrolledLinkedList(range(5), block_size=2), "[0, 1 | 2, 3 | 4]"),
+        ]
+
+        for lst, expected_repr in test_cases:
+            self.assertEqual(str(lst), expected_repr)
+
+    def test_get_set(self):
+        lst = UnrolledLinkedList(range(20), block_size=4)
+        for i in range(20):
+            self.assertEqual(lst.get_at_idx(i), Option.Some(i))
+            self.assertEqual(lst[i], i)
+        self.assertEqual(lst.get_at_idx(-1), Option.Some(19))
+        self.assertTrue(lst.get_at_idx(20).is_none)
+        self.assertRaises(IndexError, lambda: lst[-2])
+
+        lst[3] = -3
+        lst.set_at_idx(-1, -19)
+        lst.set_at_idx(20, 20)
+        self.assertEqual(lst[3], -3)
+        self.assertEqual(lst[19], -19)
+        self.assertEqual(len(lst), 20)
+
+        def f():
+            lst[20] = 20
+
+        self.assertRaises(IndexError, f)
+
+    def test_get_by_val(self):
+        lst = UnrolledLinkedList([3, 1, 4, 1, 5, 9, 2, 6], block_size=3)
+        self.assertEqual(lst.get_by_val(1), Option.Some(1))
+        self.assertEqual(lst.get_by_val(6), Option.Some(7))
+        self.assertTrue(lst.get_by_val(7).is_none)
+        self.assertIn(9, lst)
+        self.assertNotIn(7, lst)
+
+    def test_insert_delete(self):
+        lst = UnrolledLinkedList(block_size=4)
+        lst.append(2).prepend(0).insert_at_idx(1, 1).insert_at_idx(-1, 3)
+        self.assertListEqual(lst.to_python_list(), [0, 1, 2, 3])
+        lst.insert_at_idx(5, 5)
+        self.assertEqual(len(lst), 4)
+        lst.insert_at_idx(2, 9)
+        self.assertListEqual(lst.to_python_list(), [0, 1, 9, 2, 3])
+        self.check_blocks(lst)
+
+        self.assertEqual(lst.delete_by_val(9), Option.Some(2))
+        self.assertTrue(lst.delete_by_val(9).is_none)
+        lst.delete_at_idx(-1).delete_at_idx(0)
+        del lst[0]
+        self.assertListEqual(lst.to_python_list(), [2])
+        self.check_blocks(lst)
+        del lst[0]
+        self.assertTrue(lst.is_empty)
+        self.assertIsNone(lst._hd)
+        self.assertIsNone(lst._tl)
+
+        def f():
+            del lst[0]
+
+        self.assertRaises(IndexError, f)
+
+    def test_against_python_list(self):
+        rng = random.Random(0)
+        for block_size in [2, 3, 8]:
+            lst = UnrolledLinkedList(block_size=block_size)
+            expected = []
+            for _ in range(2000):
+                op = rng.randrange(6)
+                v = rng.randrange(50)
+                if op < 2 or not expected:
+                    i = rng.randint(0, len(expected))
+                    lst.insert_at_idx(i, v)
+                    expected.insert(i, v)
+                elif op == 2:
+                    lst.append(v)
+                    expected.append(v)
+                elif op == 3:
+                    i = rng.randrange(len(expected))
+                    lst.delete_at_idx(i)
+                    del expected[i]
+                elif op == 4:
+                    res = lst.delete_by_val(v)
+                    if v in expected:
+                        self.assertEqual(res, Option.Some(expected.index(v)))
+                        expected.remove(v)
+                    else:
+                        self.assertTrue(res.is_none)
+                else:
+                    r = rng.randrange(-10, 10)
+                    lst.rotate(r)
+                    r %= len(expected)
+                    expected = expected[-r:] + expected[:-r]
+                self.assertEqual(len(lst), len(expected))
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.check_blocks(lst)
+
+    def test_rotate(self):
+        for n in range(8):
+            for r in range(-9, 10):
+                lst = UnrolledLinkedList(range(n), block_size=3)
+                expected = list(range(n))
+                if n > 0:
+                    k = r % n
+                    expected = expected[-k:] + expected[:-k] if k else expected
+                self.assertListEqual(lst.rotate(r).to_python_list(), expected)
+                self.check_blocks(lst)
+
+    def test_reverse(self):
+        lst = UnrolledLinkedList(range(10), block_size=4)
+        self.assertListEqual(lst.reverse().to_python_list(), list(range(9, -1, -1)))
+        self.check_blocks(lst)
+        lst.append(-1)
+        self.assertEqual(lst[10], -1)
+
+    def test_extend(self):
+        lst = UnrolledLinkedList([0, 1], block_size=3)
+        other = UnrolledLinkedList([2, 3, 4])
+        lst + other
+        self.assertListEqual(lst.to_python_list(), [0, 1, 2, 3, 4])
+        self.assertListEqual(other.to_python_list(), [2, 3, 4])
+        lst.extend(lst)
+        self.assertListEqual(lst.to_python_list(), [0, 1, 2, 3, 4] * 2)
+        self.check_blocks(lst)
+        self.assertRaises(TypeError, lambda: lst + [5])
+
+    def test_clone(self):
+        lst = UnrolledLinkedList([[0], [1]])
+        clone = lst.clone()
+        self.assertEqual(lst, clone)
+        clone[0].append(2)
+        self.assertListEqual(lst[0], [0])
+
+    def test_sort(self):
+        vs = [(i % 3, i) for i in range(30)]
+        for reverse in [False, True]:
+            lst = UnrolledLinkedList(vs, block_size=4)
+            lst.sort(key=lambda v: v[0], reverse=reverse)
+            expected = sorted(vs, key=lambda v: v[0], reverse=reverse)
+            self.assertListEqual(lst.to_python_list(), expected)
+            self.check_blocks(lst)
+
+    def check_blocks(self, lst: UnrolledLinkedList):
+        """
+        Checks the links between blocks, and that blocks are neither empty nor
+        over capacity.
+        """
+        n = 0
+        prv = None
+        node = lst._hd
+        while node is not None:
+            self.assertIs(node._prv, prv)
+            self.assertTrue(0 < len(node._vs) <= lst.block_size)
+            n += len(node._vs)
+            prv = node
+            node = node._nxt
+        self.assertIs(lst._tl, prv)
+        self.assertEqual(n, len(lst))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,685 @@
+import copy
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from option import Option
+
+
+class ULLNode[T]:
+    """
+    A node (or block) of `UnrolledLinkedList[T]`.
+
+    Parameters
+    ----------
+    vs
+        The values of the node, in order.
+    """
+
+    __slots__ = ("_vs", "_prv", "_nxt")
+
+    def __init__(self, vs: list[T]):
+        self._vs: list[T] = vs
+        self._prv: ULLNode[T] | None = None
+        self._nxt: ULLNode[T] | None = None
+
+    @property
+    def vs(self) -> list[T]:
+        return self._vs
+
+    @property
+    def prv(self) -> "ULLNode[T] | None":
+        return self._prv
+
+    @property
+    def nxt(self) -> "ULLNode[T] | None":
+        return self._nxt
+
+    def __repr__(self) -> str:
+        """
+        Printable representation of `ULLNode`, used for debugging.
+
+        Returns
+        -------
+        `str`
+        """
+        return f"{{vs:{self._vs}}}"
+
+
+class UnrolledLinkedList[T]:
+    """
+    A doubly-linked list of blocks, each holding up to *block_size* values.
+
+    Compared to `DoublyLinkedList`, there is a node per block of values
+    rather than per value, which cuts memory use, and scans run over the
+    Python lists of the blocks. Positional access skips whole blocks, so it
+    takes `O(n/b + b)` time where `b` is the block size.
+
+    A block which is full is split in two when inserting into it, and a
+    block which becomes less than half full when deleting from it is merged
+    with, or takes values from, a neighbor. Appending fills the last block
+    before starting a new one.
+
+    Parameters
+    ----------
+    lst
+        (Optional) The initial elements.
+
+        Defaults to `[]`.
+    block_size
+        (Optional) The maximum number of values in a block. Must be at least
+        `2`.
+
+        Defaults to `32`.
+    """
+
+    def __init__(self, lst: Iterable[T] = [], block_size: int = 32):
+        if block_size < 2:
+            raise ValueError("block_size should be at least 2")
+
+        self._block_size: int = block_size
+        self._hd: ULLNode[T] | None = None
+        self._tl: ULLNode[T] | None = None
+        self._size: int = 0
+        self._append_all(lst)
+
+    def _blocks(self) -> Iterator[ULLNode[T]]:
+        node = self._hd
+        while node is not None:
+            yield node
+            node = node._nxt
+
+    def _link_after(self, node: ULLNode[T], prv: ULLNode[T] | None):
+        """
+        Links the block *node* after *prv*, or as the head if *prv* is `None`.
+        """
+        nxt = self._hd if prv is None else prv._nxt
+        node._prv = prv
+        node._nxt = nxt
+        if prv is None:
+            self._hd = node
+        else:
+            prv._nxt = node
+        if nxt is None:
+            self._tl = node
+        else:
+            nxt._prv = node
+
+    def _unlink(self, node: ULLNode[T]):
+        if node._prv is None:
+            self._hd = node._nxt
+        else:
+            node._prv._nxt = node._nxt
+        if node._nxt is None:
+            self._tl = node._prv
+        else:
+            node._nxt._prv = node._prv
+        node._prv = None
+        node._nxt = None
+
+    def _append_all(self, vs: Iterable[T]):
+        """
+        Appends the elements of *vs*, filling the last block then new full
+        blocks.
+        """
+        b = self._block_size
+        vs = list(vs)
+        i = 0
+        if self._tl is not None:
+            i = b - len(self._tl._vs)
+            self._tl._vs.extend(vs[:i])
+        for j in range(i, len(vs), b):
+            self._link_after(ULLNode(vs[j : j + b]), self._tl)
+        self._size += len(vs)
+
+    def _locate(self, i: int) -> tuple[ULLNode[T], int]:
+        """
+        Returns the block holding the value at index *i*, which must be in
+        bounds, and the offset of the value in the block. The block is
+        searched for from the closest end of the list.
+        """
+        if i < self._size // 2:
+            node = self._hd
+            while i >= len(node._vs):  # type: ignore
+                i -= len(node._vs)  # type: ignore
+                node = node._nxt  # type: ignore
+            return node, i  # type: ignore
+
+        # Index counted from the end.
+        j = self._size - 1 - i
+        node = self._tl
+        while j >= len(node._vs):  # type: ignore
+            j -= len(node._vs)  # type: ignore
+            node = node._prv  # type: ignore
+        return node, len(node._vs) - 1 - j  # type: ignore
+
+    def _split(self, node: ULLNode[T], off: int) -> ULLNode[T]:
+        """
+        Moves the values of *node* from offset *off* on to a new block linked
+        after it, and returns the new block.
+        """
+        new_node = ULLNode(node._vs[off:])
+        del node._vs[off:]
+        self._link_after(new_node, node)
+        return new_node
+
+    def _rebalance(self, node: ULLNode[T]):
+        """
+        Merges *node* with a neighbor, or takes values from the next block,
+        if *node* is less than half full.
+        """
+        b = self._block_size
+        vs = node._vs
+        if 2 * len(vs) >= b:
+            return
+
+        nxt = node._nxt
+        if nxt is None:
+            prv = node._prv
+            if prv is not None and len(prv._vs) + len(vs) <= b:
+                prv._vs.extend(vs)
+                self._unlink(node)
+            elif not vs:
+                self._unlink(node)
+            return
+
+        if len(vs) + len(nxt._vs) <= b:
+            vs.extend(nxt._vs)
+            self._unlink(nxt)
+        else:
+            # Even out the two blocks.
+            k = (len(nxt._vs) - len(vs)) // 2
+            vs.extend(nxt._vs[:k])
+            del nxt._vs[:k]
+
+    def __repr__(self) -> str:
+        """
+        Printable representation of `UnrolledLinkedList`, used for debugging.
+
+        Blocks are separated by `|`.
+
+        Returns
+        -------
+        `str`
+        """
+        return (
+            "["
+            + " | ".join(", ".join(str(v) for v in node._vs) for node in self._blocks())
+            + "]"
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        for node in self._blocks():
+            yield from node._vs
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Returns whether the list is empty (has no elements) or not.
+
+        Returns
+        -------
+        `bool`
+            `True` if the list is empty, `False` otherwise.
+        """
+        return self._size == 0
+
+    def __bool__(self) -> bool:
+        """
+        Returns `True` if this list is non-empty, `False` otherwise.
+
+        Returns
+        -------
+        `bool`
+        """
+        return not self.is_empty
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UnrolledLinkedList):
+            return False
+
+        if len(self) != len(other):
+            return False
+
+        for el1, el2 in zip(self, other):
+            if el1 != el2:
+                return False
+
+        return True
+
+    @property
+    def block_size(self) -> int:
+        """
+        Returns the maximum number of values in a block.
+        """
+        return self._block_size
+
+    def get_at_idx(self, i: int) -> Option[T]:
+        """
+        Returns the value at index *i* in this list.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n/(2b))` where `b` is the block size.
+
+        Parameters
+        ----------
+        i
+
+        Returns
+        -------
+        `Option[T]`
+            The value at index *i*, or `Option.NONE()` if *i* is out of bounds.
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return Option.NONE()
+
+        node, off = self._locate(i)
+        return Option.Some(node._vs[off])
+
+    def __getitem__(self, key) -> T:
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        res = self.get_at_idx(key)
+        if res.is_none:
+            raise IndexError()
+        return res.unwrap()
+
+    def get_by_val(self, v: T) -> Option[int]:
+        """
+        Returns the index of the first instance (left-to-right search) of
+        *v* in the list.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `Option[int]`
+            The index of *v* if found, `Option.NONE()` otherwise.
+        """
+        i = 0
+        for node in self._blocks():
+            if v in node._vs:
+                return Option.Some(i + node._vs.index(v))
+            i += len(node._vs)
+        return Option.NONE()
+
+    def contains(self, v: T) -> bool:
+        """
+        Returns whether this list has an element with value *v*.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `bool`
+        """
+        return any(v in node._vs for node in self._blocks())
+
+    def __contains__(self, v) -> bool:
+        return self.contains(v)
+
+    def set_at_idx(self, i: int, v: T) -> "UnrolledLinkedList[T]":
+        """
+        Sets value at index *i* to *v*.
+
+        If *i* is out of bounds, nothing will be done and the
+        function will exit *without* error.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Parameters
+        ----------
+        i
+        v
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return self
+
+        node, off = self._locate(i)
+        node._vs[off] = v
+        return self
+
+    def __setitem__(self, key, value: T):
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        if key == -1:
+            key = self._size - 1
+        if key < 0 or key >= self._size:
+            raise IndexError()
+
+        self.set_at_idx(key, value)
+
+    def insert_at_idx(self, i: int, v: T) -> "UnrolledLinkedList[T]":
+        """
+        Inserts value *v* at index *i*.
+
+        If *i* is out of bounds, nothing will be done and the
+        function will exit *without* error.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and means insert in
+        last position.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n/(2b) + b)` where `b` is the block
+        size (finding the block, then shifting values within it).
+
+        Parameters
+        ----------
+        i
+        v
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if i == -1:
+            i = self._size
+        if i < 0 or i > self._size:
+            return self
+
+        if i == self._size:
+            # Appending fills the last block, then starts a new one, so that
+            # blocks built by appending are full.
+            tl = self._tl
+            if tl is None or len(tl._vs) == self._block_size:
+                self._link_after(ULLNode([v]), tl)
+            else:
+                tl._vs.append(v)
+            self._size += 1
+            return self
+
+        node, off = self._locate(i)
+        if len(node._vs) == self._block_size:
+            half = self._block_size // 2
+            new_node = self._split(node, half)
+            if off > half:
+                node = new_node
+                off -= half
+        node._vs.insert(off, v)
+        self._size += 1
+        return self
+
+    def prepend(self, v: T) -> "UnrolledLinkedList[T]":
+        """
+        Prepends *v* to this list, i.e. inserts it at the *beginning* of this list.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        return self.insert_at_idx(0, v)
+
+    def append(self, v: T) -> "UnrolledLinkedList[T]":
+        """
+        Appends *v* to this list, i.e. inserts it at the *end* of this list.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        return self.insert_at_idx(self._size, v)
+
+    def delete_at_idx(self, i: int) -> "UnrolledLinkedList[T]":
+        """
+        Deletes value at index *i*.
+
+        If *i* is out of bounds, nothing will be done and the
+        function will exit *without* error.
+
+        Note
+        ----
+        A value of -1 for *i* is accepted and refers to the last element of
+        the list, as for Python lists.
+
+        Complexity
+        ----------
+        Worst-case time complexity is `O(n/(2b) + b)` where `b` is the block
+        size.
+
+        Parameters
+        ----------
+        i
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if i == -1:
+            i = self._size - 1
+        if i < 0 or i >= self._size:
+            return self
+
+        node, off = self._locate(i)
+        del node._vs[off]
+        self._size -= 1
+        self._rebalance(node)
+        return self
+
+    def delete_by_val(self, v: T) -> Option[int]:
+        """
+        Deletes the first instance (left-to-right search) of *v*, if found.
+
+        Parameters
+        ----------
+        v
+
+        Returns
+        -------
+        `Option[int]`
+            The index of the deleted value, or `Option.NONE()` if *v* is not
+            in the list.
+        """
+        i = 0
+        for node in self._blocks():
+            if v in node._vs:
+                off = node._vs.index(v)
+                del node._vs[off]
+                self._size -= 1
+                self._rebalance(node)
+                return Option.Some(i + off)
+            i += len(node._vs)
+        return Option.NONE()
+
+    def __delitem__(self, key):
+        if not isinstance(key, int):
+            raise TypeError("key should be int")
+
+        if key == -1:
+            key = self._size - 1
+        if key < 0 or key >= self._size:
+            raise IndexError()
+
+        self.delete_at_idx(key)
+
+    def rotate(self, r: int) -> "UnrolledLinkedList[T]":
+        """
+        Rotates (in-place) the list so that so that item `i` becomes item `(i + r) mod n`,
+        for all `i` in `[[0, n-1]]` (`n` being the length of the list).
+
+        The block holding the new head is split, then blocks are relinked.
+
+        Parameters
+        ----------
+        r
+            Rotation offset.
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        n = self._size
+        if n < 2 or r % n == 0:
+            return self
+
+        # The new head is the value at index `n - r`.
+        node, off = self._locate(n - r % n)
+        hd = self._split(node, off) if off > 0 else node
+        old_hd = self._hd
+        old_tl = self._tl
+        # Close the list into a ring, then open it before the new head.
+        old_tl._nxt = old_hd  # type: ignore
+        old_hd._prv = old_tl  # type: ignore
+        self._hd = hd
+        self._tl = hd._prv
+        hd._prv = None
+        self._tl._nxt = None  # type: ignore
+
+        # The old tail, and the blocks around the split, may be small.
+        self._rebalance(self._tl)  # type: ignore
+        if old_tl is not self._tl and old_tl._prv is not None:  # type: ignore
+            self._rebalance(old_tl)  # type: ignore
+        self._rebalance(self._hd)
+        return self
+
+    def reverse(self) -> "UnrolledLinkedList[T]":
+        """
+        Reverses the order of elements in the list (in-place).
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        for node in list(self._blocks()):
+            node._vs.reverse()
+            node._prv, node._nxt = node._nxt, node._prv
+        self._hd, self._tl = self._tl, self._hd
+        return self
+
+    def extend(self, lst: "UnrolledLinkedList[T]") -> "UnrolledLinkedList[T]":
+        """
+        Extends this list with the elements in *lst*.
+
+        This is equivalent to appending the elements of *lst* one-by-one,
+        from left to right.
+
+        Parameters
+        ----------
+        lst
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        self._append_all(lst)
+        return self
+
+    def __add__(self, other) -> "UnrolledLinkedList[T]":
+        """
+        Extends this list with the elements in *other*.
+
+        Parameters
+        ----------
+        other
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        if not isinstance(other, UnrolledLinkedList):
+            raise TypeError("unsupported operand for operator +")
+        return self.extend(other)
+
+    def to_python_list(self) -> list[T]:
+        """
+        Converts this list to a Python list.
+
+        Returns
+        -------
+        `list[T]`
+        """
+        py_lst: list[T] = []
+        for node in self._blocks():
+            py_lst.extend(node._vs)
+        return py_lst
+
+    def clone(self) -> "UnrolledLinkedList[T]":
+        """
+        Returns a clone (i.e. a deep copy) of this list.
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+        """
+        return UnrolledLinkedList(
+            copy.deepcopy(self.to_python_list()), self._block_size
+        )
+
+    def sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> "UnrolledLinkedList[T]":
+        """
+        Sorts this list (in-place).
+
+        The values are sorted with Python's sort (a stable merge sort), then
+        written back into the blocks.
+
+        Parameters
+        ----------
+        key
+            (Optional) A function computing the key to compare elements by.
+            It is called once per element.
+
+            Defaults to `None`, meaning elements are compared directly.
+        reverse
+            (Optional) Whether to sort in descending order.
+
+            Defaults to `False`.
+
+        Returns
+        -------
+        `UnrolledLinkedList[T]`
+            This list (useful for chaining operations).
+        """
+        vs = self.to_python_list()
+        vs.sort(key=key, reverse=reverse)
+        i = 0
+        for node in self._blocks():
+            j = i + len(node._vs)
+            node._vs[:] = vs[i:j]
+            i = j
+        return self
@@ -1 +1,8 @@
+from sorting.external_sort import external_sort as external_sort
+from sorting.external_sort import external_sort_file as external_sort_file
+from sorting.merge_sort import merge_sort_iter as merge_sort_iter
 from sorting.merge_sort import merge_sort_rec as merge_sort_rec
+from sorting.parallel_merge_sort import parallel_merge_sort as parallel_merge_sort
+from sorting.radix_sort import counting_sort as counting_sort
+from sorting.radix_sort import lsd_radix_sort as lsd_radix_sort
+from sorting.radix_sort import msd_radix_sort as msd_radix_sort
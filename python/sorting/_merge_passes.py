@@ -0,0 +1,132 @@
+from typing import Any
+
+
+def _before(a: Any, b: Any, reverse: bool) -> bool:
+    """
+    Returns whether *a* must be placed strictly before *b*.
+    """
+    return b < a if reverse else a < b
+
+
+def _merge(
+    src_ks: list[Any],
+    src_vs: list[Any] | None,
+    dst_ks: list[Any],
+    dst_vs: list[Any] | None,
+    lo: int,
+    mid: int,
+    hi: int,
+    reverse: bool,
+):
+    """
+    Merges the sorted ranges `[lo, mid)` and `[mid, hi)` of *src_ks* into
+    the range `[lo, hi)` of *dst_ks*, moving *src_vs* into *dst_vs*
+    alongside (if given).
+
+    On ties, elements of the left range come first, which makes merging stable.
+    """
+    # Ranges already in order (or a lone range) are copied as is.
+    if mid == hi or not _before(src_ks[mid], src_ks[mid - 1], reverse):
+        dst_ks[lo:hi] = src_ks[lo:hi]
+        if src_vs is not None:
+            dst_vs[lo:hi] = src_vs[lo:hi]  # type: ignore
+        return
+
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if _before(src_ks[j], src_ks[i], reverse):
+            dst_ks[k] = src_ks[j]
+            if src_vs is not None:
+                dst_vs[k] = src_vs[j]  # type: ignore
+            j += 1
+        else:
+            dst_ks[k] = src_ks[i]
+            if src_vs is not None:
+                dst_vs[k] = src_vs[i]  # type: ignore
+            i += 1
+        k += 1
+
+    # Only one of the ranges can have elements left.
+    if i < mid:
+        dst_ks[k:hi] = src_ks[i:mid]
+        if src_vs is not None:
+            dst_vs[k:hi] = src_vs[i:mid]  # type: ignore
+    else:
+        dst_ks[k:hi] = src_ks[j:hi]
+        if src_vs is not None:
+            dst_vs[k:hi] = src_vs[j:hi]  # type: ignore
+
+
+def natural_runs(ks: list[Any], vs: list[Any] | None, reverse: bool) -> list[int]:
+    """
+    Splits *ks* into maximal runs of elements already in order, reversing
+    (in-place, along with *vs*) the runs in strictly reverse order.
+
+    Returns the boundaries of the runs, from `0` to `len(ks)`.
+    """
+    n = len(ks)
+    bounds = [0]
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n and _before(ks[end], ks[start], reverse):
+            while end < n and _before(ks[end], ks[end - 1], reverse):
+                end += 1
+            # Reversing a strictly reverse run keeps the sort stable.
+            ks[start:end] = ks[start:end][::-1]
+            if vs is not None:
+                vs[start:end] = vs[start:end][::-1]
+        else:
+            while end < n and not _before(ks[end], ks[end - 1], reverse):
+                end += 1
+        bounds.append(end)
+        start = end
+    return bounds
+
+
+def merge_passes(
+    ks: list[Any], vs: list[Any] | None, bounds: list[int] | None, reverse: bool
+):
+    """
+    Sorts *ks* (in-place, along with *vs*) by merging its sorted runs pairwise,
+    level by level, back and forth between *ks* and a single auxiliary buffer.
+
+    The runs are delimited by *bounds* (from `0` to `len(ks)`), or are of one
+    element if *bounds* is `None`.
+    """
+    n = len(ks)
+    width = 1
+    if bounds is not None and len(bounds) <= 2:
+        return
+
+    src_ks, src_vs = ks, vs
+    dst_ks: list[Any] = [None] * n
+    dst_vs: list[Any] | None = None if vs is None else [None] * n
+    while (bounds is not None and len(bounds) > 2) or (bounds is None and width < n):
+        if bounds is not None:
+            new_bounds = [0]
+            for b in range(0, len(bounds) - 1, 2):
+                lo = bounds[b]
+                # An odd run out is carried over to the next level.
+                mid = bounds[b + 1]
+                hi = bounds[b + 2] if b + 2 < len(bounds) else mid
+                _merge(src_ks, src_vs, dst_ks, dst_vs, lo, mid, hi, reverse)
+                new_bounds.append(hi)
+            bounds = new_bounds
+        else:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                _merge(src_ks, src_vs, dst_ks, dst_vs, lo, mid, hi, reverse)
+            width *= 2
+
+        src_ks, dst_ks = dst_ks, src_ks
+        src_vs, dst_vs = dst_vs, src_vs
+
+    # The sorted elements may have ended up in the auxiliary buffer.
+    if src_ks is not ks:
+        ks[:] = src_ks
+    if vs is not None and src_vs is not vs:
+        vs[:] = src_vs  # type: ignore
@@ -0,0 +1,203 @@
+import pickle
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import IO, Any
+
+from sorting.merge_sort import merge_sort_iter
+from trees.binary_heap import BinaryMaxHeap, BinaryMinHeap, Item
+
+
+def _spill(entries: Iterable[tuple[Any, Any]], tmp_dir: str | None) -> IO[bytes]:
+    """
+    Writes *entries* to a new temporary file, and returns that file
+    rewound to its beginning.
+
+    The file is deleted as soon as it is closed.
+    """
+    f = tempfile.TemporaryFile(dir=tmp_dir)
+    try:
+        for entry in entries:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.seek(0)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def _read_run(f: IO[bytes]) -> Iterator[tuple[Any, Any]]:
+    """
+    Yields the entries of a file written by `_spill`.
+    """
+    while True:
+        try:
+            yield pickle.load(f)
+        except EOFError:
+            return
+
+
+def _merge_runs(
+    runs: list[Iterator[tuple[Any, Any]]], reverse: bool
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Merges sorted *runs* of `(key, record)` entries, using a binary heap
+    holding the next entry of each run as the merge frontier.
+
+    On ties, entries of earlier runs come first, which makes merging stable.
+    """
+    heap = BinaryMaxHeap() if reverse else BinaryMinHeap()
+    heads: list[tuple[Any, Any]] = [(None, None)] * len(runs)
+
+    def advance(i: int):
+        entry = next(runs[i], None)
+        if entry is not None:
+            heads[i] = entry
+            # Break ties on the index of the run.
+            heap.push(Item(i, (entry[0], -i if reverse else i)))
+
+    for i in range(len(runs)):
+        advance(i)
+
+    while heap:
+        i = heap.pop().unwrap().k
+        yield heads[i]
+        advance(i)
+
+
+def external_sort(
+    records: Iterable[Any],
+    key: Callable[[Any], Any] | None = None,
+    reverse: bool = False,
+    chunk_size: int = 100_000,
+    max_fan_in: int = 64,
+    tmp_dir: str | None = None,
+) -> Iterator[Any]:
+    """
+    Yields *records* sorted, using external merge sort, so that at most
+    about *chunk_size* records are held in memory at a time.
+
+    Records are read in chunks of *chunk_size*, each chunk is sorted with
+    `merge_sort_iter` and spilled (pickled) to a temporary file, and the
+    resulting sorted runs are then merged *max_fan_in* at a time until they
+    all are merged. The sort is stable.
+
+    Parameters
+    ----------
+    records
+        An iterable of orderable (or with orderable keys) and picklable
+        records, e.g. a file opened in text mode to sort its lines.
+    key
+        (Optional) A function computing the key to compare records by.
+        It is called once per record.
+
+        Defaults to `None`, meaning records are compared directly.
+    reverse
+        (Optional) Whether to sort in descending order.
+
+        Defaults to `False`.
+    chunk_size
+        (Optional) The number of records sorted in memory at once.
+
+        Defaults to `100_000`.
+    max_fan_in
+        (Optional) The maximum number of runs merged at once, which bounds
+        the number of temporary files open at once.
+
+        Defaults to `64`.
+    tmp_dir
+        (Optional) The directory where to write temporary files.
+
+        Defaults to `None`, meaning the platform's default.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be at least 1")
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in should be at least 2")
+
+    it = iter(records)
+    runs: list[IO[bytes]] = []
+    try:
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                break
+            entries = [(r if key is None else key(r), r) for r in chunk]
+            merge_sort_iter(entries, key=lambda e: e[0], reverse=reverse, natural=True)
+
+            if not runs and len(chunk) < chunk_size:
+                # Everything fitted in memory, no need to spill.
+                for _, r in entries:
+                    yield r
+                return
+
+            runs.append(_spill(entries, tmp_dir))
+            del chunk, entries
+
+        while len(runs) > max_fan_in:
+            merged = []
+            try:
+                for i in range(0, len(runs), max_fan_in):
+                    group = runs[i : i + max_fan_in]
+                    merged.append(
+                        _spill(
+                            _merge_runs([_read_run(f) for f in group], reverse), tmp_dir
+                        )
+                    )
+                    for f in group:
+                        f.close()
+            except BaseException:
+                # The runs of this pass are not in *runs* yet.
+                for f in merged:
+                    f.close()
+                raise
+            runs = merged
+
+        for _, r in _merge_runs([_read_run(f) for f in runs], reverse):
+            yield r
+    finally:
+        for f in runs:
+            f.close()
+
+
+def external_sort_file(
+    src: str,
+    dst: str,
+    key: Callable[[str], Any] | None = None,
+    reverse: bool = False,
+    chunk_size: int = 100_000,
+    max_fan_in: int = 64,
+    tmp_dir: str | None = None,
+    encoding: str = "utf-8",
+):
+    """
+    Sorts the lines of the text file at path *src* into the file at path
+    *dst*, using `external_sort`.
+
+    Line endings are not taken into account when comparing lines, and every
+    line of *dst* ends with a newline.
+
+    Parameters
+    ----------
+    src
+    dst
+    key
+        See `external_sort`.
+    reverse
+        See `external_sort`.
+    chunk_size
+        See `external_sort`.
+    max_fan_in
+        See `external_sort`.
+    tmp_dir
+        See `external_sort`.
+    encoding
+        (Optional) The encoding of *src* and *dst*.
+
+        Defaults to `"utf-8"`.
+    """
+    with open(src, encoding=encoding) as fin, open(dst, "w", encoding=encoding) as fout:
+        lines = (line.rstrip("\n") for line in fin)
+        for line in external_sort(lines, key, reverse, chunk_size, max_fan_in, tmp_dir):
+            fout.write(line)
+            fout.write("\n")
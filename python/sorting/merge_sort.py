@@ -1,5 +1,8 @@
+from collections.abc import Callable
 from typing import Any
 
+from sorting._merge_passes import merge_passes, natural_runs
+
 
 def merge_sort_rec(xs: list[Any]) -> list[Any]:
     """
@@ -45,3 +48,50 @@ def merge_sort_rec(xs: list[Any]) -> list[Any]:
         i += 1
 
     return xs
+
+
+def merge_sort_iter(
+    xs: list[Any],
+    key: Callable[[Any], Any] | None = None,
+    reverse: bool = False,
+    natural: bool = False,
+) -> list[Any]:
+    """
+    Sorts *xs* (in-place) using bottom-up merge sort.
+
+    Runs are merged pairwise, level by level, back and forth between *xs*
+    and a single auxiliary buffer, so there is no recursion and no allocation
+    per merge. The sort is stable.
+
+    Parameters
+    ----------
+    xs
+        A list of orderable elements (or elements with orderable keys).
+    key
+        (Optional) A function computing the key to compare elements by.
+        It is called once per element.
+
+        Defaults to `None`, meaning elements are compared directly.
+    reverse
+        (Optional) Whether to sort in descending order.
+
+        Defaults to `False`.
+    natural
+        (Optional) Whether to start from the runs already in order in *xs*
+        (as TimSort does) rather than from runs of one element.
+        Already sorted (or reverse sorted) input is then sorted in `O(n)`.
+
+        Defaults to `False`.
+    """
+    n = len(xs)
+    if n < 2:
+        return xs
+
+    # When there is a key function, the keys are sorted and the elements
+    # follow them.
+    ks = xs if key is None else [key(x) for x in xs]
+    vs = None if key is None else xs
+    bounds = natural_runs(ks, vs, reverse) if natural else None
+    merge_passes(ks, vs, bounds, reverse)
+
+    return xs
@@ -0,0 +1,174 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from sorting._merge_passes import merge_passes
+from sorting.merge_sort import merge_sort_iter
+
+
+def _sort_part(
+    part: list[Any], key: Callable[[Any], Any] | None, reverse: bool
+) -> tuple[list[Any], list[Any] | None]:
+    """
+    Sorts *part* in a worker process.
+
+    Returns the sorted part, and the sorted keys of its elements if *key*
+    is given (so that they are not computed again when merging parts).
+    """
+    if key is None:
+        return merge_sort_iter(part, reverse=reverse), None
+
+    ks = [key(x) for x in part]
+    merge_passes(ks, part, None, reverse)
+    return part, ks
+
+
+def _sort_shared_part(name: str, dtype: str, n: int, start: int, end: int):
+    """
+    Sorts (in-place) the range `[start, end)` of the array of *n* elements
+    of type *dtype* living in the shared memory block *name*.
+    """
+    shm = SharedMemory(name=name)
+    try:
+        arr = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+        arr[start:end].sort(kind="stable")
+        del arr
+    finally:
+        shm.close()
+
+
+def _part_bounds(n: int, n_parts: int) -> list[int]:
+    """
+    Returns the bounds (from `0` to *n*) of *n_parts* ranges of about the
+    same size.
+    """
+    return [i * n // n_parts for i in range(n_parts + 1)]
+
+
+def _parallel_sort_array(xs: np.ndarray, reverse: bool, workers: int):
+    n = len(xs)
+    bounds = _part_bounds(n, workers)
+    # The array is copied once into shared memory, rather than being
+    # pickled to and from each worker.
+    shm = SharedMemory(create=True, size=xs.nbytes)
+    try:
+        arr = np.ndarray((n,), dtype=xs.dtype, buffer=shm.buf)
+        arr[:] = xs
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sort_shared_part, shm.name, xs.dtype.str, n, lo, hi)
+                for lo, hi in zip(bounds, bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+
+        # NumPy's stable sort is a TimSort (or a radix sort for small
+        # integers), which merges the sorted parts in linear time per level.
+        arr.sort(kind="stable")
+        xs[:] = arr[::-1] if reverse else arr
+        del arr
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _parallel_sort_list(
+    xs: list[Any],
+    key: Callable[[Any], Any] | None,
+    reverse: bool,
+    workers: int,
+):
+    n = len(xs)
+    bounds = _part_bounds(n, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_sort_part, xs[lo:hi], key, reverse)
+            for lo, hi in zip(bounds, bounds[1:])
+        ]
+        results = [future.result() for future in futures]
+
+    ks: list[Any] = []
+    vs: list[Any] | None = None if key is None else []
+    for part, part_ks in results:
+        if key is None:
+            ks.extend(part)
+        else:
+            ks.extend(part_ks)  # type: ignore
+            vs.extend(part)  # type: ignore
+    merge_passes(ks, vs, bounds, reverse)
+    xs[:] = ks if vs is None else vs
+
+
+def parallel_merge_sort(
+    xs: list[Any] | np.ndarray,
+    key: Callable[[Any], Any] | None = None,
+    reverse: bool = False,
+    workers: int | None = None,
+    threshold: int = 100_000,
+) -> list[Any] | np.ndarray:
+    """
+    Sorts *xs* (in-place) using a parallel merge sort.
+
+    *xs* is split into one part per worker, the parts are sorted in parallel
+    in a pool of processes, and the sorted parts are then merged. The sort
+    is stable.
+
+    Lists are sent to and from the workers by pickling, so their elements
+    (and *key*) must be picklable. Numeric NumPy arrays are instead shared
+    with the workers through a shared memory block.
+
+    Parameters
+    ----------
+    xs
+        A list of orderable elements (or elements with orderable keys),
+        or a 1-D NumPy array of numbers.
+    key
+        (Optional) A function computing the key to compare elements by.
+        It is called once per element. Not supported for NumPy arrays.
+
+        Defaults to `None`, meaning elements are compared directly.
+    reverse
+        (Optional) Whether to sort in descending order.
+
+        Defaults to `False`.
+    workers
+        (Optional) The number of worker processes.
+
+        Defaults to `None`, meaning the number of CPUs.
+    threshold
+        (Optional) The length of *xs* under which it is sorted in this
+        process, as starting workers would cost more than it saves.
+
+        Defaults to `100_000`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers should be at least 1")
+
+    # Each worker gets at least one element.
+    serial = len(xs) < max(threshold, workers) or workers == 1
+
+    if isinstance(xs, np.ndarray):
+        if key is not None:
+            raise TypeError("key is not supported for NumPy arrays")
+        if xs.ndim != 1 or xs.dtype.kind not in "biuf":
+            raise TypeError("only 1-D arrays of numbers are supported")
+
+        if serial:
+            xs.sort(kind="stable")
+            if reverse:
+                xs[:] = xs[::-1]
+        else:
+            _parallel_sort_array(xs, reverse, workers)
+        return xs
+
+    if serial:
+        return merge_sort_iter(xs, key=key, reverse=reverse)
+
+    _parallel_sort_list(xs, key, reverse, workers)
+    return xs
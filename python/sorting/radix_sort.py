@@ -0,0 +1,184 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from lists.array_list import ArrayList
+from sorting.merge_sort import merge_sort_iter
+
+# Buckets at most this long are sorted with merge sort by `msd_radix_sort`.
+_MSD_CUTOFF = 32
+
+
+def _write_back(xs: list[Any] | ArrayList[Any], vs: list[Any]):
+    """
+    Overwrites the elements of *xs* with *vs*, of the same length.
+    """
+    if isinstance(xs, ArrayList):
+        # `np.fromiter` (unlike `np.array`) never treats sequences as
+        # extra dimensions.
+        xs.to_numpy()[:] = np.fromiter(vs, dtype=xs.dtype, count=len(vs))
+    else:
+        xs[:] = vs
+
+
+def _sort_ints_in_place(
+    xs: list[int] | ArrayList[int] | np.ndarray,
+    sort: Callable[[np.ndarray], np.ndarray],
+):
+    """
+    Sorts (in-place) the integers of *xs* with *sort*, which takes a 1-D
+    NumPy array of integers and returns it sorted.
+    """
+    if isinstance(xs, ArrayList):
+        view = xs.to_numpy()
+        if view.dtype.kind in "iu":
+            view[:] = sort(view)
+        else:
+            # Stores Python integers back, not NumPy scalars.
+            view[:] = sort(np.asarray(view.tolist(), dtype=np.int64)).astype(object)
+    elif isinstance(xs, np.ndarray):
+        if xs.dtype.kind not in "iu":
+            raise TypeError("only arrays of integers are supported")
+        xs[:] = sort(xs)
+    else:
+        xs[:] = sort(np.asarray(xs, dtype=np.int64)).tolist()
+
+
+def _lsd_radix_sort_array(arr: np.ndarray) -> np.ndarray:
+    n_bits = arr.dtype.itemsize * 8
+    utype = np.dtype(f"u{arr.dtype.itemsize}")
+    # Flipping the sign bit maps signed integers to unsigned ones in
+    # the same order.
+    bias = utype.type(1 << (n_bits - 1)) if arr.dtype.kind == "i" else utype.type(0)
+    us = arr.view(utype) ^ bias
+
+    for shift in range(0, n_bits, 8):
+        digits = ((us >> utype.type(shift)) & utype.type(0xFF)).astype(np.uint8)
+        # Skip passes where all the elements have the same digit, as for the
+        # high bytes of small integers.
+        if len(digits) == 0 or digits.min() == digits.max():
+            continue
+        # A stable sort of bytes is a counting sort in NumPy.
+        us = us[np.argsort(digits, kind="stable")]
+
+    return (us ^ bias).view(arr.dtype)
+
+
+def lsd_radix_sort(
+    xs: list[int] | ArrayList[int] | np.ndarray,
+) -> list[int] | ArrayList[int] | np.ndarray:
+    """
+    Sorts *xs* (in-place) using least significant digit radix sort,
+    with digits of one byte.
+
+    Each pass is a stable counting sort on one byte of the elements, run
+    vectorized over a NumPy array. Passes on bytes shared by all the elements
+    are skipped.
+
+    Parameters
+    ----------
+    xs
+        A list, an `ArrayList` or a 1-D NumPy array of integers, which must
+        fit in 64 bits (or in the width of the array's dtype).
+    """
+    _sort_ints_in_place(xs, _lsd_radix_sort_array)
+    return xs
+
+
+def _counting_sort_array(arr: np.ndarray) -> np.ndarray:
+    if len(arr) == 0:
+        return arr
+    lo = arr.min()
+    counts = np.bincount((arr - lo).astype(np.intp))
+    return np.repeat(np.arange(len(counts), dtype=arr.dtype) + lo, counts)
+
+
+def counting_sort(
+    xs: list[Any] | ArrayList[Any] | np.ndarray,
+    key: Callable[[Any], int] | None = None,
+) -> list[Any] | ArrayList[Any] | np.ndarray:
+    """
+    Sorts *xs* (in-place) using counting sort.
+
+    This takes `O(n + k)` time and `O(k)` extra memory, where `k` is the
+    size of the range of the keys, so it is meant for small ranges.
+    The sort is stable.
+
+    Parameters
+    ----------
+    xs
+        A list, an `ArrayList` or a 1-D NumPy array of integers, or of any
+        elements if *key* is given.
+    key
+        (Optional) A function mapping elements to integer keys.
+        It is called once per element.
+
+        Defaults to `None`, meaning the elements are the keys, in which case
+        the counting is vectorized.
+    """
+    if key is None:
+        _sort_ints_in_place(xs, _counting_sort_array)
+        return xs
+
+    vs = xs.to_python_list() if isinstance(xs, ArrayList) else list(xs)
+    n = len(vs)
+    if n == 0:
+        return xs
+    ks = [key(v) for v in vs]
+    lo = min(ks)
+
+    counts = np.bincount(np.asarray(ks, dtype=np.int64) - lo)
+    # Index where to put the next element with a given key.
+    nxt = [0] + np.cumsum(counts)[:-1].tolist()
+    sorted_vs: list[Any] = [None] * n
+    for v, k in zip(vs, ks):
+        sorted_vs[nxt[k - lo]] = v
+        nxt[k - lo] += 1
+
+    _write_back(xs, sorted_vs)
+    return xs
+
+
+def msd_radix_sort(
+    xs: list[bytes] | ArrayList[bytes],
+) -> list[bytes] | ArrayList[bytes]:
+    """
+    Sorts *xs* (in-place) using most significant digit radix sort,
+    with digits of one byte.
+
+    The elements are distributed in buckets by their first byte, then each
+    bucket by the second byte, and so on, so that only the distinguishing
+    prefixes of the elements are looked at. Small buckets are sorted with
+    merge sort. The sort is stable.
+
+    Parameters
+    ----------
+    xs
+        A list or an `ArrayList` of byte strings (`bytes` or `bytearray`).
+    """
+    vs = xs.to_python_list() if isinstance(xs, ArrayList) else list(xs)
+
+    sorted_vs: list[bytes] = []
+    # Buckets to sort, along with the length of the prefix shared by their
+    # elements. The last bucket pushed is the first in order.
+    pending: list[tuple[list[bytes], int]] = [(vs, 0)]
+    while pending:
+        bucket, d = pending.pop()
+        if len(bucket) <= _MSD_CUTOFF:
+            sorted_vs.extend(merge_sort_iter(bucket))
+            continue
+
+        buckets: list[list[bytes]] = [[] for _ in range(256)]
+        for v in bucket:
+            if len(v) == d:
+                # A prefix of all the others, so it comes first.
+                sorted_vs.append(v)
+            else:
+                buckets[v[d]].append(v)
+        for b in reversed(buckets):
+            if b:
+                pending.append((b, d + 1))
+
+    _write_back(xs, sorted_vs)
+    return xs
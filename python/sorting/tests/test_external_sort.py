@@ -0,0 +1,97 @@
+import importlib
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import sorting
+
+
+class TestExternalSort(unittest.TestCase):
+    def test_external_sort(self):
+        rng = random.Random(0)
+        test_cases = [
+            [],
+            [0],
+            list(range(100)),
+            list(range(100, 0, -1)),
+            [rng.randint(0, 1000) for _ in range(1000)],
+        ]
+
+        for xs in test_cases:
+            for chunk_size, max_fan_in in [(1000, 64), (100, 64), (7, 2), (1, 3)]:
+                for reverse in [False, True]:
+                    self.assertListEqual(
+                        list(
+                            sorting.external_sort(
+                                iter(xs),
+                                reverse=reverse,
+                                chunk_size=chunk_size,
+                                max_fan_in=max_fan_in,
+                            )
+                        ),
+                        sorted(xs, reverse=reverse),
+                    )
+
+    def test_external_sort_is_stable(self):
+        rng = random.Random(0)
+        xs = [(rng.randint(0, 10), i) for i in range(500)]
+
+        def key(x):
+            return x[0]
+
+        for reverse in [False, True]:
+            self.assertListEqual(
+                list(
+                    sorting.external_sort(
+                        xs, key=key, reverse=reverse, chunk_size=16, max_fan_in=4
+                    )
+                ),
+                sorted(xs, key=key, reverse=reverse),
+            )
+
+    def test_external_sort_closes_runs_on_error(self):
+        module = importlib.import_module("sorting.external_sort")
+        spill = module._spill
+        files = []
+
+        def failing_spill(entries, tmp_dir):
+            # 8 runs are spilled, then the first merge pass fails on its
+            # third run.
+            if len(files) == 10:
+                raise OSError("No space left on device")
+            f = spill(entries, tmp_dir)
+            files.append(f)
+            return f
+
+        with mock.patch.object(module, "_spill", failing_spill):
+            with self.assertRaises(OSError):
+                list(sorting.external_sort(range(8), chunk_size=1, max_fan_in=2))
+        self.assertEqual(len(files), 10)
+        self.assertTrue(all(f.closed for f in files))
+
+    def test_external_sort_file(self):
+        rng = random.Random(0)
+        lines = [f"line {rng.randint(0, 1000)}" for _ in range(1000)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = os.path.join(tmp_dir, "src.txt")
+            dst = os.path.join(tmp_dir, "dst.txt")
+            with open(src, "w") as f:
+                # No newline at the end of the last line.
+                f.write("\n".join(lines))
+
+            sorting.external_sort_file(src, dst, chunk_size=100, tmp_dir=tmp_dir)
+
+            with open(dst) as f:
+                self.assertListEqual(f.read().splitlines(), sorted(lines))
+            self.assertListEqual(sorted(os.listdir(tmp_dir)), ["dst.txt", "src.txt"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
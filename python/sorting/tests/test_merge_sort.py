@@ -1,3 +1,4 @@
+import random
 import unittest
 
 import sorting
@@ -23,6 +24,47 @@ class TestMergeSort(unittest.TestCase):
         for input, expected_output in test_cases:
             self.assertListEqual(sorting.merge_sort_rec(input), expected_output)
 
+    def test_merge_sort_iter_on_integers(self):
+        test_cases = [
+            ([], []),
+            ([0], [0]),
+            ([0, 1, 2, 3], [0, 1, 2, 3]),
+            ([3, 2, 1, 0], [0, 1, 2, 3]),
+            ([16, 0, 4, 2, 8, 5, 3, 1], [0, 1, 2, 3, 4, 5, 8, 16]),
+            ([16, 0, 4, 2, 8, 5, 3], [0, 2, 3, 4, 5, 8, 16]),
+            # pre-sorted runs
+            ([0, 2, 4, 6, 1, 3, 5, 7, 9, 8], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
+        ]
+
+        for natural in [False, True]:
+            for input, expected_output in test_cases:
+                self.assertListEqual(
+                    sorting.merge_sort_iter(list(input), natural=natural),
+                    expected_output,
+                )
+                self.assertListEqual(
+                    sorting.merge_sort_iter(list(input), reverse=True, natural=natural),
+                    expected_output[::-1],
+                )
+
+    def test_merge_sort_iter_is_stable(self):
+        rng = random.Random(0)
+        xs = [(rng.randint(0, 10), i) for i in range(1000)]
+        xs[100:400] = sorted(xs[100:400])
+        xs[500:800] = sorted(xs[500:800], reverse=True)
+
+        def key(x):
+            return x[0]
+
+        for natural in [False, True]:
+            for reverse in [False, True]:
+                self.assertListEqual(
+                    sorting.merge_sort_iter(
+                        list(xs), key=key, reverse=reverse, natural=natural
+                    ),
+                    sorted(xs, key=key, reverse=reverse),
+                )
+
 
 def main():
     unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+import numpy as np
+
+import sorting
+
+
+def first(x):
+    return x[0]
+
+
+class TestParallelMergeSort(unittest.TestCase):
+    def test_parallel_merge_sort_on_lists(self):
+        rng = random.Random(0)
+        test_cases = [
+            [],
+            [0],
+            list(range(100)),
+            list(range(100, 0, -1)),
+            [rng.randint(0, 1000) for _ in range(1001)],
+        ]
+
+        for xs in test_cases:
+            for threshold in [0, 10_000]:
+                for reverse in [False, True]:
+                    self.assertListEqual(
+                        sorting.parallel_merge_sort(
+                            list(xs), reverse=reverse, workers=3, threshold=threshold
+                        ),
+                        sorted(xs, reverse=reverse),
+                    )
+
+    def test_parallel_merge_sort_is_stable(self):
+        rng = random.Random(0)
+        xs = [(rng.randint(0, 10), i) for i in range(1000)]
+
+        for reverse in [False, True]:
+            self.assertListEqual(
+                sorting.parallel_merge_sort(
+                    list(xs), key=first, reverse=reverse, workers=3, threshold=0
+                ),
+                sorted(xs, key=first, reverse=reverse),
+            )
+
+    def test_parallel_merge_sort_on_arrays(self):
+        rng = np.random.default_rng(0)
+        test_cases = [
+            np.array([], dtype=np.int64),
+            rng.integers(0, 1000, size=1001),
+            rng.random(1001),
+        ]
+
+        for xs in test_cases:
+            for threshold in [0, 10_000]:
+                for reverse in [False, True]:
+                    expected = np.sort(xs)
+                    if reverse:
+                        expected = expected[::-1]
+                    arr = xs.copy()
+                    sorting.parallel_merge_sort(
+                        arr, reverse=reverse, workers=3, threshold=threshold
+                    )
+                    self.assertTrue(np.array_equal(arr, expected))
+
+        self.assertRaises(
+            TypeError,
+            lambda: sorting.parallel_merge_sort(np.array(["a"]), threshold=0),
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
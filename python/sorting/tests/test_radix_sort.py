@@ -0,0 +1,99 @@
+import random
+import unittest
+
+import numpy as np
+
+import sorting
+from lists import ArrayList
+
+
+class TestRadixSort(unittest.TestCase):
+    def test_lsd_radix_sort(self):
+        rng = random.Random(0)
+        test_cases = [
+            [],
+            [0],
+            [3, 2, 1, 0],
+            [-(2**63), 2**63 - 1, -1, 0, 1, 256, -256],
+            [rng.randint(-(2**40), 2**40) for _ in range(1000)],
+        ]
+
+        for xs in test_cases:
+            self.assertListEqual(sorting.lsd_radix_sort(list(xs)), sorted(xs))
+            self.assertEqual(
+                sorting.lsd_radix_sort(ArrayList(xs)), ArrayList(sorted(xs))
+            )
+            self.assertEqual(
+                sorting.lsd_radix_sort(ArrayList(xs, dtype=np.int64)),
+                ArrayList(sorted(xs)),
+            )
+            arr = np.array(xs, dtype=np.int64)
+            sorting.lsd_radix_sort(arr)
+            self.assertListEqual(arr.tolist(), sorted(xs))
+
+        arr = np.array([2**64 - 1, 0, 2**63], dtype=np.uint64)
+        sorting.lsd_radix_sort(arr)
+        self.assertListEqual(arr.tolist(), [0, 2**63, 2**64 - 1])
+
+        self.assertRaises(TypeError, lambda: sorting.lsd_radix_sort(np.zeros(2)))
+
+    def test_counting_sort(self):
+        rng = random.Random(0)
+        test_cases = [
+            [],
+            [0],
+            [3, 2, 1, 0],
+            [rng.randint(-10, 10) for _ in range(1000)],
+        ]
+
+        for xs in test_cases:
+            self.assertListEqual(sorting.counting_sort(list(xs)), sorted(xs))
+            self.assertEqual(
+                sorting.counting_sort(ArrayList(xs, dtype=np.int16)),
+                ArrayList(sorted(xs)),
+            )
+
+        xs = [(rng.randint(0, 10), i) for i in range(1000)]
+
+        def key(x):
+            return x[0]
+
+        self.assertListEqual(
+            sorting.counting_sort(list(xs), key=key), sorted(xs, key=key)
+        )
+        self.assertEqual(
+            sorting.counting_sort(ArrayList(xs), key=key),
+            ArrayList(sorted(xs, key=key)),
+        )
+
+    def test_msd_radix_sort(self):
+        rng = random.Random(0)
+        test_cases = [
+            [],
+            [b""],
+            [b"b", b"a", b"", b"ab", b"ba", b"aa"],
+            [
+                bytes(rng.randint(0, 3) for _ in range(rng.randint(0, 8)))
+                for _ in range(1000)
+            ],
+        ]
+
+        for xs in test_cases:
+            self.assertListEqual(sorting.msd_radix_sort(list(xs)), sorted(xs))
+            self.assertEqual(
+                sorting.msd_radix_sort(ArrayList(xs)), ArrayList(sorted(xs))
+            )
+
+        xs = [b"pear", b"apple", b"fig"]
+        self.assertListEqual(
+            sorting.msd_radix_sort(ArrayList(xs, dtype="S8")).to_python_list(),
+            sorted(xs),
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ class Item(Generic[K, Number]):
     priority
     """
 
+    __slots__ = ("_k", "_p")
+
     def __init__(self, k: K, p: Number):
         self._k: K = k
         self._p: Number = p
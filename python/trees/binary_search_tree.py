@@ -23,6 +23,8 @@ class BSTNode[T]:
         Defaults to `None`.
     """
 
+    __slots__ = ("_k", "_left", "_right")
+
     def __init__(
         self,
         k: T,
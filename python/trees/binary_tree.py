@@ -32,6 +32,8 @@ class BTNode[T]:
         Defaults to `None`.
     """
 
+    __slots__ = ("_k", "_left", "_right")
+
     def __init__(
         self,
         k: T,
@@ -34,6 +34,8 @@ class RBTNode[T]:
         Defaults to `None`.
     """
 
+    __slots__ = ("_k", "_red", "_left", "_right", "_parent")
+
     def __init__(
         self,
         k: T,
@@ -43,7 +45,9 @@ class RBTNode[T]:
         parent: "RBTNode[T] | None" = None,
     ):
         self._k = k
-        self._c = c
+        # The color is stored as a bool, which is cheaper to test than
+        # comparing enum members.
+        self._red = c == Color.RED
         self._left = left
         self._right = right
         self._parent = parent
@@ -54,7 +58,7 @@ class RBTNode[T]:
 
     @property
     def c(self) -> Color:
-        return self._c
+        return Color.RED if self._red else Color.BLACK
 
     @property
     def left(self) -> "RBTNode[T] | None":
@@ -337,18 +341,18 @@ class RBTree[T]:
         # Rotate and recolor to maintain red-black tree invariants.
         while p is not None:
             # Parent is black, so nothing to do.
-            if p._c == Color.BLACK:
+            if not p._red:
                 break
 
             # Parent is root and red, so just repaint it in black.
             gp = p._parent
             if gp is None:
-                p._c = Color.BLACK
+                p._red = False
                 break
 
             # Parent is red and uncle is black (or None).
             u = gp._left if p == gp._right else gp._right
-            if u is None or u._c == Color.BLACK:
+            if u is None or not u._red:
                 # Rotate so as to make `n` an outer child of `gp`.
                 if p == gp._left and n == p._right:
                     self._left_rotate(p)
@@ -365,17 +369,17 @@ class RBTree[T]:
                     self._right_rotate(gp)
                 else:
                     self._left_rotate(gp)
-                p._c = Color.BLACK  # type: ignore
-                gp._c = Color.RED
+                p._red = False  # type: ignore
+                gp._red = True
                 break
 
             # Parent is red and uncle is red.
             # Repaint parent and uncle in black and grandparent in red,
             # but that may introduce violations from the grandparent up,
             # so continue the loop
-            p._c = Color.BLACK
-            u._c = Color.BLACK
-            gp._c = Color.RED
+            p._red = False
+            u._red = False
+            gp._red = True
             n = gp
             p = n._parent
 
@@ -511,7 +515,7 @@ class RBTree[T]:
             if p is None:
                 self._root = None
             # When the deleted node has no children (both NIL), and is red, simply remove the leaf node.
-            elif n._c == Color.RED:
+            elif n._red:
                 if p._left == n:
                     p._left = None
                 else:
@@ -546,13 +550,13 @@ class RBTree[T]:
                     #   s is red
                     #   cn is black
                     #   dn is black
-                    if s._c == Color.RED:
+                    if s._red:
                         if is_left:
                             self._left_rotate(p)
                         else:
                             self._right_rotate(p)
-                        p._c = Color.RED
-                        s._c = Color.BLACK
+                        p._red = True
+                        s._red = False
 
                         s = cn
                         assert s is not None
@@ -563,26 +567,26 @@ class RBTree[T]:
                             cn = s._right
                             dn = s._left
 
-                        if dn is not None and dn._c == Color.RED:
+                        if dn is not None and dn._red:
                             # Now dn is red and s is black, which corresponds to case 2,
                             # which we copy past here.
                             if is_left:
                                 self._left_rotate(p)
                             else:
                                 self._right_rotate(p)
-                            s._c = p._c
-                            p._c = Color.BLACK
-                            dn._c = Color.BLACK
+                            s._red = p._red
+                            p._red = False
+                            dn._red = False
                             break
-                        elif cn is not None and cn._c == Color.RED:
+                        elif cn is not None and cn._red:
                             # Now cn is red and s is black, which corresponds to case 3,
                             # which we copy past here.
                             if is_left:
                                 self._right_rotate(s)
                             else:
                                 self._left_rotate(s)
-                            s._c = Color.RED
-                            cn._c = Color.BLACK
+                            s._red = True
+                            cn._red = False
                             dn = s
                             s = cn
 
@@ -590,14 +594,14 @@ class RBTree[T]:
                                 self._left_rotate(p)
                             else:
                                 self._right_rotate(p)
-                            s._c = p._c
-                            p._c = Color.BLACK
-                            dn._c = Color.BLACK
+                            s._red = p._red
+                            p._red = False
+                            dn._red = False
                             break
                         else:
                             # Otherwise cn and dn are black, which corresponds to case 4.
-                            s._c = Color.RED
-                            p._c = Color.BLACK
+                            s._red = True
+                            p._red = False
                             break
 
                     # Case 2
@@ -607,14 +611,14 @@ class RBTree[T]:
                     #   p is not None
                     #   s is black
                     #   dn is red
-                    elif dn is not None and dn._c == Color.RED:
+                    elif dn is not None and dn._red:
                         if is_left:
                             self._left_rotate(p)
                         else:
                             self._right_rotate(p)
-                        s._c = p._c
-                        p._c = Color.BLACK
-                        dn._c = Color.BLACK
+                        s._red = p._red
+                        p._red = False
+                        dn._red = False
                         break
 
                     # Case 3
@@ -625,13 +629,13 @@ class RBTree[T]:
                     #   s is black
                     #   cn is red
                     #   dn is black
-                    elif cn is not None and cn._c == Color.RED:
+                    elif cn is not None and cn._red:
                         if is_left:
                             self._right_rotate(s)
                         else:
                             self._left_rotate(s)
-                        s._c = Color.RED
-                        cn._c = Color.BLACK
+                        s._red = True
+                        cn._red = False
                         dn = s
                         s = cn
 
@@ -641,9 +645,9 @@ class RBTree[T]:
                             self._left_rotate(p)
                         else:
                             self._right_rotate(p)
-                        s._c = p._c
-                        p._c = Color.BLACK
-                        dn._c = Color.BLACK
+                        s._red = p._red
+                        p._red = False
+                        dn._red = False
                         break
 
                     # Case 4
@@ -654,12 +658,12 @@ class RBTree[T]:
                     #   s is black
                     #   cn is black
                     #   dn is black
-                    elif p._c == Color.RED:
-                        s._c = Color.RED
-                        p._c = Color.BLACK
+                    elif p._red:
+                        s._red = True
+                        p._red = False
                         break
 
-                    s._c = Color.RED
+                    s._red = True
                     n = p
                     p = n._parent
                     if p is not None:
@@ -695,7 +699,7 @@ class RBTree[T]:
                     p._left = n._left
                 else:
                     p._right = n._left
-            n._left._c = Color.BLACK
+            n._left._red = False
             n._left._parent = p
         elif n._right is not None:
             if p is None:
@@ -705,7 +709,7 @@ class RBTree[T]:
                     p._left = n._right
                 else:
                     p._right = n._right
-            n._right._c = Color.BLACK
+            n._right._red = False
             n._right._parent = p
 
         return True
@@ -14,6 +14,13 @@ class TestRBTree(unittest.TestCase):
         self.assertEqual(rbt.size, 0)
         self.assertEqual(rbt.height, -1)
 
+    def test_node(self):
+        for c in [Color.RED, Color.BLACK]:
+            node = RBTNode(1, c)
+            self.assertEqual(node.c, c)
+            # Nodes have no `__dict__`, to save memory.
+            self.assertFalse(hasattr(node, "__dict__"))
+
     def test_size(self):
         rbt1 = RBTree()
         rbt2 = RBTree([10])
@@ -16,6 +16,8 @@ class LCRSNode[T]:
         The right sibling.
     """
 
+    __slots__ = ("k", "left", "right")
+
     def __init__(
         self,
         k: T,